@@ -3,14 +3,28 @@
 """
 FastAPI tabanlı REST API:
 
-- GET  /health  -> Sağlık kontrolü
-- POST /predict -> JSON input ile kredi riski tahmini
+- GET  /health         -> Sağlık kontrolü (liveness)
+- GET  /ready          -> Başlangıç ısınması bittiyse 200, yoksa 503 (readiness)
+- POST /predict        -> JSON input ile kredi riski tahmini
+- POST /predict/stream -> Büyük istekler: parça parça skorlanıp NDJSON akışı
+- POST /predict/file   -> CSV yükleme (opsiyonel gzip) -> skorlanmış CSV akışı
+- POST /jobs           -> Asenkron batch job (dosya yükleme veya sunucudaki yol)
+- GET  /jobs/{id}      -> Job durumu / ilerleme; /jobs/{id}/result -> sonuç dosyası
+- GET  /batching/stats -> Micro-batching metrikleri
+- GET  /metrics        -> Prometheus formatında metrikler (bkz. src.metrics)
+- GET  /profile        -> Aşama profili (CREDIT_RISK_PROFILE=1 ile; bkz. src.profiling)
 
 Çalıştırmak için:
     uvicorn app.api:app --reload
 
 Not:
 - Tahmin için src.inference.predict_from_raw fonksiyonu kullanılır.
+- /predict asenkrondur: eşzamanlı istekler src.batching.MicroBatcher ile
+  tek bir vektörel batch'te birleştirilip skorlanır (BATCH_MAX_SIZE satır /
+  BATCH_MAX_WAIT_MS). Her istek kendi dilimini alır; sonuç isteği tek başına
+  predict_from_raw ile skorlamakla birebir aynıdır.
+- Tek kayıtlık tekil isteklerde pandas'sız hızlı yol (src.scorer.predict_record)
+  kullanılır.
 - Input formatı (örnek):
     {
         "records": [
@@ -23,22 +37,138 @@ Not:
             ...
         ]
     }
+  veya toplu çağıranlar için kolon bazlı (her Kaggle kolonu için bir dizi,
+  eksik değer null; bkz. src.payloads):
+    {
+        "columns": {
+            "RevolvingUtilizationOfUnsecuredLines": [0.12, 0.85],
+            "age": [45, 31],
+            "MonthlyIncome": [5000, null],
+            ...
+        }
+    }
+- Binary formatlar: Content-Type / Accept olarak
+  application/vnd.apache.arrow.stream (Arrow IPC) veya application/msgpack
+  gönderilebilir; varsayılan JSON'dur (bkz. src.payloads).
 """
 
-from typing import List, Dict, Any
+import asyncio
+import json
+import os
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional
+
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
+
+from src.batching import BATCH_SIZE_BUCKETS, MicroBatcher
+from src.config import FILE_CHUNK_SIZE, STREAM_CHUNK_SIZE
+from src.data_io import ChunkReader
+from src.inference import csv_dtypes, iter_predict_file, iter_predict_raw
+from src.jobs import DONE, JobManager
+from src.metrics import (
+    COLD_START,
+    CONTENT_TYPE,
+    IN_FLIGHT,
+    REGISTRY,
+    REQUEST_LATENCY,
+    READY,
+    REQUESTS,
+    SLO,
+    STAGE_LATENCY,
+    batcher_collector,
+    model_collector,
+)
+from src.payloads import (
+    ARROW_STREAM,
+    JSON,
+    MSGPACK,
+    decode_arrow,
+    decode_msgpack,
+    encode_arrow,
+    encode_msgpack,
+    frame_from_columns,
+    media_type,
+)
+from src.predict import get_model_registry
+from src.profiling import GLOBAL_REPORT, PROFILE_ENV, env_enabled
+from src.warmup import warmup
+
+batcher = MicroBatcher()
+jobs = JobManager()
+
+REGISTRY.add_collector(batcher_collector(batcher, BATCH_SIZE_BUCKETS))
+REGISTRY.add_collector(model_collector(get_model_registry()))
+
+
+# Başlangıç ısınmasının durumu (/ready)
+readiness: Dict[str, Any] = {"ready": False, "error": None, "warmup_ms": None}
 
-import pandas as pd
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
 
-from src.inference import predict_from_raw
+async def _warmup() -> None:
+    """Model yükleme + sentetik batch'ler; bitince /ready 200 döner."""
+    try:
+        timings = await run_in_threadpool(warmup)
+    except Exception as e:
+        readiness["error"] = f"{type(e).__name__}: {e}"
+        print(f"[UYARI] Başlangıç ısınması başarısız: {readiness['error']}")
+        return
+
+    for phase, ms in timings.items():
+        COLD_START.set(ms / 1000, phase=phase)
+    readiness.update(ready=True, warmup_ms=timings)
+    READY.set(1)
+    phases = ", ".join(f"{phase} {ms:.1f} ms" for phase, ms in timings.items())
+    print(f"[INFO] Başlangıç ısınması tamamlandı: {phases}")
+
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Restart sonrası sahibi ölmüş / heartbeat'i eskimiş job'lar burada kuyruğa geri alınır
+    jobs.start()
+    # Isınma arka planda: sunucu hemen bağlantı kabul eder (/health), /ready
+    # ısınma bitene kadar 503 döner
+    warmup_task = asyncio.create_task(_warmup())
+    yield
+    warmup_task.cancel()
+    await batcher.close()
+    await run_in_threadpool(jobs.shutdown)
 
-app = FastAPI(title="Credit Risk Scoring API")
+
+app = FastAPI(title="Credit Risk Scoring API", lifespan=lifespan)
+
+
+@app.middleware("http")
+async def track_requests(request: Request, call_next):
+    """İstek sayısı, eşzamanlı istek ve gecikme metrikleri; /predict için SLO."""
+    IN_FLIGHT.inc()
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        IN_FLIGHT.dec()
+        elapsed = time.perf_counter() - start
+        # Etiket olarak route şablonu (/jobs/{job_id}); eşleşmeyen yollar tek etikette
+        route = request.scope.get("route")
+        endpoint = route.path if route is not None else "unmatched"
+        REQUESTS.inc(endpoint=endpoint, method=request.method, status=status)
+        REQUEST_LATENCY.observe(elapsed, endpoint=endpoint)
+        if endpoint == "/predict" and status == 200:
+            SLO.observe(elapsed)
 
 
 class CustomerBatch(BaseModel):
-    records: List[Dict[str, Any]]
+    # İkisinden biri: kayıt bazlı (records) veya kolon bazlı (columns)
+    records: Optional[List[Dict[str, Any]]] = None
+    columns: Optional[Dict[str, List[Optional[float]]]] = None
 
 
 @app.get("/health")
@@ -49,8 +179,136 @@ def health_check():
     return {"status": "ok", "message": "Credit Risk API is running"}
 
 
-@app.post("/predict")
-def predict(batch: CustomerBatch):
+@app.get("/ready")
+def ready_check():
+    """
+    Hazırlık kontrolü (readiness): model yüklenip sentetik ısınma batch'leri
+    skorlanana kadar 503, sonra 200 ve ısınma süreleri döner. Load
+    balancer'lar trafiği buna göre yönlendirmeli; /health sadece process'in
+    ayakta olduğunu söyler.
+    """
+    if not readiness["ready"]:
+        status = "failed" if readiness["error"] else "warming_up"
+        return JSONResponse({"status": status, "error": readiness["error"]}, status_code=503)
+    return {"status": "ready", "warmup_ms": readiness["warmup_ms"]}
+
+
+@app.get("/batching/stats")
+def batching_stats():
+    """
+    Micro-batching metrikleri: istek / batch sayıları, ortalama batch
+    boyutu, kuyruk bekleme süresi ve batch boyutu histogramı.
+    """
+    return batcher.stats()
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """
+    Prometheus metin formatında metrikler: istek sayıları, gecikme ve
+    aşama histogramları, batch boyutu histogramı, model yükleme süresi,
+    eşzamanlı istek sayısı ve TARGET_*_LATENCY_MS hedeflerine göre SLO
+    ihlal sayaçları.
+    """
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
+@app.get("/profile")
+def get_profile(raw: bool = False):
+    """
+    Preprocessing ve model aşamalarının profili (süre, satır, bellek farkı).
+
+    Sadece API CREDIT_RISK_PROFILE=1 ile başlatıldıysa kayıt tutulur.
+    Varsayılan aşama bazında özettir; `raw=true` çağrı başına kayıtları da
+    ekler.
+    """
+    report = {"enabled": env_enabled(), "env": PROFILE_ENV, **GLOBAL_REPORT.to_dict()}
+    if raw:
+        report["records"] = GLOBAL_REPORT.raw()
+    return report
+
+
+@app.delete("/profile")
+def reset_profile():
+    """Biriken profil kayıtlarını siler."""
+    GLOBAL_REPORT.clear()
+    return {"enabled": env_enabled(), "n_records": 0}
+
+
+def _parse_json(body: bytes):
+    """JSON gövdesi -> kayıt listesi veya (columns ise) DataFrame."""
+    try:
+        batch = CustomerBatch.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+    if batch.records is not None and batch.columns is not None:
+        raise HTTPException(
+            status_code=400,
+            detail="`records` ve `columns` birlikte gönderilemez; birini seçin.",
+        )
+
+    if batch.columns is not None:
+        try:
+            return frame_from_columns(batch.columns)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    return batch.records
+
+
+async def _read_payload(request: Request):
+    """İstek gövdesini Content-Type'a göre çözer (JSON, Arrow IPC, msgpack)."""
+    content_type = media_type(request.headers.get("content-type"))
+    body = await request.body()
+
+    if content_type == JSON:
+        return _parse_json(body)
+    try:
+        if content_type == ARROW_STREAM:
+            return decode_arrow(body)
+        return decode_msgpack(body)
+    except ImportError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Gövde çözülemedi: {e}")
+
+
+def _encode_response(request: Request, y_pred, y_proba):
+    """Yanıtı Accept başlığına göre kodlar (varsayılan JSON)."""
+    accept = media_type(request.headers.get("accept"))
+    try:
+        if accept == ARROW_STREAM:
+            return Response(encode_arrow(y_pred, y_proba), media_type=ARROW_STREAM)
+        if accept == MSGPACK:
+            return Response(encode_msgpack(y_pred, y_proba), media_type=MSGPACK)
+    except ImportError as e:
+        raise HTTPException(status_code=406, detail=str(e))
+
+    # Yanıt burada render edilir (serialize aşaması ölçümüne dahil)
+    return JSONResponse(
+        {
+            "n_records": len(y_pred),
+            "predictions": y_pred.tolist(),
+            "probabilities": y_proba.tolist(),
+        }
+    )
+
+
+# Gövde elle çözüldüğü için şema OpenAPI'ye (Swagger) burada verilir
+_PREDICT_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            JSON: {"schema": CustomerBatch.model_json_schema()},
+            ARROW_STREAM: {"schema": {"type": "string", "format": "binary"}},
+            MSGPACK: {"schema": {"type": "string", "format": "binary"}},
+        },
+    }
+}
+
+
+@app.post("/predict", openapi_extra=_PREDICT_REQUEST_BODY)
+async def predict(request: Request):
     """
     Tahmin endpoint'i.
 
@@ -65,28 +323,328 @@ def predict(batch: CustomerBatch):
             }
         ]
     }
+
+    veya kolon bazlı: {"columns": {"age": [45, 31], ...}}
+
+    Content-Type / Accept ile binary formatlar seçilebilir (bkz. src.payloads):
+    - application/vnd.apache.arrow.stream: ham feature tablosu -> Arrow IPC
+      (Predicted_Label int8, Default_Probability float32)
+    - application/msgpack: records / columns map'i -> bytes diziler
     """
-    if not batch.records:
+    with STAGE_LATENCY.time(stage="parse"):
+        payload = await _read_payload(request)
+
+    if payload is None or len(payload) == 0:
         raise HTTPException(
             status_code=400,
             detail="`records` listesi boş. En az bir müşteri kaydı göndermelisiniz.",
         )
 
-    df = pd.DataFrame(batch.records)
-
     try:
-        # Ham Kaggle formatındaki veriyi preprocessing ile işle ve tahmin al
-        y_pred, y_proba = predict_from_raw(df)
+        # Eşzamanlı isteklerle birlikte tek batch'te skorlanır (src.batching)
+        y_pred, y_proba = await batcher.submit(payload)
     except KeyError as e:
         # Örn: df[features] satırında eksik kolon olursa buraya düşer
         raise HTTPException(
             status_code=400,
             detail=f"Beklenen feature kolonları eksik veya hatalı: {e}",
         )
+    except ValueError as e:
+        # Örn: sayısal kolonda sayı olmayan değer
+        raise HTTPException(status_code=400, detail=f"Geçersiz feature değeri: {e}")
+
+    with STAGE_LATENCY.time(stage="serialize"):
+        return _encode_response(request, y_pred, y_proba)
+
+
+def _next_chunk(chunks):
+    """next() sarmalayıcı: StopIteration thread havuzundan geçemediği için None döner."""
+    return next(chunks, None)
 
-    return {
-        "n_records": len(df),
-        "predictions": y_pred.tolist(),
-        "probabilities": y_proba.tolist(),
+
+@app.post("/predict/stream", openapi_extra=_PREDICT_REQUEST_BODY)
+async def predict_stream(request: Request, chunk_size: int = Query(STREAM_CHUNK_SIZE, gt=0)):
+    """
+    Büyük istekler için akışlı tahmin (NDJSON).
+
+    Girdi /predict ile aynıdır (JSON records / columns, Arrow IPC, msgpack).
+    İstek `chunk_size` satırlık parçalar halinde skorlanır ve her parça
+    biter bitmez bir satır gönderilir:
+
+        {"offset": 0, "n_records": 10000, "predictions": [...], "probabilities": [...]}
+        ...
+        {"done": true, "n_records": 25000, "n_chunks": 3, "elapsed_ms": 812.4}
+
+    Sonuçlar sunucuda biriktirilmez; kayıt listelerinde her parçanın tablosu
+    sadece o parçanın kayıtlarından kurulur. Değerler /predict ile birebir
+    aynıdır (state yoksa medyan / quantile tüm istek üzerinden bir kez fit
+    edilir).
+
+    İlk parçadan sonra bir parça hata verirse akış bir hata satırıyla biter
+    (özet satırı gelmez); istemci çıktının eksik olduğunu buradan anlar:
+
+        {"done": false, "error": "...", "offset": 20000, "n_records": 20000}
+    """
+    payload = await _read_payload(request)
+
+    if payload is None or len(payload) == 0:
+        raise HTTPException(
+            status_code=400,
+            detail="`records` listesi boş. En az bir müşteri kaydı göndermelisiniz.",
+        )
+
+    start = time.perf_counter()
+    try:
+        chunks = iter_predict_raw(payload, chunk_size)
+        # İlk parça yanıt başlamadan skorlanır: eksik kolon vb. hatalar 400 döner
+        first = await run_in_threadpool(_next_chunk, chunks)
+    except KeyError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Beklenen feature kolonları eksik veya hatalı: {e}",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Geçersiz feature değeri: {e}")
+
+    async def lines():
+        item, n_records, n_chunks = first, 0, 0
+        while item is not None:
+            offset, y_pred, y_proba = item
+            n_records += len(y_pred)
+            n_chunks += 1
+            yield json.dumps(
+                {
+                    "offset": offset,
+                    "n_records": len(y_pred),
+                    "predictions": y_pred.tolist(),
+                    "probabilities": y_proba.tolist(),
+                }
+            ) + "\n"
+            try:
+                item = await run_in_threadpool(_next_chunk, chunks)
+            except Exception as e:
+                print(f"[UYARI] /predict/stream parça hatası (offset {n_records}): {e!r}")
+                yield json.dumps(
+                    {"done": False, "error": str(e), "offset": n_records, "n_records": n_records}
+                ) + "\n"
+                return
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        yield json.dumps(
+            {"done": True, "n_records": n_records, "n_chunks": n_chunks, "elapsed_ms": elapsed_ms}
+        ) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+# Yükleme diske bu boyutta bloklarla yazılır
+_UPLOAD_BLOCK_BYTES = 1 << 20
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+async def _spool_upload(request: Request, directory: Optional[str] = None) -> str:
+    """
+    Yüklenen dosyayı bloklar halinde geçici bir dosyaya yazar ve yolunu döner.
+
+    multipart/form-data ise `file` alanı, değilse istek gövdesinin kendisi
+    (örn. text/csv) okunur. gzip içerik ilk byte'lardan tanınır ve dosya
+    .csv.gz uzantısıyla bırakılır (ChunkReader açarken çözer). `directory`
+    verilmezse sistemin geçici klasörü kullanılır.
+    """
+    source = None
+    if request.headers.get("content-type", "").startswith("multipart/form-data"):
+        form = await request.form()
+        source = form.get("file")
+        if not hasattr(source, "read"):
+            raise HTTPException(status_code=400, detail="multipart gövdesinde `file` alanı yok.")
+
+    fd, path = tempfile.mkstemp(prefix="credit-risk-upload-", suffix=".csv", dir=directory)
+    head = b""
+    with os.fdopen(fd, "wb") as f:
+        if source is not None:
+            while block := await source.read(_UPLOAD_BLOCK_BYTES):
+                head = head or block[:2]
+                f.write(block)
+        else:
+            async for block in request.stream():
+                head = head or block[:2]
+                f.write(block)
+
+    if not head:
+        os.unlink(path)
+        raise HTTPException(status_code=400, detail="Yüklenen dosya boş.")
+    if head.startswith(_GZIP_MAGIC):
+        os.replace(path, path + ".gz")
+        path += ".gz"
+    return path
+
+
+_FILE_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "text/csv": {"schema": {"type": "string", "format": "binary"}},
+            "application/gzip": {"schema": {"type": "string", "format": "binary"}},
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                    "required": ["file"],
+                }
+            },
+        },
+    }
+}
+
+
+@app.post("/predict/file", openapi_extra=_FILE_REQUEST_BODY)
+async def predict_file(
+    request: Request,
+    raw: bool = Query(True),
+    chunk_size: int = Query(FILE_CHUNK_SIZE, gt=0),
+):
+    """
+    Dosya bazlı tahmin: CSV yükle, skorlanmış CSV'yi akış olarak al.
+
+    Gövde düz CSV (text/csv), gzip'li CSV veya `file` alanlı multipart
+    form olabilir. Dosya diske yazılır, `chunk_size` satırlık parçalar
+    halinde okunup skorlanır ve her parça bitince yanıta eklenir; bellek
+    kullanımı dosya boyutuna değil parça boyutuna bağlıdır.
+
+    Çıktı inference_pipeline ile aynıdır: girdi kolonları + Predicted_Label
+    + Default_Probability. `raw=false` ise girdi hazır feature tablosudur
+    (pipeline.py --input ile aynı). State yoksa medyan / quantile tüm dosya
+    üzerinden fit edilir. Süre ve satır/sn özeti sunucu loguna yazılır.
+    """
+    path = await _spool_upload(request)
+    start = time.perf_counter()
+    reader = ChunkReader(path, chunk_size, dtype=csv_dtypes(raw))
+
+    def cleanup():
+        reader.close()
+        os.unlink(path)
+
+    try:
+        chunks = iter_predict_file(reader, raw=raw)
+        # İlk parça yanıt başlamadan skorlanır: eksik kolon vb. hatalar 400 döner
+        first = await run_in_threadpool(_next_chunk, chunks)
+    except KeyError as e:
+        cleanup()
+        raise HTTPException(
+            status_code=400,
+            detail=f"Beklenen feature kolonları eksik veya hatalı: {e}",
+        )
+    except (ValueError, OSError, EOFError) as e:
+        # pandas parse hataları ValueError, bozuk gzip OSError / EOFError
+        cleanup()
+        raise HTTPException(status_code=400, detail=f"Dosya okunamadı: {e}")
+
+    async def rows():
+        chunk, n_rows, n_chunks = first, 0, 0
+        try:
+            while chunk is not None:
+                yield chunk.to_csv(index=False, header=n_chunks == 0)
+                n_rows += len(chunk)
+                n_chunks += 1
+                chunk = await run_in_threadpool(_next_chunk, chunks)
+        finally:
+            cleanup()
+
+        elapsed = time.perf_counter() - start
+        print(
+            f"/predict/file: {n_rows} satır, {n_chunks} parça, {elapsed:.2f} sn | "
+            f"{n_rows / elapsed if elapsed > 0 else 0.0:,.0f} satır/sn"
+        )
+
+    return StreamingResponse(
+        rows(),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="predictions.csv"'},
+    )
+
+
+class JobRequest(BaseModel):
+    # Sunucudaki girdi dosyası (JOB_INPUT_DIR'e göreli veya onun altında mutlak yol)
+    path: str
+
+
+_JOB_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            JSON: {"schema": JobRequest.model_json_schema()},
+            **_FILE_REQUEST_BODY["requestBody"]["content"],
+        },
     }
+}
+
+
+def _get_job(job_id: str) -> dict:
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job bulunamadı: {job_id}")
+    return job
+
+
+@app.post("/jobs", status_code=202, openapi_extra=_JOB_REQUEST_BODY)
+async def submit_job(
+    request: Request,
+    raw: bool = Query(True),
+    chunk_size: int = Query(FILE_CHUNK_SIZE, gt=0),
+):
+    """
+    Asenkron batch skorlama job'u oluşturur ve hemen döner (202).
+
+    Gövde ya {"path": "portfolio.csv"} (JOB_INPUT_DIR altındaki bir CSV /
+    Parquet dosyası) ya da /predict/file ile aynı dosya yüklemesidir.
+    Dönen `id` ile GET /jobs/{id} üzerinden durum / ilerleme, bitince
+    GET /jobs/{id}/result üzerinden sonuç dosyası alınır.
+    """
+    if JSON in request.headers.get("content-type", ""):
+        try:
+            job_request = JobRequest.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(e.errors())
+        try:
+            input_path = jobs.resolve_input(job_request.path)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return jobs.submit(input_path, raw=raw, chunk_size=chunk_size)
+
+    jobs.start()
+    path = await _spool_upload(request, directory=str(jobs.jobs_dir))
+    return jobs.submit(path, raw=raw, chunk_size=chunk_size, owns_input=True)
+
+
+@app.get("/jobs")
+def list_jobs(status: Optional[str] = None, limit: int = Query(100, gt=0)):
+    """Son job'lar (en yeni önce); `status` ile filtrelenebilir."""
+    return jobs.list(status=status, limit=limit)
+
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    """
+    Job durumu: status (queued / running / done / failed), progress (0-1),
+    n_rows ve bitince rows_per_sec, queue_s, elapsed_s, latency_s.
+    """
+    return _get_job(job_id)
+
+
+@app.get("/jobs/{job_id}/result")
+def get_job_result(job_id: str):
+    """Bitmiş job'un sonuç dosyası (girdi kolonları + Predicted_Label + Default_Probability)."""
+    job = _get_job(job_id)
+    if job["status"] != DONE:
+        raise HTTPException(
+            status_code=409,
+            detail={"message": "Job henüz tamamlanmadı.", "status": job["status"], "error": job["error"]},
+        )
 
+    output_path = job["output_path"]
+    csv = output_path.endswith(".csv")
+    return FileResponse(
+        output_path,
+        media_type="text/csv" if csv else "application/octet-stream",
+        filename=f"{job_id}{os.path.splitext(output_path)[1]}",
+    )
@@ -0,0 +1,58 @@
+# benchmarks/_common.py
+
+"""
+Benchmark script'lerinin ortak yardımcıları.
+
+Script'ler proje kökünden çalıştırılır:
+    python benchmarks/bench_prepare_training.py
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Tuple
+
+import numpy as np
+import pandas as pd
+
+# --- Proje kökünü sys.path'e ekle (src'yi görebilmesi için) ---
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from src.config import DATA_DIR  # noqa: E402
+
+
+def load_raw_sample(n_rows: int) -> pd.DataFrame:
+    """
+    Repodaki ham test portföylerini n_rows satıra ulaşana kadar çoğaltır.
+    """
+    parts = [
+        pd.read_csv(DATA_DIR / f"test_portfolio_{name}.csv")
+        for name in ["low_risk", "mixed", "stressed"]
+    ]
+    base = pd.concat(parts, ignore_index=True)
+    reps = int(np.ceil(n_rows / len(base)))
+    return pd.concat([base] * reps, ignore_index=True).head(n_rows)
+
+
+def measure(fn: Callable[[], object], repeats: int = 3) -> Tuple[float, float]:
+    """
+    fn'i `repeats` kez çalıştırır.
+
+    Dönen:
+        (en iyi süre [ms], tracemalloc tepe bellek [MB])
+    """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return min(timings), peak / 1024**2
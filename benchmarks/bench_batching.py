@@ -0,0 +1,66 @@
+# benchmarks/bench_batching.py
+
+"""
+/predict micro-batching: eşzamanlı tek kayıtlık istekler, batch'siz
+(max_batch_size=1, her istek ayrı skorlanır) vs MicroBatcher.
+
+Her eşzamanlılık seviyesinde istemciler art arda istek gönderir;
+throughput (istek/sn) ve istek gecikmesi p50 / p95 raporlanır.
+
+Kullanım:
+    python benchmarks/bench_batching.py [n_requests]
+"""
+
+import asyncio
+import sys
+import time
+
+import numpy as np
+from _common import load_raw_sample
+
+from src.batching import MicroBatcher
+from src.scorer import predict_record
+
+
+async def _drive(batcher: MicroBatcher, records, concurrency: int):
+    latencies = []
+    queue = list(records)
+
+    async def client():
+        while queue:
+            record = queue.pop()
+            start = time.perf_counter()
+            await batcher.submit([record])
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return len(records) / elapsed, np.percentile(latencies, 50), np.percentile(latencies, 95)
+
+
+def main(n_requests: int = 2000) -> None:
+    df = load_raw_sample(n_requests)
+    records = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+    predict_record(records[0])  # model + compiled scorer yüklensin
+
+    configs = [("batch'siz", 1, 0.0), ("micro-batch", 256, 2.0)]
+    print(f"{'eşzamanlı':>10}{'mod':>14}{'istek/sn':>12}{'p50 (ms)':>10}{'p95 (ms)':>10}{'ort. batch':>12}")
+    for concurrency in [1, 8, 32, 128]:
+        for name, max_batch_size, max_wait_ms in configs:
+            async def run():
+                batcher = MicroBatcher(max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+                try:
+                    return await _drive(batcher, records, concurrency), batcher.stats()
+                finally:
+                    await batcher.close()
+
+            (rps, p50, p95), stats = asyncio.run(run())
+            print(
+                f"{concurrency:>10}{name:>14}{rps:>12,.0f}{p50:>10.2f}{p95:>10.2f}"
+                f"{stats['avg_batch_rows']:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,76 @@
+# benchmarks/bench_binning.py
+
+"""
+Binning + encode: pd.cut / OneHotEncoder (string label) vs
+searchsorted kodları / compiled scorer (kod -> one-hot slotu).
+
+Kullanım:
+    python benchmarks/bench_binning.py [n_rows]
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+from _common import load_raw_sample, measure
+
+from src.data_preprocessing import add_binning_features, clean_basic
+from src.feature_registry import BIN_SPECS, FEATURES
+from src.predict import get_model_registry
+from src.scorer import get_compiled_scorer
+
+
+def _bins_pd_cut(columns):
+    return {
+        col: pd.cut(columns[src], bins=bins, labels=labels, right=right)
+        for col, (src, bins, labels, right) in BIN_SPECS.items()
+    }
+
+
+def _bins_codes(columns):
+    return {col: FEATURES[col].kernel(columns[src]) for col, (src, *_rest) in BIN_SPECS.items()}
+
+
+def main(n_rows: int = 1_000_000) -> None:
+    df = clean_basic(load_raw_sample(n_rows))
+    df["TotalDelinquency"] = FEATURES["TotalDelinquency"].kernel(
+        *[df[c].to_numpy() for c in FEATURES["TotalDelinquency"].inputs]
+    )
+    columns = {c: df[c].to_numpy() for c in df.columns}
+    print(f"[INFO] {len(df)} satır")
+
+    rows = [("binning: pd.cut", *measure(lambda: _bins_pd_cut(columns))),
+            ("binning: searchsorted", *measure(lambda: _bins_codes(columns)))]
+
+    binned = add_binning_features(df)
+    scorer = get_compiled_scorer()
+    ohe = get_model_registry().get()["model"].named_steps["preprocess"].named_transformers_["cat"]
+    bin_cols = list(scorer.cat_cols)
+    as_strings = binned[bin_cols].astype(object)
+
+    n_num = len(scorer.numeric_cols)
+
+    def encode_codes():
+        # Sadece one-hot bloğu (OneHotEncoder çıktısıyla aynı genişlik)
+        out = np.zeros((len(binned), scorer.n_features - n_num), dtype=np.float32)
+        idx = np.arange(len(binned))
+        for col in bin_cols:
+            target = scorer.cat_slots[col][binned[col].cat.codes.to_numpy()]
+            mask = target >= 0
+            out[idx[mask], target[mask] - n_num] = 1.0
+        return out
+
+    rows += [("encode: OneHotEncoder", *measure(lambda: ohe.transform(as_strings))),
+             ("encode: kod -> slot", *measure(encode_codes))]
+
+    print(f"{'adım':<26}{'süre (ms)':>12}{'tepe bellek (MB)':>20}")
+    for name, ms, mb in rows:
+        print(f"{name:<26}{ms:>12.1f}{mb:>20.1f}")
+
+    obj_mb = as_strings.memory_usage(deep=True).sum() / 1024**2
+    code_mb = binned[bin_cols].memory_usage(deep=True).sum() / 1024**2
+    print(f"Bin kolonları bellek: string {obj_mb:.1f} MB | int8 kod {code_mb:.1f} MB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
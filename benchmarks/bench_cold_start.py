@@ -0,0 +1,80 @@
+# benchmarks/bench_cold_start.py
+
+"""
+Deploy sonrası ilk /predict istekleri: ısınma beklenmeden (process açılır
+açılmaz, /health 200 döndüğü anda) vs /ready 200 döndükten sonra.
+
+Her mod için yeni bir uvicorn process'i başlatılır (model paketi process
+başına yüklenir); ilk N tek kayıtlık isteğin gecikmesi raporlanır.
+
+Kullanım:
+    python benchmarks/bench_cold_start.py [n_requests]
+"""
+
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+import numpy as np
+from _common import PROJECT_ROOT, load_raw_sample
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(client: httpx.Client, path: str, timeout: float = 120.0) -> float:
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        try:
+            if client.get(path).status_code == 200:
+                return time.perf_counter() - start
+        except httpx.TransportError:
+            pass
+        time.sleep(0.01)
+    raise TimeoutError(path)
+
+
+def _run(wait_ready: bool, records, n_requests: int):
+    port = _free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.api:app", "--port", str(port), "--log-level", "warning"],
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=None) as client:
+            startup = _wait_for(client, "/health")
+            ready = _wait_for(client, "/ready") if wait_ready else None
+            latencies = []
+            for record in records[:n_requests]:
+                start = time.perf_counter()
+                client.post("/predict", json={"records": [record]}).raise_for_status()
+                latencies.append((time.perf_counter() - start) * 1000)
+        return startup, ready, np.asarray(latencies)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main(n_requests: int = 20) -> None:
+    df = load_raw_sample(n_requests)
+    records = [{k: (None if v != v else v) for k, v in row.items()} for row in df.to_dict("records")]
+
+    print(f"{'mod':<22}{'/health (sn)':>14}{'/ready (sn)':>13}{'1. istek (ms)':>15}{'max (ms)':>10}{'p50 (ms)':>10}")
+    for name, wait_ready in [("ısınma beklenmeden", False), ("/ready sonrası", True)]:
+        startup, ready, lat = _run(wait_ready, records, n_requests)
+        ready_str = f"{ready:>13.2f}" if ready is not None else f"{'-':>13}"
+        print(
+            f"{name:<22}{startup:>14.2f}{ready_str}{lat[0]:>15.1f}"
+            f"{lat.max():>10.1f}{np.percentile(lat, 50):>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,61 @@
+# benchmarks/bench_dtypes.py
+
+"""
+Kompakt dtype planı: varsayılan (int64 / float64 / object) vs kompakt
+(int8 / int16 / float32 / bin kodları) tablo belleği, prepare_training
+tepe belleği ve tahmin farkı.
+
+Kullanım:
+    python benchmarks/bench_dtypes.py [n_rows]
+"""
+
+import sys
+
+import numpy as np
+from _common import load_raw_sample, measure
+
+from src.data_preprocessing import compact_frame, fit_preprocessing, prepare_training
+from src.predict import get_model_features, predict_from_df
+
+
+def _mb(df) -> float:
+    return df.memory_usage(deep=True).sum() / 1024**2
+
+
+def main(n_rows: int = 1_000_000) -> None:
+    df_raw = load_raw_sample(n_rows)
+    df_raw_compact = compact_frame(df_raw)
+    state = fit_preprocessing(df_raw)
+    features = get_model_features()
+    print(f"[INFO] {len(df_raw)} satır")
+
+    def prepare_default():
+        return prepare_training(df_raw, state=state, fused=True, features=features)
+
+    def prepare_compact():
+        return prepare_training(df_raw_compact, state=state, features=features, compact=True)
+
+    prepared = prepare_default()
+    prepared_compact = prepare_compact()
+
+    print(f"{'':<26}{'varsayılan':>14}{'kompakt':>14}{'oran':>8}")
+    for name, a, b in [
+        ("ham tablo (MB)", _mb(df_raw), _mb(df_raw_compact)),
+        ("hazır tablo (MB)", _mb(prepared), _mb(prepared_compact)),
+    ]:
+        print(f"{name:<26}{a:>14.1f}{b:>14.1f}{b / a:>8.2f}")
+
+    (ms_a, peak_a), (ms_b, peak_b) = measure(prepare_default), measure(prepare_compact)
+    print(f"{'prepare süre (ms)':<26}{ms_a:>14.1f}{ms_b:>14.1f}{ms_b / ms_a:>8.2f}")
+    print(f"{'prepare tepe bellek (MB)':<26}{peak_a:>14.1f}{peak_b:>14.1f}{peak_b / peak_a:>8.2f}")
+
+    y_pred, y_proba = predict_from_df(prepared)
+    y_pred_c, y_proba_c = predict_from_df(prepared_compact)
+    print(
+        f"Tahmin farkı: max |Δp| = {np.abs(y_proba - y_proba_c).max():.2e} | "
+        f"farklı karar: {(y_pred != y_pred_c).sum()} / {len(y_pred)}"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
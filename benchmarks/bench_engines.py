@@ -0,0 +1,31 @@
+# benchmarks/bench_engines.py
+
+"""
+predict_from_df: sklearn Pipeline vs compiled engine (batch başına).
+
+Girdi prepare_training sonrası hazır tablodur; sadece model tarafı ölçülür.
+
+Kullanım:
+    python benchmarks/bench_engines.py [n_rows ...]
+"""
+
+import sys
+
+from _common import load_raw_sample, measure
+
+from src.data_preprocessing import prepare_training
+from src.predict import get_model_features, predict_from_df
+
+
+def main(sizes) -> None:
+    print(f"{'satır':>10}{'sklearn (ms)':>15}{'compiled (ms)':>16}{'hızlanma':>11}")
+    for n_rows in sizes:
+        df = prepare_training(load_raw_sample(n_rows), fused=True, features=get_model_features())
+
+        sk_ms, _ = measure(lambda: predict_from_df(df))
+        c_ms, _ = measure(lambda: predict_from_df(df, engine="compiled"))
+        print(f"{n_rows:>10}{sk_ms:>15.2f}{c_ms:>16.2f}{sk_ms / c_ms:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1, 100, 10_000, 150_000])
@@ -0,0 +1,85 @@
+# benchmarks/bench_file_endpoint.py
+
+"""
+/predict/file (CSV yükle -> skorlanmış CSV akışı) vs inference_pipeline
+(CSV oku -> skorla -> CSV yaz): toplam süre, satır/sn ve tepe bellek.
+
+API gerçek bir uvicorn sunucusunda (aynı process, ayrı thread) çalışır;
+istemci dosyayı diskten akış halinde gönderir ve yanıtı biriktirmeden
+okur. Tepe bellek tracemalloc ile ölçülür (sunucu + istemci).
+
+Kullanım:
+    python benchmarks/bench_file_endpoint.py [n_rows]
+"""
+
+import contextlib
+import gzip
+import io
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import httpx
+from _common import load_raw_sample
+from bench_stream_endpoint import _start_server
+
+from src.pipeline import inference_pipeline
+
+
+def _measure(fn):
+    """(süre, tepe bellek MB); tracemalloc yavaşlattığı için süre ayrı ölçülür."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak / 1024**2
+
+
+def _upload(client: httpx.Client, path: Path, chunk_size: int) -> None:
+    def body():
+        with open(path, "rb") as f:
+            while block := f.read(1 << 20):
+                yield block
+
+    url = f"/predict/file?chunk_size={chunk_size}"
+    with client.stream("POST", url, content=body(), headers={"content-type": "text/csv"}) as r:
+        r.raise_for_status()
+        for _ in r.iter_bytes():
+            pass
+
+
+def main(n_rows: int = 500_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "raw.csv"
+        gz_path = Path(tmp) / "raw.csv.gz"
+        load_raw_sample(n_rows).to_csv(csv_path, index=False)
+        with open(csv_path, "rb") as src, gzip.open(gz_path, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+
+        base_url = _start_server()
+        print(f"[INFO] {n_rows} satır | CSV {csv_path.stat().st_size / 1024**2:.1f} MB")
+        print(f"{'yol':<40}{'süre (sn)':>11}{'satır/sn':>12}{'tepe bellek (MB)':>18}")
+
+        def report(name, elapsed, peak):
+            print(f"{name:<40}{elapsed:>11.2f}{n_rows / elapsed:>12,.0f}{peak:>18.1f}")
+
+        out_path = Path(tmp) / "scored.csv"
+        result = _measure(lambda: inference_pipeline(csv_path, out_path, raw=True))
+        report("inference_pipeline (tek seferde)", *result)
+
+        with httpx.Client(base_url=base_url, timeout=None) as client:
+            for path, chunk_size in [(csv_path, 10_000), (csv_path, 50_000), (gz_path, 50_000)]:
+                result = _measure(lambda: _upload(client, path, chunk_size))
+                report(f"/predict/file {path.name} chunk={chunk_size}", *result)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
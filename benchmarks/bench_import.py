@@ -0,0 +1,76 @@
+# benchmarks/bench_import.py
+
+"""
+Serving import grafiği: `import app.api` (ve karşılaştırma için
+src.inference / src.pipeline) süresi, her ölçüm yeni bir Python
+process'inde yapılır (modül önbelleği yok).
+
+Ek olarak serving import'undan sonra eğitime özel modüllerin
+(sklearn.model_selection, sklearn.metrics, xgboost, joblib ...) yüklenip
+yüklenmediği raporlanır. `import app.api` medyanı IMPORT_BUDGET_MS'i
+aşarsa script 1 koduyla çıkar (CI kontrolü olarak kullanılabilir).
+
+Kullanım:
+    python benchmarks/bench_import.py [repeats] [budget_ms]
+"""
+
+import json
+import subprocess
+import sys
+
+import numpy as np
+from _common import PROJECT_ROOT
+
+from src.config import IMPORT_BUDGET_MS
+
+MODULES = ["app.api", "src.inference", "src.pipeline"]
+TRAINING_ONLY = [
+    "sklearn.model_selection",
+    "sklearn.metrics",
+    "xgboost",
+    "joblib",
+    "matplotlib",
+    "shap",
+]
+
+_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{"ms": elapsed, "loaded": [m for m in {watch!r} if m in sys.modules]}}))
+"""
+
+
+def _import_once(module: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _SNIPPET.format(module=module, watch=TRAINING_ONLY)],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(repeats: int = 5, budget_ms: float = IMPORT_BUDGET_MS) -> int:
+    print(f"[INFO] {repeats} tekrar, yeni process")
+    print(f"{'modül':<16}{'medyan (ms)':>13}{'min (ms)':>10}{'max (ms)':>10}  eğitime özel yüklenenler")
+    medians = {}
+    for module in MODULES:
+        runs = [_import_once(module) for _ in range(repeats)]
+        times = np.array([r["ms"] for r in runs])
+        medians[module] = float(np.median(times))
+        loaded = ", ".join(runs[-1]["loaded"]) or "-"
+        print(f"{module:<16}{medians[module]:>13.1f}{times.min():>10.1f}{times.max():>10.1f}  {loaded}")
+
+    if medians["app.api"] > budget_ms:
+        print(f"[UYARI] import app.api {medians['app.api']:.0f} ms > bütçe {budget_ms:.0f} ms")
+        return 1
+    print(f"[INFO] import app.api bütçe içinde ({medians['app.api']:.0f} / {budget_ms:.0f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    sys.exit(main(int(args[0]) if args else 5, float(args[1]) if len(args) > 1 else IMPORT_BUDGET_MS))
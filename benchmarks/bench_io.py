@@ -0,0 +1,51 @@
+# benchmarks/bench_io.py
+
+"""
+Hazır feature tablosu: CSV vs Parquet okuma / yazma süresi ve dosya boyutu
+(tüm kolonlar ve sadece modelin okuduğu kolonlar).
+
+Kullanım:
+    python benchmarks/bench_io.py [n_rows]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from _common import load_raw_sample
+
+from src.data_io import read_table, write_table
+from src.data_preprocessing import prepare_training
+from src.feature_registry import BIN_SPECS
+from src.predict import get_model_input_columns
+
+
+def _best_ms(fn, repeats: int = 3) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main(n_rows: int = 1_000_000) -> None:
+    df = prepare_training(load_raw_sample(n_rows))
+    columns = get_model_input_columns()
+    csv_dtypes = {col: str for col in BIN_SPECS}
+    print(f"[INFO] {len(df)} satır x {df.shape[1]} kolon | model kolonları: {len(columns)}")
+
+    print(f"{'format':<10}{'yazma (ms)':>12}{'okuma (ms)':>12}{'proj. okuma (ms)':>18}{'boyut (MB)':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for suffix in [".csv", ".parquet"]:
+            path = Path(tmp) / f"prepared{suffix}"
+            write_ms = _best_ms(lambda: write_table(df, path), repeats=1)
+            read_ms = _best_ms(lambda: read_table(path, dtype=csv_dtypes))
+            proj_ms = _best_ms(lambda: read_table(path, columns=columns, dtype=csv_dtypes))
+            size_mb = path.stat().st_size / 1024**2
+            print(f"{suffix[1:]:<10}{write_ms:>12.0f}{read_ms:>12.0f}{proj_ms:>18.0f}{size_mb:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,54 @@
+# benchmarks/bench_jobs.py
+
+"""
+Asenkron job havuzu (src.jobs) için kapasite ölçümü: aynı anda gönderilen
+n_jobs job'un havuz boyutuna (max_workers) göre toplam throughput'u,
+kuyrukta bekleme ve uçtan uca gecikmesi.
+
+Kullanım:
+    python benchmarks/bench_jobs.py [n_rows] [n_jobs]
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from _common import load_raw_sample
+
+from src.jobs import JobManager
+
+
+def main(n_rows: int = 100_000, n_jobs: int = 4) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = Path(tmp) / "portfolio.csv"
+        load_raw_sample(n_rows).to_csv(input_path, index=False)
+
+        print(f"[INFO] {n_jobs} job x {n_rows} satır")
+        print(
+            f"{'max_workers':>12}{'toplam (sn)':>13}{'satır/sn':>12}"
+            f"{'job satır/sn':>14}{'ort. kuyruk (sn)':>18}{'p95 gecikme (sn)':>18}"
+        )
+        for max_workers in [1, 2, 4]:
+            with contextlib.redirect_stdout(io.StringIO()), \
+                    JobManager(jobs_dir=Path(tmp) / f"jobs-{max_workers}", max_workers=max_workers,
+                               input_dir=tmp) as manager:
+                start = time.perf_counter()
+                ids = [manager.submit(input_path)["id"] for _ in range(n_jobs)]
+                done = [manager.wait(job_id) for job_id in ids]
+                total = time.perf_counter() - start
+
+            print(
+                f"{max_workers:>12}{total:>13.2f}{n_rows * n_jobs / total:>12,.0f}"
+                f"{np.mean([j['rows_per_sec'] for j in done]):>14,.0f}"
+                f"{np.mean([j['queue_s'] for j in done]):>18.2f}"
+                f"{np.percentile([j['latency_s'] for j in done], 95):>18.2f}"
+            )
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,51 @@
+# benchmarks/bench_matrix_cache.py
+
+"""
+Hazır feature tablosu: CSV'den okuyup matrise çevirme vs memory-mapped
+matris önbelleğini açma.
+
+Kullanım:
+    python benchmarks/bench_matrix_cache.py [n_rows]
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from _common import load_raw_sample, measure
+
+from src.data_io import read_table
+from src.data_preprocessing import prepare_training
+from src.feature_registry import BIN_SPECS
+from src.matrix_cache import load_prepared_matrix
+
+
+def main(n_rows: int = 150_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        csv_path = tmp / "prepared.csv"
+        prepare_training(load_raw_sample(n_rows)).to_csv(csv_path, index=False)
+        cache_dir = tmp / "cache"
+        print(f"[INFO] {n_rows} satır hazır tablo")
+
+        def from_csv():
+            df = read_table(csv_path, dtype={col: str for col in BIN_SPECS})
+            numeric = df.select_dtypes(include=[np.number])
+            return numeric.to_numpy(dtype=np.float32)
+
+        load_prepared_matrix(csv_path, target_col=None, cache_dir=cache_dir)  # önbelleği kur
+
+        def from_cache():
+            matrix = load_prepared_matrix(csv_path, target_col=None, cache_dir=cache_dir)
+            return matrix.to_frame()
+
+        rows = [("CSV parse + matris", *measure(from_csv)), ("memmap önbellek", *measure(from_cache))]
+
+    print(f"{'yol':<22}{'süre (ms)':>12}{'tepe bellek (MB)':>20}")
+    for name, ms, mb in rows:
+        print(f"{name:<22}{ms:>12.1f}{mb:>20.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 150_000)
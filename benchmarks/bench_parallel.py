@@ -0,0 +1,43 @@
+# benchmarks/bench_parallel.py
+
+"""
+Tek process (predict_from_raw) vs ParallelScorer: worker sayısına göre
+satır/sn. Gece işlerinin boyutlandırılması için.
+
+Kullanım:
+    python benchmarks/bench_parallel.py [n_rows] [shard_size]
+"""
+
+import os
+import sys
+import time
+
+from _common import load_raw_sample
+
+from src.inference import predict_from_raw
+from src.parallel import DEFAULT_SHARD_SIZE, ParallelScorer
+
+
+def main(n_rows: int = 1_000_000, shard_size: int = DEFAULT_SHARD_SIZE) -> None:
+    df_raw = load_raw_sample(n_rows)
+    n_cpu = os.cpu_count() or 1
+    print(f"[INFO] {n_rows} satır | {n_cpu} CPU | shard_size={shard_size}")
+
+    start = time.perf_counter()
+    predict_from_raw(df_raw)
+    base = n_rows / (time.perf_counter() - start)
+
+    print(f"{'mod':<24}{'satır/sn':>14}{'hızlanma':>11}")
+    print(f"{'tek process':<24}{base:>14,.0f}{1:>10.2f}x")
+
+    for n_workers in sorted({2, 4, n_cpu} - {1}):
+        with ParallelScorer(n_workers=n_workers, shard_size=shard_size) as scorer:
+            scorer.score(df_raw.head(shard_size * n_workers))  # havuzu ısıt
+            scorer.score(df_raw)
+            rps = scorer.last_stats["rows_per_sec"]
+        print(f"{f'{n_workers} worker':<24}{rps:>14,.0f}{rps / base:>10.2f}x")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(*args)
@@ -0,0 +1,85 @@
+# benchmarks/bench_payloads.py
+
+"""
+/predict istek / yanıt formatları: JSON records, JSON columns, msgpack
+(binary kolonlar) ve Arrow IPC.
+
+- decode: gövde -> ham DataFrame (JSON'da pydantic doğrulama dahil)
+- encode: tahminler -> yanıt gövdesi
+- uçtan uca: TestClient ile POST /predict (skorlama dahil)
+
+Kullanım:
+    python benchmarks/bench_payloads.py
+"""
+
+import json
+
+import msgpack
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from _common import load_raw_sample, measure
+from fastapi.testclient import TestClient
+
+from app.api import CustomerBatch, app
+from src.payloads import (
+    ARROW_STREAM,
+    MSGPACK,
+    columns_from_frame,
+    decode_arrow,
+    decode_msgpack,
+    encode_arrow,
+    encode_msgpack,
+    frame_from_columns,
+)
+
+
+def _arrow_body(df: pd.DataFrame) -> bytes:
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _encode_json(y_pred, y_proba) -> bytes:
+    return json.dumps(
+        {"n_records": len(y_pred), "predictions": y_pred.tolist(), "probabilities": y_proba.tolist()}
+    ).encode()
+
+
+def main() -> None:
+    client = TestClient(app)
+    json_type = "application/json"
+
+    header = f"{'satır':>8}{'format':>10}{'istek (KB)':>12}{'decode (ms)':>13}{'encode (ms)':>13}{'uçtan uca (ms)':>16}"
+    print(header)
+    for n_rows in [100, 1_000, 10_000, 100_000]:
+        df = load_raw_sample(n_rows)
+        y_pred = np.zeros(n_rows, dtype=int)
+        y_proba = np.random.default_rng(0).random(n_rows, dtype=np.float32)
+        records = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+        formats = [
+            ("records", json.dumps({"records": records}).encode(), json_type,
+             lambda b: pd.DataFrame(CustomerBatch.model_validate_json(b).records), _encode_json),
+            ("columns", json.dumps({"columns": columns_from_frame(df)}).encode(), json_type,
+             lambda b: frame_from_columns(CustomerBatch.model_validate_json(b).columns), _encode_json),
+            ("msgpack", msgpack.packb({"columns": {c: df[c].to_numpy("<f8").tobytes() for c in df.columns}}),
+             MSGPACK, decode_msgpack, encode_msgpack),
+            ("arrow", _arrow_body(df), ARROW_STREAM, decode_arrow, encode_arrow),
+        ]
+
+        for name, body, content_type, decode, encode in formats:
+            decode_ms, _ = measure(lambda: decode(body))
+            encode_ms, _ = measure(lambda: encode(y_pred, y_proba))
+            headers = {"content-type": content_type, "accept": content_type}
+            e2e_ms, _ = measure(lambda: client.post("/predict", content=body, headers=headers))
+            print(
+                f"{n_rows:>8}{name:>10}{len(body) / 1024:>12.0f}{decode_ms:>13.1f}"
+                f"{encode_ms:>13.1f}{e2e_ms:>16.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
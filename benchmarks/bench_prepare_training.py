@@ -0,0 +1,31 @@
+# benchmarks/bench_prepare_training.py
+
+"""
+prepare_training: sıralı zincir vs fused (tek geçiş) karşılaştırması.
+
+Kullanım:
+    python benchmarks/bench_prepare_training.py [n_rows]
+"""
+
+import sys
+
+from _common import load_raw_sample, measure
+
+from src.data_preprocessing import prepare_training
+
+
+def main(n_rows: int = 150_000) -> None:
+    df_raw = load_raw_sample(n_rows)
+    print(f"[INFO] {len(df_raw)} satır ham veri")
+
+    staged_ms, staged_mb = measure(lambda: prepare_training(df_raw))
+    fused_ms, fused_mb = measure(lambda: prepare_training(df_raw, fused=True))
+
+    print(f"{'mod':<10}{'süre (ms)':>12}{'tepe bellek (MB)':>20}")
+    print(f"{'staged':<10}{staged_ms:>12.1f}{staged_mb:>20.1f}")
+    print(f"{'fused':<10}{fused_ms:>12.1f}{fused_mb:>20.1f}")
+    print(f"Hızlanma: x{staged_ms / fused_ms:.2f} | Bellek: x{staged_mb / fused_mb:.2f} daha az")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 150_000)
@@ -0,0 +1,55 @@
+# benchmarks/bench_realtime.py
+
+"""
+Tek kayıt gecikmesi: predict_from_raw (pandas + sklearn) vs
+CompiledScorer hızlı yolu (numpy vektör + booster).
+
+Kullanım:
+    python benchmarks/bench_realtime.py [n_records]
+"""
+
+import sys
+import time
+
+import numpy as np
+from _common import load_raw_sample
+
+from src.inference import predict_from_raw
+from src.scorer import get_compiled_scorer
+
+
+def _latency_us(fn, items) -> np.ndarray:
+    out = []
+    for item in items:
+        start = time.perf_counter()
+        fn(item)
+        out.append((time.perf_counter() - start) * 1e6)
+    return np.array(out)
+
+
+def main(n_records: int = 500) -> None:
+    df_raw = load_raw_sample(n_records)
+    records = df_raw.to_dict("records")
+    rows = [df_raw.iloc[[i]] for i in range(len(df_raw))]
+
+    scorer = get_compiled_scorer()
+    scorer.predict_record(records[0])  # ısınma
+    predict_from_raw(rows[0])
+
+    results = {
+        "predict_from_raw": _latency_us(predict_from_raw, rows),
+        "fast: prepare": _latency_us(scorer.prepare_record, records),
+        "fast: toplam": _latency_us(scorer.predict_record, records),
+    }
+
+    print(f"[INFO] {n_records} tek kayıt isteği")
+    print(f"{'yol':<20}{'p50 (µs)':>12}{'p99 (µs)':>12}")
+    for name, lat in results.items():
+        print(f"{name:<20}{np.percentile(lat, 50):>12.1f}{np.percentile(lat, 99):>12.1f}")
+
+    speedup = np.median(results["predict_from_raw"]) / np.median(results["fast: toplam"])
+    print(f"Hızlanma (p50): x{speedup:.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,73 @@
+# benchmarks/bench_stream_endpoint.py
+
+"""
+/predict vs /predict/stream (NDJSON): ilk byte'a kadar geçen süre, toplam
+süre ve tepe bellek.
+
+API gerçek bir uvicorn sunucusunda (aynı process, ayrı thread) çalışır;
+istemci yanıtı httpx ile akış halinde okur ve biriktirmez. Tepe bellek
+tracemalloc ile ölçülür (sunucu + istemci).
+
+Kullanım:
+    python benchmarks/bench_stream_endpoint.py [n_rows]
+"""
+
+import socket
+import sys
+import threading
+import time
+import tracemalloc
+
+import httpx
+import msgpack
+import uvicorn
+from _common import load_raw_sample
+
+from app.api import app
+from src.payloads import MSGPACK
+
+
+def _start_server() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}"
+
+
+def _run(client: httpx.Client, url: str, body: bytes):
+    tracemalloc.start()
+    start = time.perf_counter()
+    first_byte = None
+    n_bytes = 0
+    with client.stream("POST", url, content=body, headers={"content-type": MSGPACK}) as response:
+        for part in response.iter_bytes():
+            if first_byte is None:
+                first_byte = time.perf_counter() - start
+            n_bytes += len(part)
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first_byte * 1000, total * 1000, peak / 1024**2, n_bytes / 1024**2
+
+
+def main(n_rows: int = 200_000) -> None:
+    df = load_raw_sample(n_rows)
+    body = msgpack.packb({"columns": {c: df[c].to_numpy("<f8").tobytes() for c in df.columns}})
+    base_url = _start_server()
+
+    with httpx.Client(base_url=base_url, timeout=None) as client:
+        client.post("/predict", content=body, headers={"content-type": MSGPACK})  # ısınma
+
+        print(f"[INFO] {n_rows} satır")
+        print(f"{'endpoint':<34}{'ilk byte (ms)':>15}{'toplam (ms)':>13}{'tepe bellek (MB)':>18}{'yanıt (MB)':>12}")
+        for url in ["/predict", "/predict/stream?chunk_size=10000", "/predict/stream?chunk_size=50000"]:
+            ttfb, total, peak, size = _run(client, url, body)
+            print(f"{url:<34}{ttfb:>15.1f}{total:>13.1f}{peak:>18.1f}{size:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
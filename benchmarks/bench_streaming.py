@@ -0,0 +1,50 @@
+# benchmarks/bench_streaming.py
+
+"""
+inference_pipeline (tüm dosya) vs stream_inference_pipeline (parça parça):
+süre ve tepe bellek. Girdi, src.synthetic ile parça parça (sabit bellekle)
+geçici bir ham CSV olarak üretilir; büyük n_rows değerleri de denenebilir.
+
+Kullanım:
+    python benchmarks/bench_streaming.py [n_rows] [chunksize]
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+from pathlib import Path
+
+from _common import measure
+
+from src.pipeline import inference_pipeline, stream_inference_pipeline
+from src.synthetic import write_synthetic
+
+
+def main(n_rows: int = 1_000_000, chunksize: int = 100_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        input_path = tmp / "raw.csv"
+        write_synthetic(input_path, n_rows)
+        print(f"[INFO] {n_rows} satır ham CSV ({input_path.stat().st_size / 1024**2:.0f} MB)")
+
+        def full():
+            inference_pipeline(input_path, tmp / "full.csv", raw=True)
+
+        def stream():
+            stream_inference_pipeline(input_path, tmp / "stream.csv", chunksize, raw=True)
+
+        rows = []
+        for name, fn in [("tam dosya", full), (f"streaming ({chunksize})", stream)]:
+            with contextlib.redirect_stdout(io.StringIO()):
+                ms, mb = measure(fn, repeats=1)
+            rows.append((name, ms, mb))
+
+    print(f"{'mod':<22}{'süre (s)':>10}{'satır/sn':>12}{'tepe bellek (MB)':>20}")
+    for name, ms, mb in rows:
+        print(f"{name:<22}{ms / 1000:>10.1f}{n_rows / (ms / 1000):>12,.0f}{mb:>20.1f}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(*args)
@@ -0,0 +1,326 @@
+# benchmarks/run.py
+
+"""
+Benchmark suite: prepare_training, predict_from_df, predict_from_raw ve
+process içi POST /predict, 1 satırdan 1M satıra kadar batch boyutlarında.
+
+Her (benchmark, batch boyutu) için:
+- p50 / p95 / p99 / ortalama gecikme (ms) ve satır/sn (p50 üzerinden)
+- tepe bellek (tracemalloc, ayrı bir çalıştırmada; süreleri etkilemesin diye)
+
+Veri tamamen sentetiktir (src.synthetic, sabit seed ve risk karışımı); ağ
+veya data/ altındaki dosyalar gerekmez, sadece model paketi okunur.
+
+Sonuçlar JSON olarak yazılır (varsayılan benchmarks/results/latest.json) ve
+kayıtlı baseline (benchmarks/baseline.json) ile karşılaştırılır: p50 süresi
+veya tepe bellek baseline'ı `tolerance` oranından fazla aşarsa regresyon
+sayılır. /predict için BATCH_MAX_SIZE'a kadarki (online) boyutlarda ortalama /
+p95 / p99, config'deki TARGET_*_LATENCY_MS hedefleriyle karşılaştırılır.
+Regresyon veya hedef aşımı varsa script 1 koduyla çıkar.
+
+Kullanım:
+    python benchmarks/run.py
+    python benchmarks/run.py --sizes 1,100,10000 --benchmarks predict_from_raw,api
+    python benchmarks/run.py --update-baseline      # mevcut sonuçları baseline yap
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import msgpack
+import numpy as np
+import pandas as pd
+from _common import PROJECT_ROOT
+from fastapi.testclient import TestClient
+
+import app.api as api
+from src.config import (
+    BATCH_MAX_SIZE,
+    SEED,
+    TARGET_AVG_LATENCY_MS,
+    TARGET_P95_LATENCY_MS,
+    TARGET_P99_LATENCY_MS,
+)
+from src.data_preprocessing import prepare_training
+from src.inference import predict_from_raw
+from src.jobs import JobManager
+from src.payloads import MSGPACK
+from src.predict import get_model_features, get_preprocessing_state, predict_from_df
+from src.synthetic import MIXES, generate
+
+BENCHMARKS = ["prepare_training", "predict_from_df", "predict_from_raw", "api"]
+DEFAULT_SIZES = [1, 100, 10_000, 1_000_000]
+BENCH_DIR = PROJECT_ROOT / "benchmarks"
+DEFAULT_OUTPUT = BENCH_DIR / "results" / "latest.json"
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+
+# Karşılaştırılan metrikler ve gürültü tabanı: fark bu mutlak değerin
+# altındaysa (örn. 0.3 ms -> 0.5 ms) oran ne olursa olsun regresyon sayılmaz
+COMPARED_METRICS = {"p50_ms": 0.5, "peak_mb": 1.0}
+SLO_TARGETS = {
+    "mean_ms": TARGET_AVG_LATENCY_MS,
+    "p95_ms": TARGET_P95_LATENCY_MS,
+    "p99_ms": TARGET_P99_LATENCY_MS,
+}
+
+
+def _repeats(n_rows: int, max_repeats: int, row_budget: int = 200_000) -> int:
+    """Küçük batch'ler çok, büyükler az tekrarlanır (en az 3)."""
+    return max(3, min(max_repeats, row_budget // n_rows))
+
+
+def _wait_ready(client: TestClient, timeout: float = 120.0) -> None:
+    """Başlangıç ısınması ölçümlerle yarışmasın diye /ready 200 olana kadar bekler."""
+    deadline = time.perf_counter() + timeout
+    while client.get("/ready").status_code != 200:
+        if time.perf_counter() > deadline:
+            raise TimeoutError("/ready")
+        time.sleep(0.05)
+
+
+def _api_callable(client: TestClient, df_raw: pd.DataFrame) -> Callable[[], object]:
+    # msgpack kolonları: gövde ölçüm dışında bir kez hazırlanır (NaN JSON'da taşınamaz)
+    body = msgpack.packb({"columns": {c: df_raw[c].to_numpy("<f8").tobytes() for c in df_raw.columns}})
+    headers = {"content-type": MSGPACK}
+
+    def call():
+        response = client.post("/predict", content=body, headers=headers)
+        response.raise_for_status()
+        return response
+
+    return call
+
+
+def _callables(df_raw: pd.DataFrame, client: Optional[TestClient]) -> Dict[str, Callable[[], object]]:
+    state = get_preprocessing_state()
+    features = get_model_features()
+    df_prepared = prepare_training(df_raw, state=state, fused=True, features=features)
+
+    fns = {
+        "prepare_training": lambda: prepare_training(df_raw),
+        "predict_from_df": lambda: predict_from_df(df_prepared),
+        "predict_from_raw": lambda: predict_from_raw(df_raw),
+    }
+    if client is not None:
+        fns["api"] = _api_callable(client, df_raw)
+    return fns
+
+
+def _peak_mb(fn: Callable[[], object]) -> float:
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024**2
+
+
+def measure_latencies(fn: Callable[[], object], repeats: int) -> np.ndarray:
+    """Isınma çağrısından sonra `repeats` çalıştırmanın süreleri (ms)."""
+    fn()
+    timings = np.empty(repeats)
+    for i in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings[i] = (time.perf_counter() - start) * 1000
+    return timings
+
+
+def summarize(name: str, n_rows: int, timings: np.ndarray, peak_mb: Optional[float]) -> dict:
+    p50, p95, p99 = np.percentile(timings, [50, 95, 99])
+    return {
+        "benchmark": name,
+        "batch_size": n_rows,
+        "repeats": len(timings),
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "mean_ms": float(timings.mean()),
+        "rows_per_sec": float(n_rows / (p50 / 1000)) if p50 > 0 else None,
+        "peak_mb": peak_mb,
+    }
+
+
+def check_slo(results: List[dict]) -> List[dict]:
+    """Online /predict boyutlarında gecikmeleri TARGET_* hedefleriyle karşılaştırır."""
+    checks = []
+    for r in results:
+        if r["benchmark"] != "api" or r["batch_size"] > BATCH_MAX_SIZE:
+            continue
+        for metric, target in SLO_TARGETS.items():
+            checks.append(
+                {
+                    "batch_size": r["batch_size"],
+                    "metric": metric,
+                    "value_ms": r[metric],
+                    "target_ms": target,
+                    "ok": r[metric] <= target,
+                }
+            )
+    return checks
+
+
+def compare(results: List[dict], baseline: List[dict], tolerance: float) -> List[dict]:
+    """Baseline'da da bulunan (benchmark, batch_size) çiftlerinde regresyonları döner."""
+    base = {(b["benchmark"], b["batch_size"]): b for b in baseline}
+    regressions = []
+    for r in results:
+        b = base.get((r["benchmark"], r["batch_size"]))
+        if b is None:
+            continue
+        for metric, floor in COMPARED_METRICS.items():
+            current, previous = r.get(metric), b.get(metric)
+            if current is None or previous is None:
+                continue
+            if current > previous * (1 + tolerance) and current - previous > floor:
+                regressions.append(
+                    {
+                        "benchmark": r["benchmark"],
+                        "batch_size": r["batch_size"],
+                        "metric": metric,
+                        "baseline": previous,
+                        "current": current,
+                        "ratio": current / previous if previous else None,
+                    }
+                )
+    return regressions
+
+
+def run_suite(
+    sizes: List[int],
+    benchmarks: List[str],
+    max_repeats: int = 200,
+    memory: bool = True,
+    seed: int = SEED,
+    mix: str = "mixed",
+) -> List[dict]:
+    df_all = generate(max(sizes), mix=mix, seed=seed)
+    results = []
+
+    with tempfile.TemporaryDirectory() as jobs_dir, contextlib.ExitStack() as stack:
+        client = None
+        if "api" in benchmarks:
+            # Suite'in job deposu (data/jobs) oluşturmaması için geçici klasör
+            api.jobs = JobManager(jobs_dir=jobs_dir, max_workers=1)
+            client = stack.enter_context(TestClient(api.app))
+            _wait_ready(client)
+
+        for n_rows in sizes:
+            df_raw = df_all.iloc[:n_rows].copy()
+            fns = _callables(df_raw, client)
+            repeats = _repeats(n_rows, max_repeats)
+            for name in benchmarks:
+                timings = measure_latencies(fns[name], repeats)
+                peak = _peak_mb(fns[name]) if memory else None
+                r = summarize(name, n_rows, timings, peak)
+                results.append(r)
+                peak_str = f"{peak:>10.1f}" if peak is not None else f"{'-':>10}"
+                print(
+                    f"{name:<18}{n_rows:>10}{r['repeats']:>8}{r['p50_ms']:>11.2f}{r['p95_ms']:>11.2f}"
+                    f"{r['p99_ms']:>11.2f}{r['rows_per_sec']:>14,.0f}{peak_str}"
+                )
+    return results
+
+
+def _load_baseline(path: Path) -> Optional[List[dict]]:
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def _write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Preprocessing / tahmin / API benchmark suite'i")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Virgülle ayrılmış batch boyutları")
+    parser.add_argument("--benchmarks", default=",".join(BENCHMARKS),
+                        help=f"Virgülle ayrılmış benchmark'lar ({', '.join(BENCHMARKS)})")
+    parser.add_argument("--max-repeats", type=int, default=200,
+                        help="Batch boyutu başına en fazla tekrar (en az 3)")
+    parser.add_argument("--no-memory", action="store_true", help="Tepe bellek ölçümünü atla")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--mix", default="mixed", choices=list(MIXES), help="Sentetik verinin risk karışımı")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Sonuç JSON dosyası")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON dosyası")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Regresyon toleransı (0.25 = baseline'dan %%25 fazlası)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Sonuçları baseline dosyasına da yaz")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    benchmarks = [b for b in args.benchmarks.split(",") if b]
+    unknown = set(benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"Bilinmeyen benchmark: {', '.join(sorted(unknown))}")
+
+    print(f"[INFO] Batch boyutları: {sizes} | benchmark'lar: {benchmarks}")
+    print(
+        f"{'benchmark':<18}{'satır':>10}{'tekrar':>8}{'p50 (ms)':>11}{'p95 (ms)':>11}"
+        f"{'p99 (ms)':>11}{'satır/sn':>14}{'bellek MB':>10}"
+    )
+    results = run_suite(sizes, benchmarks, args.max_repeats, not args.no_memory, args.seed, args.mix)
+
+    slo = check_slo(results)
+    baseline = _load_baseline(args.baseline)
+    regressions = compare(results, baseline, args.tolerance) if baseline is not None else []
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "seed": args.seed,
+            "mix": args.mix,
+            "tolerance": args.tolerance,
+            "baseline": str(args.baseline) if baseline is not None else None,
+        },
+        "results": results,
+        "slo": slo,
+        "regressions": regressions,
+    }
+    _write_json(args.output, report)
+    print(f"[INFO] Sonuçlar yazıldı: {args.output}")
+    if args.update_baseline:
+        _write_json(args.baseline, {"meta": report["meta"], "results": results})
+        print(f"[INFO] Baseline güncellendi: {args.baseline}")
+
+    for c in slo:
+        if not c["ok"]:
+            print(
+                f"[UYARI] /predict {c['batch_size']} satır: {c['metric']} "
+                f"{c['value_ms']:.1f} ms > hedef {c['target_ms']} ms"
+            )
+    if baseline is None:
+        print(f"[UYARI] Baseline bulunamadı ({args.baseline}); karşılaştırma yapılmadı")
+    for r in regressions:
+        print(
+            f"[UYARI] Regresyon: {r['benchmark']} {r['batch_size']} satır {r['metric']} "
+            f"{r['baseline']:.2f} -> {r['current']:.2f}"
+        )
+
+    failed = bool(regressions) or not all(c["ok"] for c in slo)
+    if not failed:
+        print("[INFO] Regresyon veya hedef aşımı yok")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
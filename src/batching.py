@@ -0,0 +1,364 @@
+# src/batching.py
+
+"""
+API için asenkron micro-batching.
+
+Eşzamanlı gelen küçük /predict istekleri tek tek skorlanınca her biri
+pandas + model çağrısının sabit maliyetini ayrı ayrı öder. `MicroBatcher`
+istekleri bir asyncio kuyruğunda toplar ve
+
+- kuyruktaki satır sayısı `max_batch_size`'a ulaşınca veya
+- ilk isteğin üzerinden `max_wait_ms` geçince
+
+hepsini tek bir vektörel batch olarak skorlar; her çağırana kendi dilimi
+döner. Skorlama event loop'u bloklamamak için tek bir worker thread'de
+çalışır; bir batch skorlanırken gelen istekler sıradaki batch'i oluşturur.
+
+`score_requests` API'nin skorlama fonksiyonudur. Model paketinde
+preprocessing state yoksa medyan / quantile her isteğin kendi
+kayıtlarından hesaplanmalıdır; bu yüzden istekler ayrı hazırlanır ve
+Booster çağrısı birleştirilir. State varsa tek kayıtlık istekler tek
+DataFrame'de birlikte hazırlanır (satır bazında durumsuz dönüşüm). Her
+iki durumda da sonuç, isteği tek başına predict_from_raw ile skorlamakla
+birebir aynıdır.
+
+Kullanım:
+    batcher = MicroBatcher(score_requests, max_batch_size=256, max_wait_ms=2)
+    y_pred, y_proba = await batcher.submit(records)
+    batcher.stats()
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.config import BATCH_MAX_SIZE, BATCH_MAX_WAIT_MS
+from src.data_preprocessing import prepare_training
+from src.feature_registry import RAW_FEATURE_COLS
+from src.metrics import STAGE_LATENCY
+from src.profiling import stage
+from src.payloads import frame_from_records
+from src.predict import (
+    get_model_features,
+    get_model_input_columns,
+    get_preprocessing_state,
+    predict_from_df,
+)
+from src.scorer import get_compiled_scorer
+
+Result = Tuple[np.ndarray, np.ndarray]
+
+# stats()["batch_size_histogram"] kova üst sınırları (satır)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+
+def _split(y_pred: np.ndarray, y_proba: np.ndarray, sizes: Sequence[int]) -> List[Result]:
+    results = []
+    offset = 0
+    for size in sizes:
+        results.append((y_pred[offset:offset + size], y_proba[offset:offset + size]))
+        offset += size
+    return results
+
+
+def _score_frames(payloads: Sequence[Any]) -> List[Result]:
+    """
+    sklearn yolu (paket compiled scorer'a çevrilemiyorsa): istekler
+    hazırlanır, tek DataFrame'de birleştirilip tek predict_from_df çağrılır.
+    """
+    state = get_preprocessing_state()
+    features = get_model_features()
+    preprocess_start = time.perf_counter()
+    frames = [frame_from_records(p) for p in payloads]
+
+    if state is not None and all(f.columns.equals(frames[0].columns) for f in frames):
+        raw = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        prepared = prepare_training(raw, state=state, fused=True, features=features)
+    else:
+        parts = [prepare_training(f, state=state, fused=True, features=features) for f in frames]
+        # concat eksik kolonları NaN ile doldurur; tek başına skorlansa
+        # KeyError alacak bir istek batch içinde sessizce skorlanmasın
+        input_cols = get_model_input_columns() or []
+        for part in parts:
+            missing = [c for c in input_cols if c not in part.columns]
+            if missing:
+                raise KeyError(f"Eksik feature kolonları: {missing}")
+        prepared = parts[0] if len(parts) == 1 else pd.concat(parts, ignore_index=True)
+    STAGE_LATENCY.observe(time.perf_counter() - preprocess_start, stage="preprocess")
+
+    with STAGE_LATENCY.time(stage="predict"):
+        y_pred, y_proba = predict_from_df(prepared, engine="sklearn")
+    return _split(y_pred, y_proba, [len(f) for f in frames])
+
+
+def score_requests(payloads: Sequence[Any]) -> List[Result]:
+    """
+    Birden çok isteği tek model çağrısıyla skorlar.
+
+    Her istek compiled scorer ile float32 satırlarına çevrilir, satırlar
+    birleştirilip Booster bir kez çağrılır:
+    - Tek kayıtlık istekler: `prepare_record` (pandas'sız). State varsa
+      tüm ham kolonları içeren tek kayıtlar tek DataFrame'de birlikte
+      hazırlanır.
+    - Çok kayıtlı istekler: kendi içinde prepare_training + transform.
+
+    Args:
+        payloads: İstek başına ham kayıt listesi (List[dict]) veya DataFrame
+
+    Returns:
+        İstek başına (y_pred, y_proba), girdi sırasıyla
+    """
+    scorer = get_compiled_scorer()
+    if scorer is None:
+        return _score_frames(payloads)
+
+    state = scorer.state
+    features = get_model_features()
+    preprocess_start = time.perf_counter()
+    blocks: List[Optional[np.ndarray]] = [None] * len(payloads)
+    coalesced = []
+
+    for i, payload in enumerate(payloads):
+        if isinstance(payload, pd.DataFrame) or len(payload) != 1:
+            frame = frame_from_records(payload)
+            prepared = prepare_training(frame, state=state, fused=True, features=features)
+            with stage("model.transform", len(prepared)):
+                blocks[i] = scorer.transform(prepared)
+        elif state is not None and all(col in payload[0] for col in RAW_FEATURE_COLS):
+            coalesced.append(i)
+        else:
+            blocks[i] = scorer.prepare_record(payload[0])
+
+    if coalesced:
+        frame = frame_from_records([payloads[i][0] for i in coalesced])
+        prepared = prepare_training(frame, state=state, fused=True, features=features)
+        with stage("model.transform", len(prepared)):
+            X = scorer.transform(prepared)
+        for row, i in enumerate(coalesced):
+            blocks[i] = X[row:row + 1]
+
+    X = blocks[0] if len(blocks) == 1 else np.vstack(blocks)
+    STAGE_LATENCY.observe(time.perf_counter() - preprocess_start, stage="preprocess")
+
+    with STAGE_LATENCY.time(stage="predict"), stage("model.predict_proba", len(X)):
+        y_proba = scorer.predict_proba(X)
+        y_pred = (y_proba >= scorer.threshold).astype(int)
+    return _split(y_pred, y_proba, [len(block) for block in blocks])
+
+
+class _Pending:
+    __slots__ = ("payload", "n_rows", "future", "enqueued")
+
+    def __init__(self, payload: Any, n_rows: int, future: asyncio.Future):
+        self.payload = payload
+        self.n_rows = n_rows
+        self.future = future
+        self.enqueued = time.perf_counter()
+
+
+class MicroBatcher:
+    """
+    Eşzamanlı istekleri boyut / bekleme süresi sınırlı batch'lerde birleştirir.
+
+    Args:
+        score_fn: payload listesi -> sonuç listesi (aynı sıra ve uzunlukta)
+        max_batch_size: Batch başına en fazla satır (istekler bölünmez; tek
+                        istek bunu aşarsa kendi başına bir batch olur)
+        max_wait_ms: İlk istek geldikten sonra batch'i doldurmak için
+                     beklenecek en uzun süre (0: beklemeden ne varsa skorla).
+                     Önceki batch tek istekten oluştuysa (düşük yük)
+                     beklenmez; kuyrukta birikmiş istekler yine birleştirilir.
+
+    Worker task ilk `submit` çağrısında çalışan event loop'ta başlar;
+    `close` ile durdurulur.
+    """
+
+    def __init__(
+        self,
+        score_fn: Callable[[Sequence[Any]], List[Any]] = score_requests,
+        max_batch_size: int = BATCH_MAX_SIZE,
+        max_wait_ms: float = BATCH_MAX_WAIT_MS,
+    ):
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size pozitif olmalı.")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms negatif olamaz.")
+        self.score_fn = score_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._carry: Optional[_Pending] = None
+        self._last_batch_requests = 0
+        self._reset_stats()
+
+    def _reset_stats(self) -> None:
+        self._stats = {
+            "n_requests": 0,
+            "n_batches": 0,
+            "n_rows": 0,
+            "n_errors": 0,
+            "max_batch_rows": 0,
+            "queue_wait_ms_total": 0.0,
+            "score_ms_total": 0.0,
+        }
+        self._histogram = [0] * (len(BATCH_SIZE_BUCKETS) + 1)
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        # Kuyruk / task bir event loop'a bağlıdır; loop değiştiyse yeniden kur
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="micro-batch")
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._carry = None
+            self._worker = loop.create_task(self._run())
+
+    async def submit(self, payload: Any) -> Any:
+        """
+        İsteği kuyruğa ekler ve kendi sonucunu bekler.
+
+        Skorlama hatası (örn. eksik kolon için KeyError) sadece ilgili
+        isteğe yükseltilir.
+        """
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_Pending(payload, len(payload), future))
+        return await future
+
+    async def _collect(self, batch: List[_Pending]) -> List[_Pending]:
+        """
+        Sıradaki batch'i `batch` listesine doldurur (hata olursa çağıran
+        o ana kadar alınmış istekleri bilir).
+        """
+        if self._carry is not None:
+            first, self._carry = self._carry, None
+        else:
+            first = await self._queue.get()
+        batch.append(first)
+        n_rows = first.n_rows
+        # Düşük yükte (önceki batch tek istekti) beklemek sadece gecikme
+        # ekler; birikmiş istekler yine de alınır
+        wait_ms = self.max_wait_ms if self._last_batch_requests > 1 else 0.0
+        deadline = first.enqueued + wait_ms / 1000
+
+        while n_rows < self.max_batch_size:
+            try:
+                item = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            if n_rows + item.n_rows > self.max_batch_size:
+                # Sığmayan istek sıradaki batch'i başlatır
+                self._carry = item
+                break
+            batch.append(item)
+            n_rows += item.n_rows
+        self._last_batch_requests = len(batch)
+        return batch
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[_Pending] = []
+            try:
+                await self._collect(batch)
+                start = time.perf_counter()
+                outcomes = await loop.run_in_executor(self._executor, self._score_batch, batch)
+                self._record(batch, start, (time.perf_counter() - start) * 1000)
+            except Exception as e:
+                # Skorlama dışı hata (kuyruk, executor, metrik): loop ölürse
+                # bekleyen ve sonraki tüm istekler asılı kalır
+                outcomes = [(False, e)] * len(batch)
+
+            for item, (ok, value) in zip(batch, outcomes):
+                if item.future.done():  # çağıran vazgeçti (iptal)
+                    continue
+                if ok:
+                    item.future.set_result(value)
+                else:
+                    self._stats["n_errors"] += 1
+                    item.future.set_exception(value)
+
+    def _score_batch(self, batch: List[_Pending]) -> List[Tuple[bool, Any]]:
+        """Batch'i skorlar; hata olursa istekleri tek tek dener."""
+        try:
+            return [(True, r) for r in self.score_fn([item.payload for item in batch])]
+        except Exception as e:
+            if len(batch) == 1:
+                return [(False, e)]
+
+        outcomes = []
+        for item in batch:
+            try:
+                outcomes.append((True, self.score_fn([item.payload])[0]))
+            except Exception as e:
+                outcomes.append((False, e))
+        return outcomes
+
+    def _record(self, batch: List[_Pending], start: float, score_ms: float) -> None:
+        n_rows = sum(item.n_rows for item in batch)
+        stats = self._stats
+        stats["n_requests"] += len(batch)
+        stats["n_batches"] += 1
+        stats["n_rows"] += n_rows
+        stats["max_batch_rows"] = max(stats["max_batch_rows"], n_rows)
+        for item in batch:
+            queue_wait = start - item.enqueued
+            stats["queue_wait_ms_total"] += queue_wait * 1000
+            STAGE_LATENCY.observe(queue_wait, stage="queue")
+        stats["score_ms_total"] += score_ms
+        self._histogram[int(np.searchsorted(BATCH_SIZE_BUCKETS, n_rows))] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Batching metrikleri (ortalama batch boyutu, kuyruk bekleme, histogram)."""
+        s = self._stats
+        n_batches = max(s["n_batches"], 1)
+        n_requests = max(s["n_requests"], 1)
+        labels = [f"<={b}" for b in BATCH_SIZE_BUCKETS] + [f">{BATCH_SIZE_BUCKETS[-1]}"]
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            "n_requests": s["n_requests"],
+            "n_batches": s["n_batches"],
+            "n_rows": s["n_rows"],
+            "n_errors": s["n_errors"],
+            "avg_requests_per_batch": s["n_requests"] / n_batches,
+            "avg_batch_rows": s["n_rows"] / n_batches,
+            "max_batch_rows": s["max_batch_rows"],
+            "avg_queue_wait_ms": s["queue_wait_ms_total"] / n_requests,
+            "avg_score_ms": s["score_ms_total"] / n_batches,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "batch_size_histogram": dict(zip(labels, self._histogram)),
+        }
+
+    async def close(self) -> None:
+        """Worker task'ı durdurur (bekleyen istekler iptal edilir)."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        if self._carry is not None:
+            self._carry.future.cancel()
+            self._carry = None
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._queue.get_nowait().future.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -22,6 +22,16 @@ RAW_TRAIN = DATA_DIR / "cs-training.csv"
 RAW_TEST = DATA_DIR / "cs-test.csv"
 CLEAN_TRAIN = DATA_DIR / "cs-training-clean.csv"
 TRAINING_PREPARED = DATA_DIR / "training_prepared.csv"
+TRAINING_PREDICTIONS = DATA_DIR / "training_predictions.csv"
+
+# Columnar (Parquet) karşılıkları: dtype'lar ve kategorik bin'ler korunur,
+# kolon bazlı (projection) okunabilir. Okuma / yazma: src.data_io
+CLEAN_TRAIN_PARQUET = DATA_DIR / "cs-training-clean.parquet"
+TRAINING_PREPARED_PARQUET = DATA_DIR / "training_prepared.parquet"
+TRAINING_PREDICTIONS_PARQUET = DATA_DIR / "training_predictions.parquet"
+
+# Memory-mapped hazır feature matrisi önbelleği (bkz. src.matrix_cache)
+MATRIX_CACHE_DIR = DATA_DIR / "matrix_cache"
 
 # === Final trained model ===
 # Notebook'ta da bu isimle kaydediliyor:
@@ -81,3 +91,44 @@ TARGET_AVG_LATENCY_MS = 100
 TARGET_P95_LATENCY_MS = 200
 TARGET_P99_LATENCY_MS = 500
 
+# /metrics: /predict gecikmeleri bu kadar istekten oluşan ardışık pencerelerde
+# ortalama / p95 / p99 olarak hedeflerle karşılaştırılır (bkz. src.metrics)
+SLO_WINDOW_REQUESTS = 100
+
+# === Serving: /predict micro-batching (bkz. src.batching) ===
+# Eşzamanlı istekler en fazla BATCH_MAX_SIZE satırlık batch'lerde birleştirilir;
+# ilk istek en fazla BATCH_MAX_WAIT_MS bekler.
+BATCH_MAX_SIZE = 256
+BATCH_MAX_WAIT_MS = 2.0
+
+# /predict/stream: istek bu boyutta parçalar halinde skorlanıp NDJSON satırı
+# olarak gönderilir
+STREAM_CHUNK_SIZE = 10_000
+
+
+# /predict/file: yüklenen CSV bu boyutta parçalar halinde okunup skorlanır
+FILE_CHUNK_SIZE = 50_000
+
+# === Serving: asenkron batch job'ları (bkz. src.jobs) ===
+# Job kayıtları JOBS_DB (SQLite) içinde, yüklenen girdiler ve sonuç
+# dosyaları JOBS_DIR altında tutulur; restart sonrası sahipsiz kalan job'lar
+# yeniden kuyruğa alınır. Aynı anda en fazla JOB_MAX_WORKERS job çalışır.
+JOBS_DIR = DATA_DIR / "jobs"
+JOBS_DB = JOBS_DIR / "jobs.sqlite"
+JOB_MAX_WORKERS = 2
+# Çalışan job'ların sahibi (host:pid) JOB_HEARTBEAT_S saniyede bir heartbeat
+# yazar. Başlangıçta sadece sahibi ölmüş (aynı host, pid yok) veya heartbeat'i
+# JOB_STALE_S'den eski job'lar kuyruğa geri alınır.
+JOB_HEARTBEAT_S = 5.0
+JOB_STALE_S = 60.0
+# Yol ile gönderilen job'lar sadece bu klasör altındaki dosyaları okuyabilir
+JOB_INPUT_DIR = DATA_DIR
+
+# === Serving: başlangıç ısınması (bkz. src.warmup) ===
+# API açılırken model paketi yüklenir ve bu boyutlarda sentetik batch'ler
+# skorlanır; /ready ancak bundan sonra 200 döner. Boş tuple: sadece model yüklenir.
+WARMUP_BATCH_SIZES = (1, 16, 256, 4096)
+
+# `import app.api` süresi bütçesi (milisaniye, yeni process, medyan);
+# benchmarks/bench_import.py aşılırsa sıfırdan farklı kodla çıkar
+IMPORT_BUDGET_MS = 1500
@@ -0,0 +1,215 @@
+# src/data_io.py
+
+"""
+Tablo okuma / yazma yardımcıları (CSV ve columnar Parquet / Feather).
+
+Format dosya uzantısından seçilir:
+- .csv (ve .csv.gz vb.)     -> pandas CSV
+- .parquet / .pq            -> Parquet (pyarrow)
+- .feather / .arrow         -> Arrow IPC / Feather (pyarrow)
+
+Columnar formatlar dtype'ları ve kategorik bin'leri (label + kod) korur,
+tekrar tekrar metin parse edilmez ve `columns` ile sadece gereken kolonlar
+okunabilir (örn. modelin kullandığı feature'lar).
+
+pyarrow opsiyonel bir bağımlılıktır; sadece columnar bir dosya
+okunurken / yazılırken import edilir.
+"""
+
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+import pandas as pd
+
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+FEATHER_SUFFIXES = {".feather", ".arrow"}
+# Açık dosya handle'ından okurken pandas sıkıştırmayı uzantıdan çıkaramaz
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".zip": "zip", ".xz": "xz", ".zst": "zstd"}
+
+
+def _suffix(path) -> str:
+    return Path(path).suffix.lower()
+
+
+def is_columnar(path) -> bool:
+    """Dosya columnar (Parquet / Feather) formatında mı?"""
+    return _suffix(path) in PARQUET_SUFFIXES | FEATHER_SUFFIXES
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Parquet / Arrow dosyaları için pyarrow gerekli: pip install pyarrow"
+        ) from e
+    return pq
+
+
+def read_table(
+    path,
+    columns: Optional[Sequence[str]] = None,
+    dtype: Optional[dict] = None,
+) -> pd.DataFrame:
+    """
+    Tabloyu okur.
+
+    Args:
+        path: Dosya yolu (format uzantıdan)
+        columns: Sadece bu kolonları oku (projection)
+        dtype: Sadece CSV için kolon dtype'ları (columnar dosyalar
+               dtype'ı zaten saklar)
+    """
+    columns = list(columns) if columns is not None else None
+    suffix = _suffix(path)
+
+    if suffix in PARQUET_SUFFIXES:
+        _require_pyarrow()
+        return pd.read_parquet(path, columns=columns)
+    if suffix in FEATHER_SUFFIXES:
+        _require_pyarrow()
+        return pd.read_feather(path, columns=columns)
+    return pd.read_csv(path, usecols=columns, dtype=dtype)
+
+
+def write_table(df: pd.DataFrame, path) -> None:
+    """Tabloyu uzantıya göre yazar (index yazılmaz)."""
+    suffix = _suffix(path)
+
+    if suffix in PARQUET_SUFFIXES:
+        _require_pyarrow()
+        df.to_parquet(path, index=False)
+    elif suffix in FEATHER_SUFFIXES:
+        _require_pyarrow()
+        df.reset_index(drop=True).to_feather(path)
+    else:
+        df.to_csv(path, index=False)
+
+
+class ChunkReader:
+    """
+    Tabloyu `chunksize` satırlık DataFrame parçaları halinde okur.
+
+    CSV için pd.read_csv(chunksize=...), Parquet için row group'lar
+    üzerinden pyarrow batch'leri kullanılır. `progress()` okunan kısmın
+    oranını (0-1) döner: CSV'de okunan byte, Parquet'te satır sayısı
+    üzerinden.
+    """
+
+    def __init__(
+        self,
+        path,
+        chunksize: int,
+        columns: Optional[Sequence[str]] = None,
+        dtype: Optional[dict] = None,
+    ):
+        if chunksize <= 0:
+            raise ValueError("chunksize pozitif olmalı.")
+        self.path = Path(path)
+        self.chunksize = chunksize
+        self.columns = list(columns) if columns is not None else None
+        self.dtype = dtype
+        self._handle = None
+        self._rows_read = 0
+        self._total_rows: Optional[int] = None
+
+    def __enter__(self) -> "ChunkReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        suffix = _suffix(self.path)
+        if suffix in PARQUET_SUFFIXES:
+            yield from self._iter_parquet()
+        elif suffix in FEATHER_SUFFIXES:
+            raise ValueError("Feather dosyaları parça parça okunamaz; Parquet kullanın.")
+        else:
+            yield from self._iter_csv()
+
+    def _iter_csv(self) -> Iterator[pd.DataFrame]:
+        self._handle = open(self.path, "rb")
+        reader = pd.read_csv(
+            self._handle,
+            chunksize=self.chunksize,
+            usecols=self.columns,
+            dtype=self.dtype,
+            compression=COMPRESSION_SUFFIXES.get(_suffix(self.path)),
+        )
+        for chunk in reader:
+            self._rows_read += len(chunk)
+            yield chunk
+
+    def _iter_parquet(self) -> Iterator[pd.DataFrame]:
+        pq = _require_pyarrow()
+        parquet_file = pq.ParquetFile(self.path)
+        self._total_rows = parquet_file.metadata.num_rows
+        for batch in parquet_file.iter_batches(batch_size=self.chunksize, columns=self.columns):
+            chunk = batch.to_pandas()
+            chunk.index = pd.RangeIndex(self._rows_read, self._rows_read + len(chunk))
+            self._rows_read += len(chunk)
+            yield chunk
+
+    def progress(self) -> float:
+        """Okunan kısmın oranı (0-1)."""
+        if self._total_rows is not None:
+            return self._rows_read / self._total_rows if self._total_rows else 1.0
+        if self._handle is not None:
+            total_bytes = self.path.stat().st_size
+            return min(self._handle.tell() / total_bytes, 1.0) if total_bytes else 1.0
+        return 0.0
+
+
+class ChunkWriter:
+    """
+    DataFrame parçalarını tek bir çıktı dosyasına ekleyerek yazar.
+
+    CSV'de ilk parça başlıkla yazılır, sonrakiler eklenir; Parquet'te
+    pyarrow.parquet.ParquetWriter ile her parça bir row group olur.
+    Çıktı dosyası varsa üzerine yazılır.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        if _suffix(path) in FEATHER_SUFFIXES:
+            raise ValueError("Feather dosyalarına parça parça yazılamaz; Parquet kullanın.")
+        self._parquet = _suffix(path) in PARQUET_SUFFIXES
+        self._writer = None
+        self.n_chunks = 0
+
+    def __enter__(self) -> "ChunkWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        if self._parquet:
+            import pyarrow as pa
+
+            pq = _require_pyarrow()
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table.cast(self._writer.schema))
+        else:
+            chunk.to_csv(
+                self.path,
+                mode="w" if self.n_chunks == 0 else "a",
+                header=self.n_chunks == 0,
+                index=False,
+            )
+        self.n_chunks += 1
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
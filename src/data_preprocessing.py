@@ -10,19 +10,30 @@ kullanılan ana preprocessing akışını kod tarafında toplar.
 
 import numpy as np
 import pandas as pd
-from typing import List
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
 
 from src.config import DATA_DIR
+from src.feature_registry import (
+    BIN_SPECS,
+    DELINQ_COLS,
+    FEATURES,
+    HIGH_DEBT_QUANTILE,
+    RAW_FEATURE_COLS,
+    apply_features,
+    compact_dtype,
+    compute_features,
+    dependencies,
+    label_codes,
+    stage_features,
+    to_compact,
+)
+from src.profiling import is_enabled as profiling_enabled
+from src.profiling import profiled, stage
+from src.profiling import record as record_stage
 
 TARGET_COL = "SeriousDlqin2yrs"
 
-# Delinquency ile ilgili ham kolonlar
-DELINQ_COLS: List[str] = [
-    "NumberOfTime30-59DaysPastDueNotWorse",
-    "NumberOfTime60-89DaysPastDueNotWorse",
-    "NumberOfTimes90DaysLate",
-]
-
 # Feature selection sonrası drop edilecek kolonlar
 FINAL_DROP_COLS: List[str] = [
     # Ham delinquency kolonları
@@ -40,9 +51,159 @@ FINAL_DROP_COLS: List[str] = [
     "CreditLineDensity",
 ]
 
+# Fit edilmiş preprocessing sabitlerinin model paketindeki anahtarı
+PREPROCESSING_STATE_KEY = "preprocessing"
+
+
+@lru_cache(maxsize=32)
+def _required_columns(features: Optional[FrozenSet[str]]) -> FrozenSet[str]:
+    if features is None:
+        roots = {c for c in FEATURES if c not in FINAL_DROP_COLS}
+    else:
+        roots = set()
+        for feat in features:
+            if feat in FEATURES:
+                roots.add(feat)
+                continue
+            # One-hot isimleri (örn. "AgeBin_18-30") -> kaynak bin kolonu
+            for bin_col in BIN_SPECS:
+                if feat.startswith(f"{bin_col}_"):
+                    roots.add(bin_col)
+    return frozenset(dependencies(roots))
+
+
+def required_columns(features: Optional[Iterable[str]] = None) -> FrozenSet[str]:
+    """
+    Modelin tükettiği feature'lar için hesaplanması gereken kolonları döner.
+
+    - `features`: model paketindeki "features" listesi (one-hot sonrası
+      isimler, örn. "AgeBin_18-30" dahil). None ise FINAL_DROP_COLS dışında
+      kalan tüm türevler hedeflenir.
+    - Dönen küme, hedef kolonlar ve (feature registry üzerinden) tüm ara
+      bağımlılıklarıdır. Örn. TotalDelinquency, modele girmese de
+      EverDelinquent / DelinqBin için gereklidir.
+    """
+    key = None if features is None else frozenset(features)
+    return _required_columns(key)
+
+
+def _stage_targets(stage: str, needed: Optional[Set[str]]) -> List[str]:
+    """İç fonksiyon: bir adımın (`needed` ile filtrelenmiş) feature'ları."""
+    return [c for c in stage_features(stage) if needed is None or c in needed]
+
+
+# 0) FIT: BATCH İSTATİSTİKLERİNİ EĞİTİM VERİSİNDEN BİR KEZ HESAPLA
+# fit_preprocessing'in okuduğu ham kolonlar (büyük dosyalarda sadece bunlar okunabilir)
+STATE_INPUT_COLS = ["age", "MonthlyIncome", "NumberOfDependents", "DebtRatio"]
+
+
+@profiled()
+def fit_preprocessing(df: pd.DataFrame) -> dict:
+    """
+    Eğitim verisi üzerinden batch'e bağlı istatistikleri bir kez hesaplar.
+
+    Dönen sözlük model paketine (`PREPROCESSING_STATE_KEY`) kaydedilir ve
+    serving tarafında `prepare_training(df, state=...)` ile sabit olarak
+    uygulanır. Böylece tek bir müşteriyi skorlamak batch'in geri kalanından
+    bağımsız olur (satır başı O(1)).
+
+    Hesaplananlar:
+    - age_median        : age == 0 düzeltmesi sonrası yaş medyanı
+    - income_median     : MonthlyIncome medyanı
+    - dependents_median : NumberOfDependents medyanı
+    - high_debt_threshold: DebtToIncomeRatio'nun HIGH_DEBT_QUANTILE seviyesi
+    """
+    state = {
+        "age_median": np.nan,
+        "income_median": np.nan,
+        "dependents_median": np.nan,
+        "high_debt_threshold": np.nan,
+    }
+
+    if "age" in df.columns:
+        state["age_median"] = float(df["age"].where(df["age"] != 0).median())
+    if "MonthlyIncome" in df.columns:
+        state["income_median"] = float(df["MonthlyIncome"].median())
+    if "NumberOfDependents" in df.columns:
+        state["dependents_median"] = float(df["NumberOfDependents"].median())
+
+    df_core = add_core_numeric_features(clean_basic(df, state))
+    if "DebtToIncomeRatio" in df_core.columns:
+        state["high_debt_threshold"] = float(
+            df_core["DebtToIncomeRatio"].quantile(HIGH_DEBT_QUANTILE)
+        )
+
+    return state
+
+
+# KOMPAKT DTYPE PLANI (loader'lar için)
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Ham veya hazır tabloya kompakt dtype planını uygular.
+
+    - Ham sayaçlar / bayraklar int8 (gerekirse int16), oran ve para
+      değerleri float32 (bkz. feature_registry.RAW_DTYPES, FeatureSpec.dtype)
+    - String bin kolonları (örn. CSV'den) int8 kodlu Categorical olur;
+      bilinmeyen label içeren bin kolonu olduğu gibi bırakılır
+    - Planda olmayan kolonlara (hedef, ID vb.) dokunulmaz
+
+    Tamsayı hedefe sığmayan (NaN, kesirli, taşan) kolonlar float32'ye
+    düşer; değer kaybı float32 yuvarlamasıyla sınırlıdır.
+    """
+    columns = {}
+    for col in df.columns:
+        values = df[col]
+        if col in BIN_SPECS:
+            if not isinstance(values.dtype, pd.CategoricalDtype):
+                codes = label_codes(values, col)
+                if not (codes == -2).any():
+                    values = pd.Categorical.from_codes(
+                        codes.astype(np.int8), categories=BIN_SPECS[col][2], ordered=True
+                    )
+        elif compact_dtype(col) is not None:
+            values = to_compact(values, compact_dtype(col))
+        columns[col] = values
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
 
 # 1) TEMEL TEMİZLİK (Data Cleaning notebook ile uyumlu)
-def clean_basic(df: pd.DataFrame) -> pd.DataFrame:
+def _clean_columns(df: pd.DataFrame, state: Optional[dict] = None) -> Dict[str, pd.Series]:
+    """
+    İç fonksiyon: temizlikte değişen kolonların yeni hallerini döner.
+
+    Giriş DataFrame'ine dokunmaz; hem clean_basic hem de fused mod bunu
+    kullanır.
+    """
+    cleaned = {}
+
+    # age == 0 → NaN → median ile doldur
+    if "age" in df.columns:
+        age = df["age"].copy()
+        age.loc[age == 0] = np.nan
+        age_median = age.median() if state is None else state["age_median"]
+        cleaned["age"] = age.fillna(age_median)
+
+    # MonthlyIncome ve NumberOfDependents için median imputasyonu
+    if "MonthlyIncome" in df.columns:
+        income = df["MonthlyIncome"]
+        income_median = income.median() if state is None else state["income_median"]
+        cleaned["MonthlyIncome"] = income.fillna(income_median)
+
+    if "NumberOfDependents" in df.columns:
+        deps = df["NumberOfDependents"]
+        dep_median = deps.median() if state is None else state["dependents_median"]
+        cleaned["NumberOfDependents"] = deps.fillna(dep_median)
+
+    # Delinquency kolonlarında uç değerleri cap et (98 → 10 vb.)
+    for col in DELINQ_COLS:
+        if col in df.columns:
+            cleaned[col] = df[col].clip(upper=10)
+
+    return cleaned
+
+
+@profiled()
+def clean_basic(df: pd.DataFrame, state: Optional[dict] = None) -> pd.DataFrame:
     """
     02_data_cleaning.ipynb ile aynı mantığı kod tarafına taşır.
 
@@ -51,75 +212,42 @@ def clean_basic(df: pd.DataFrame) -> pd.DataFrame:
     - age == 0 hatasını düzeltir (median ile doldurur)
     - MonthlyIncome ve NumberOfDependents eksiklerini median ile doldurur
     - Delinquency kolonlarındaki 98 gibi uç değerleri 10 seviyesinde sınırlar
+
+    `state` (bkz. `fit_preprocessing`) verilirse medyanlar batch'ten değil,
+    eğitimde fit edilen sabitlerden alınır.
     """
     df = df.copy()
 
-    # 1) Teknik ID kolonu varsa kaldır
+    # Teknik ID kolonu varsa kaldır
     if "Unnamed: 0" in df.columns:
         df = df.drop(columns=["Unnamed: 0"])
 
-    # 2) age == 0 → NaN → median ile doldur
-    if "age" in df.columns:
-        df.loc[df["age"] == 0, "age"] = np.nan
-        age_median = df["age"].median()
-        df["age"] = df["age"].fillna(age_median)
-
-    # 3) MonthlyIncome ve NumberOfDependents için median imputasyonu
-    if "MonthlyIncome" in df.columns:
-        income_median = df["MonthlyIncome"].median()
-        df["MonthlyIncome"] = df["MonthlyIncome"].fillna(income_median)
-
-    if "NumberOfDependents" in df.columns:
-        dep_median = df["NumberOfDependents"].median()
-        df["NumberOfDependents"] = df["NumberOfDependents"].fillna(dep_median)
-
-    # 4) Delinquency kolonlarında uç değerleri cap et (98 → 10 vb.)
-    for col in DELINQ_COLS:
-        if col in df.columns:
-            df[col] = df[col].clip(upper=10)
+    for col, values in _clean_columns(df, state).items():
+        df[col] = values
 
     return df
 
 
 # 2) CORE NUMERIC FEATURES (log1p + ratio + basic flag)
-def add_core_numeric_features(df: pd.DataFrame) -> pd.DataFrame:
+@profiled()
+def add_core_numeric_features(df: pd.DataFrame, needed: Optional[Set[str]] = None) -> pd.DataFrame:
     """
     Çekirdek sayısal feature'ları üretir:
 
     - log1p dönüşümleri (kuyrukları yumuşatmak için)
     - DebtToIncomeRatio
     - HighUtilizationFlag (kart limit aşımı)
-    """
-    df = df.copy()
-
-    # log1p dönüşümleri
-    if "RevolvingUtilizationOfUnsecuredLines" in df.columns:
-        df["RevolvingUtilizationOfUnsecuredLines_log1p"] = np.log1p(
-            df["RevolvingUtilizationOfUnsecuredLines"]
-        )
 
-    if "DebtRatio" in df.columns:
-        df["DebtRatio_log1p"] = np.log1p(df["DebtRatio"])
-
-    if "MonthlyIncome" in df.columns:
-        df["MonthlyIncome_log1p"] = np.log1p(df["MonthlyIncome"])
-
-    # Debt-to-income oranı (DebtRatio / MonthlyIncome)
-    if "DebtRatio" in df.columns and "MonthlyIncome" in df.columns:
-        income_safe = df["MonthlyIncome"].replace(0, np.nan)
-        df["DebtToIncomeRatio"] = (df["DebtRatio"] / income_safe).fillna(0)
-
-    # HighUtilizationFlag (limitin üstüne çıkmış veya çok yakın)
-    if "RevolvingUtilizationOfUnsecuredLines" in df.columns:
-        df["HighUtilizationFlag"] = (
-            df["RevolvingUtilizationOfUnsecuredLines"] >= 1.0
-        ).astype(int)
-
-    return df
+    Tanımlar src.feature_registry içindedir. `needed` verilirse
+    (bkz. required_columns) sadece o kümedeki kolonlar üretilir; bu not
+    sonraki adımlar için de geçerlidir.
+    """
+    return apply_features(df, _stage_targets("core", needed))
 
 
 # 3) DELINQUENCY FEATURES (flags + severity)
-def add_delinquency_features(df: pd.DataFrame) -> pd.DataFrame:
+@profiled()
+def add_delinquency_features(df: pd.DataFrame, needed: Optional[Set[str]] = None) -> pd.DataFrame:
     """
     Gecikme davranışı ile ilgili feature'ları üretir:
 
@@ -129,142 +257,48 @@ def add_delinquency_features(df: pd.DataFrame) -> pd.DataFrame:
     - MultipleDelinquencyFlag
     - DelinquencySeverityScore (ağırlıklı skor)
     """
-    df = df.copy()
-
-    # Toplam delinquency sayısı
-    if all(col in df.columns for col in DELINQ_COLS):
-        df["TotalDelinquency"] = df[DELINQ_COLS].sum(axis=1)
-    else:
-        df["TotalDelinquency"] = 0
-
-    # EverDelinquent: herhangi bir gecikme yaşadı mı?
-    df["EverDelinquent"] = (df["TotalDelinquency"] > 0).astype(int)
-
-    # Ever90DaysLate: 90+ gün gecikme var mı?
-    if "NumberOfTimes90DaysLate" in df.columns:
-        df["Ever90DaysLate"] = (df["NumberOfTimes90DaysLate"] > 0).astype(int)
-    else:
-        df["Ever90DaysLate"] = 0
-
-    # MultipleDelinquencyFlag: toplam gecikme sayısı >= 2 ise 1
-    df["MultipleDelinquencyFlag"] = (df["TotalDelinquency"] >= 2).astype(int)
-
-    # DelinquencySeverityScore: 30–59: ×1, 60–89: ×2, 90+: ×3
-    df["DelinquencySeverityScore"] = (
-        df.get("NumberOfTime30-59DaysPastDueNotWorse", 0) * 1
-        + df.get("NumberOfTime60-89DaysPastDueNotWorse", 0) * 2
-        + df.get("NumberOfTimes90DaysLate", 0) * 3
-    )
-
-    return df
+    return apply_features(df, _stage_targets("delinquency", needed))
 
 
 # 4) RISK FLAGS (gelir / borç / delinquency davranış flag'leri)
-def add_risk_flags(df: pd.DataFrame) -> pd.DataFrame:
+@profiled()
+def add_risk_flags(
+    df: pd.DataFrame,
+    state: Optional[dict] = None,
+    needed: Optional[Set[str]] = None,
+) -> pd.DataFrame:
     """
     Basit risk flag'lerini üretir (örn. HighDebtFlag).
 
     Buradaki eşikler, EDA/FE sırasında görülen dağılımlara göre seçilmiştir.
+    `state` verilirse HighDebtFlag eşiği eğitimde fit edilen değerdir.
     """
-    df = df.copy()
-
-    # HighDebtFlag: DebtToIncomeRatio üst segment
-    if "DebtToIncomeRatio" in df.columns:
-        # Örneğin en riskli ~%7–8'lik segment (üst quantile)
-        thr = df["DebtToIncomeRatio"].quantile(0.93)
-        df["HighDebtFlag"] = (df["DebtToIncomeRatio"] >= thr).astype(int)
-    else:
-        df["HighDebtFlag"] = 0
-
-    # İstersen AgeRiskFlag vb. başka flag'leri burada ekleyebilirsin
-
-    return df
+    return apply_features(df, _stage_targets("risk", needed), state)
 
 
 # 5) BINNING / SEGMENTASYON
-def add_binning_features(df: pd.DataFrame) -> pd.DataFrame:
+@profiled()
+def add_binning_features(df: pd.DataFrame, needed: Optional[Set[str]] = None) -> pd.DataFrame:
     """
     AgeBin, IncomeBin, UtilizationBin, DelinqBin gibi segmentasyon feature'larını üretir.
-    """
-    df = df.copy()
-
-    # AgeBin
-    if "age" in df.columns:
-        df["AgeBin"] = pd.cut(
-            df["age"],
-            bins=[0, 30, 45, 60, np.inf],
-            labels=["18-30", "31-45", "46-60", "60+"],
-            right=True,
-        )
-
-    # IncomeBin
-    if "MonthlyIncome" in df.columns:
-        df["IncomeBin"] = pd.cut(
-            df["MonthlyIncome"],
-            bins=[0, 3000, 6000, 10000, np.inf],
-            labels=["0-3k", "3-6k", "6-10k", "10k+"],
-            right=True,
-        )
-
-    # UtilizationBin
-    if "RevolvingUtilizationOfUnsecuredLines" in df.columns:
-        df["UtilizationBin"] = pd.cut(
-            df["RevolvingUtilizationOfUnsecuredLines"],
-            bins=[0, 0.3, 0.7, 1.0, np.inf],
-            labels=["0-30%", "30-70%", "70-100%", "100%+"],
-            right=True,
-        )
 
-    # DelinqBin (TotalDelinquency üzerinden)
-    if "TotalDelinquency" in df.columns:
-        df["DelinqBin"] = pd.cut(
-            df["TotalDelinquency"],
-            bins=[0, 1, 2, 4, np.inf],
-            labels=["0", "1", "2-3", "4+"],
-            right=False,
-        )
-
-    return df
+    Bin sınırları ve etiketleri BIN_SPECS içinde tanımlıdır.
+    """
+    return apply_features(df, _stage_targets("binning", needed))
 
 
 # 6) INTERACTION FEATURES
-def add_interaction_features(df: pd.DataFrame) -> pd.DataFrame:
+@profiled()
+def add_interaction_features(df: pd.DataFrame, needed: Optional[Set[str]] = None) -> pd.DataFrame:
     """
     Temel etkileşim feature'larını üretir (örneğin borç × kullanım, yaş × gelir vb.).
     """
-    df = df.copy()
-
-    # Borç yükü × kredi kullanım oranı
-    if "RevolvingUtilizationOfUnsecuredLines" in df.columns and "DebtRatio" in df.columns:
-        df["Utilization_x_DebtRatio"] = (
-            df["RevolvingUtilizationOfUnsecuredLines"] * df["DebtRatio"]
-        )
-
-    # Yaş × gelir
-    if "MonthlyIncome" in df.columns and "age" in df.columns:
-        df["Income_x_Age"] = df["MonthlyIncome"] * df["age"]
-
-    # Toplam gecikme × kullanım
-    if "TotalDelinquency" in df.columns and "RevolvingUtilizationOfUnsecuredLines" in df.columns:
-        df["Delinq_x_Utilization"] = (
-            df["TotalDelinquency"] * df["RevolvingUtilizationOfUnsecuredLines"]
-        )
-
-    # Açık kredi hatları × gayrimenkul kredileri
-    if "NumberOfOpenCreditLinesAndLoans" in df.columns and "NumberRealEstateLoansOrLines" in df.columns:
-        df["OpenLines_x_RealEstate"] = (
-            df["NumberOfOpenCreditLinesAndLoans"] * df["NumberRealEstateLoansOrLines"]
-        )
-
-    # HighUtilizationFlag × DebtRatio
-    if "HighUtilizationFlag" in df.columns and "DebtRatio" in df.columns:
-        df["HighUtil_x_DebtRatio"] = df["HighUtilizationFlag"] * df["DebtRatio"]
-
-    return df
+    return apply_features(df, _stage_targets("interaction", needed))
 
 
 # 7) DOMAIN-DRIVEN FEATURES
-def add_domain_features(df: pd.DataFrame) -> pd.DataFrame:
+@profiled()
+def add_domain_features(df: pd.DataFrame, needed: Optional[Set[str]] = None) -> pd.DataFrame:
     """
     Domain odaklı feature'ları üretir:
 
@@ -273,34 +307,11 @@ def add_domain_features(df: pd.DataFrame) -> pd.DataFrame:
     - RealEstateExposure
     - FinancialStressIndex
     """
-    df = df.copy()
-
-    # 1) Gerçek borç yükü
-    if "DebtRatio" in df.columns and "MonthlyIncome" in df.columns:
-        df["EffectiveDebtLoad"] = df["DebtRatio"] * df["MonthlyIncome"]
-
-    # 2) Yaşa göre kredi hattı yoğunluğu
-    if "NumberOfOpenCreditLinesAndLoans" in df.columns and "age" in df.columns:
-        df["CreditLineDensity"] = (
-            df["NumberOfOpenCreditLinesAndLoans"] / df["age"].replace(0, np.nan)
-        ).fillna(0)
-
-    # 3) Gayrimenkul borçlanma riski
-    if "NumberRealEstateLoansOrLines" in df.columns and "DebtRatio" in df.columns:
-        df["RealEstateExposure"] = (
-            df["NumberRealEstateLoansOrLines"] * df["DebtRatio"]
-        )
-
-    # 4) Finansal stres indeksi
-    if "DebtRatio" in df.columns and "RevolvingUtilizationOfUnsecuredLines" in df.columns:
-        df["FinancialStressIndex"] = np.log1p(
-            df["DebtRatio"] * df["RevolvingUtilizationOfUnsecuredLines"]
-        )
-
-    return df
+    return apply_features(df, _stage_targets("domain", needed))
 
 
 # 8) FEATURE SELECTION (FINAL DROP UYGULAMA)
+@profiled()
 def apply_feature_selection(df: pd.DataFrame) -> pd.DataFrame:
     """
     FINAL_DROP_COLS listesini kullanarak gereksiz kolonları çıkarır
@@ -312,7 +323,14 @@ def apply_feature_selection(df: pd.DataFrame) -> pd.DataFrame:
 
 
 # 9) ANA FONKSİYON: TRAINING İÇİN VERİ HAZIRLAMA
-def prepare_training(df: pd.DataFrame) -> pd.DataFrame:
+@profiled()
+def prepare_training(
+    df: pd.DataFrame,
+    state: Optional[dict] = None,
+    fused: bool = False,
+    features: Optional[Iterable[str]] = None,
+    compact: bool = False,
+) -> pd.DataFrame:
     """
     Ham (veya kısmen işlenmiş) bir eğitim datasını alır ve:
 
@@ -323,22 +341,120 @@ def prepare_training(df: pd.DataFrame) -> pd.DataFrame:
     - Etkileşim ve domain tabanlı feature'ları ekler
     - Feature selection ile final kolon setini oluşturur
 
+    `state` verilmezse medyanlar ve HighDebtFlag eşiği gelen batch'ten
+    hesaplanır (eski davranış). `fit_preprocessing` çıktısı verilirse
+    dönüşüm satır bazında durumsuzdur: tek kayıt, parça parça (chunk) veya
+    tüm batch ile skorlamak aynı sonucu verir.
+
+    `fused=True` ise sekiz adım, ara DataFrame kopyaları oluşturmadan tek
+    geçişte feature registry planı ile çalıştırılır (bkz.
+    `_prepare_training_fused`). Çıktı şeması ve
+    değerleri sıralı zincir ile birebir aynıdır.
+
+    Sadece gerekli türevler hesaplanır (dead-feature elimination):
+    `features` (model paketindeki "features" listesi) verilirse modelin
+    tükettiği kolonlar ve bağımlılıkları, verilmezse FINAL_DROP_COLS
+    dışında kalan türevler üretilir. Feature selection ile zaten atılacak
+    kolonlar (örn. Income_x_Age, MonthlyIncome_log1p, CreditLineDensity)
+    hiç hesaplanmaz.
+
+    `compact=True` ise kompakt dtype planı uçtan uca uygulanır (temizlenmiş
+    ham kolonlar ve türevler int8 / int16 / float32, bin'ler int8 kodlu);
+    bellek yaklaşık yarıya iner, değerler float32 hassasiyetindedir. Plan
+    kolon kolon uygulandığı için compact her zaman fused yolu kullanır.
+
     Sonuç: training_prepared.csv ile aynı şemaya sahip DataFrame döner.
     """
+    needed = required_columns(features)
+
+    if fused or compact:
+        return _prepare_training_fused(df, state, needed, compact=compact)
+
     df = df.copy()
 
-    df = clean_basic(df)
-    df = add_core_numeric_features(df)
-    df = add_delinquency_features(df)
-    df = add_risk_flags(df)
-    df = add_binning_features(df)
-    df = add_interaction_features(df)
-    df = add_domain_features(df)
+    df = clean_basic(df, state)
+    df = add_core_numeric_features(df, needed)
+    df = add_delinquency_features(df, needed)
+    df = add_risk_flags(df, state, needed)
+    df = add_binning_features(df, needed)
+    df = add_interaction_features(df, needed)
+    df = add_domain_features(df, needed)
     df = apply_feature_selection(df)
 
     return df
 
 
+# 10) FUSED (TEK GEÇİŞ) ÇALIŞTIRMA
+def _prepare_training_fused(
+    df: pd.DataFrame,
+    state: Optional[dict] = None,
+    needed: Optional[Set[str]] = None,
+    compact: bool = False,
+) -> pd.DataFrame:
+    """
+    prepare_training zincirini tek geçişte çalıştırır.
+
+    - Giriş DataFrame'i kopyalanmaz; sadece temizlikte değişen ham kolonlar
+      için yeni Series üretilir.
+    - Türevler feature registry planı ile bir kez, bağımlılık sırasıyla
+      hesaplanır; ara DataFrame oluşturulmaz.
+    - Sadece `needed` kümesindeki türevler hesaplanır.
+    - Sonuç DataFrame tek seferde, kolon sırası sıralı zincirle aynı
+      olacak şekilde kurulur.
+    - `compact=True` ise temizlenmiş ham kolonlar türevlerden önce kompakt
+      dtype'a çevrilir ve türevler de kompakt üretilir.
+    """
+    if needed is None:
+        needed = required_columns()
+
+    # 1) Temizlik (sadece değişen kolonlar)
+    columns = {}
+    with stage("clean_basic", len(df)):
+        cleaned = _clean_columns(df, state)
+        for col in df.columns:
+            if col == "Unnamed: 0":
+                continue
+            columns[col] = cleaned.get(col, df[col])
+            if compact and col in RAW_FEATURE_COLS:
+                columns[col] = to_compact(columns[col], compact_dtype(col))
+
+    # 2) Türevler (registry planı); profil açıksa feature süreleri adım
+    #    bazında (sıralı zincirdeki add_* adlarıyla) kaydedilir
+    timings = {} if profiling_enabled() else None
+    derived = compute_features(
+        columns, needed, state, n_rows=len(df), timings=timings, compact=compact
+    )
+    if timings:
+        _record_stage_timings(timings, len(df))
+
+    # 3) Sonucu tek seferde kur
+    with stage("build_frame", len(df)):
+        columns.update(derived)
+        columns = {c: v for c, v in columns.items() if c not in FINAL_DROP_COLS}
+        return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+# Registry adımı -> sıralı zincirdeki fonksiyon adı (profil raporu için)
+_STAGE_FUNCTIONS = {
+    "core": "add_core_numeric_features",
+    "delinquency": "add_delinquency_features",
+    "risk": "add_risk_flags",
+    "binning": "add_binning_features",
+    "interaction": "add_interaction_features",
+    "domain": "add_domain_features",
+}
+
+
+def _record_stage_timings(timings: Dict[str, float], n_rows: int) -> None:
+    """compute_features feature sürelerini adım bazında profile yazar."""
+    per_stage: Dict[str, float] = {}
+    for name, elapsed_ms in timings.items():
+        stage_name = _STAGE_FUNCTIONS.get(FEATURES[name].stage, FEATURES[name].stage)
+        per_stage[stage_name] = per_stage.get(stage_name, 0.0) + elapsed_ms
+    for stage_name, elapsed_ms in per_stage.items():
+        record_stage(stage_name, elapsed_ms, n_rows)
+
+
 if __name__ == "__main__":
     # Hızlı manuel test
     from src.config import RAW_TRAIN
@@ -353,3 +469,13 @@ if __name__ == "__main__":
     out_path = DATA_DIR / "training_prepared_from_script.csv"
     df_prep.to_csv(out_path, index=False)
     print("Hazırlanmış veri kaydedildi:", out_path)
+
+    # Columnar kopya (dtype + kategorik bin'ler korunur; pyarrow gerekir)
+    from src.data_io import write_table
+
+    try:
+        parquet_path = out_path.with_suffix(".parquet")
+        write_table(df_prep, parquet_path)
+        print("Parquet kopyası kaydedildi:", parquet_path)
+    except ImportError as e:
+        print("Parquet kopyası atlandı:", e)
@@ -11,21 +11,20 @@ Notlar:
 - Eğitim pipeline'ında resmi olarak `src.data_preprocessing.prepare_training`
   kullanılmaktadır. Bu dosya, 03_feature_engineering.ipynb içindeki denemeleri
   script formunda saklayan yardımcı (deneysel) bir modül olarak düşünülebilir.
+- Feature tanımları `src.feature_registry` içinde tek yerde tutulur; buradaki
+  fonksiyonlar registry'nin notebook gruplamasına göre ince görünümleridir.
+  Notebook'un eğitimden farklı tanımları (HighUtilizationFlag > 1.0, sabit
+  0.4 HighDebtFlag eşiği, sol-kapalı IncomeBin, eksik util/borç/gelir = 0)
+  registry'de NOTEBOOK varyant spec'leri olarak kayıtlıdır.
 - İsimlendirmeler, training_prepared.csv ve dokümantasyon ile tutarlı olacak
   şekilde düzenlenmiştir.
 """
 
 from typing import Iterable
-import numpy as np
-import pandas as pd
 
+import pandas as pd
 
-# Gecikme ile ilgili orijinal kolonlar
-DELINQ_COLS = [
-    "NumberOfTime30-59DaysPastDueNotWorse",
-    "NumberOfTime60-89DaysPastDueNotWorse",
-    "NumberOfTimes90DaysLate",
-]
+from src.feature_registry import DELINQ_COLS, NOTEBOOK, apply_features, income_bin_kernel
 
 
 def _check_required_columns(df: pd.DataFrame, required: Iterable[str], context: str) -> None:
@@ -53,29 +52,19 @@ def add_delinquency_features(df: pd.DataFrame) -> pd.DataFrame:
             1 * 30-59  +  2 * 60-89  +  3 * 90+ gün gecikmeler
     """
     _check_required_columns(df, DELINQ_COLS, "add_delinquency_features")
-    df = df.copy()
-
-    # Toplam gecikme adedi
-    df["TotalDelinquency"] = df[DELINQ_COLS].sum(axis=1)
-
-    # En az bir gecikme var mı?
-    df["EverDelinquent"] = (df["TotalDelinquency"] > 0).astype(int)
-
-    # 90+ gün gecikme flag'i
-    df["Ever90DaysLate"] = (df["NumberOfTimes90DaysLate"] > 0).astype(int)
 
-    # Çoklu gecikme flag'i
-    df["MultipleDelinquencyFlag"] = (df["TotalDelinquency"] >= 2).astype(int)
-
-    # Ağırlıklı gecikme skoru
-    df["DelinquencySeverityScore"] = (
-        1 * df["NumberOfTime30-59DaysPastDueNotWorse"]
-        + 2 * df["NumberOfTime60-89DaysPastDueNotWorse"]
-        + 3 * df["NumberOfTimes90DaysLate"]
+    return apply_features(
+        df,
+        [
+            "TotalDelinquency",
+            "EverDelinquent",
+            "Ever90DaysLate",
+            "MultipleDelinquencyFlag",
+            "DelinquencySeverityScore",
+        ],
+        variant=NOTEBOOK,
     )
 
-    return df
-
 
 def add_utilization_interactions(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -93,25 +82,19 @@ def add_utilization_interactions(df: pd.DataFrame) -> pd.DataFrame:
     required = ["RevolvingUtilizationOfUnsecuredLines", "DebtRatio"]
     _check_required_columns(df, required, "add_utilization_interactions")
 
-    df = df.copy()
-
-    util = df["RevolvingUtilizationOfUnsecuredLines"].fillna(0)
-    debt_ratio = df["DebtRatio"].replace([np.inf, -np.inf], np.nan).fillna(0)
+    targets = [
+        "Delinq_x_Utilization",
+        "Utilization_x_DebtRatio",
+        "HighUtilizationFlag",
+        "HighUtil_x_DebtRatio",
+    ]
 
     # TotalDelinquency yoksa burada üret
     if "TotalDelinquency" not in df.columns:
         _check_required_columns(df, DELINQ_COLS, "add_utilization_interactions/TotalDelinquency")
-        df["TotalDelinquency"] = df[DELINQ_COLS].sum(axis=1)
+        targets.insert(0, "TotalDelinquency")
 
-    # Interaction feature'lar
-    df["Delinq_x_Utilization"] = df["TotalDelinquency"] * util
-    df["Utilization_x_DebtRatio"] = util * debt_ratio
-
-    # Yüksek kullanım flag'i (limit aşımı)
-    df["HighUtilizationFlag"] = (util > 1.0).astype(int)
-    df["HighUtil_x_DebtRatio"] = df["HighUtilizationFlag"] * debt_ratio
-
-    return df
+    return apply_features(df, targets, variant=NOTEBOOK)
 
 
 def add_debt_exposure_features(df: pd.DataFrame) -> pd.DataFrame:
@@ -128,44 +111,24 @@ def add_debt_exposure_features(df: pd.DataFrame) -> pd.DataFrame:
         NumberOfOpenCreditLinesAndLoans / age
     - HighDebtFlag:
         DebtToIncomeRatio > 0.4 ise 1, değilse 0
+
+    Girdileri eksik olan opsiyonel feature'lar atlanır.
     """
     required = ["DebtRatio", "MonthlyIncome"]
     _check_required_columns(df, required, "add_debt_exposure_features")
 
-    df = df.copy()
+    targets = [
+        "EffectiveDebtLoad",
+        "RealEstateExposure",
+        "FinancialStressIndex",
+        "CreditLineDensity",
+    ]
 
-    debt_ratio = df["DebtRatio"].replace([np.inf, -np.inf], np.nan).fillna(0)
-    income = df["MonthlyIncome"].fillna(0)
-
-    # Parasal borç yükü
-    df["EffectiveDebtLoad"] = debt_ratio * income
-
-    # Gayrimenkul maruziyeti
-    if "NumberRealEstateLoansOrLines" in df.columns:
-        df["RealEstateExposure"] = (
-            df["NumberRealEstateLoansOrLines"].fillna(0) * debt_ratio
-        )
-
-    # Finansal stres indeksi
-    if "RevolvingUtilizationOfUnsecuredLines" in df.columns:
-        util = df["RevolvingUtilizationOfUnsecuredLines"].fillna(0)
-        df["FinancialStressIndex"] = np.log1p(debt_ratio * util)
-
-    # Kredi hattı yoğunluğu (yaşa göre)
-    if "NumberOfOpenCreditLinesAndLoans" in df.columns and "age" in df.columns:
-        age = df["age"].replace(0, np.nan)
-        density = (
-            df["NumberOfOpenCreditLinesAndLoans"].fillna(0) / age
-        )
-        density = density.replace([np.inf, -np.inf], np.nan).fillna(0)
-        df["CreditLineDensity"] = density
-
-    # Yüksek borç flag'i (borç/gelir oranına göre)
+    # Yüksek borç flag'i sadece DebtToIncomeRatio hazırsa üretilir
     if "DebtToIncomeRatio" in df.columns:
-        dti = df["DebtToIncomeRatio"].replace([np.inf, -np.inf], np.nan).fillna(0)
-        df["HighDebtFlag"] = (dti > 0.4).astype(int)
+        targets.append("HighDebtFlag")
 
-    return df
+    return apply_features(df, targets, variant=NOTEBOOK)
 
 
 def add_income_bins(
@@ -174,29 +137,20 @@ def add_income_bins(
     """
     Aylık gelir için segmentler (bin'ler) oluşturur.
 
-    Varsayılan aralıklar:
+    Varsayılan aralıklar (NOTEBOOK_INCOME_BINS, sol-kapalı):
         0-3k, 3-6k, 6-10k, 10k+  (bin label'ları string olarak atanır)
 
     Üretilen kolon:
         - IncomeBin
     """
     _check_required_columns(df, ["MonthlyIncome"], "add_income_bins")
-    df = df.copy()
 
     if bins is None:
-        bins = [0, 3000, 6000, 10000, np.inf]
-
-    labels = ["0-3k", "3-6k", "6-10k", "10k+"]
-
-    income = df["MonthlyIncome"].fillna(0)
-    df["IncomeBin"] = pd.cut(
-        income,
-        bins=bins,
-        labels=labels,
-        right=False,
-        include_lowest=True,
-    )
+        return apply_features(df, ["IncomeBin"], variant=NOTEBOOK)
 
+    # Deneysel: aynı varyant kernel'i, özel sınırlarla
+    df = df.copy()
+    df["IncomeBin"] = income_bin_kernel(bins)(df["MonthlyIncome"].to_numpy())
     return df
 
 
@@ -215,4 +169,3 @@ def apply_all_feature_engineering(df: pd.DataFrame) -> pd.DataFrame:
     df_fe = add_income_bins(df_fe)
 
     return df_fe
-
@@ -0,0 +1,699 @@
+# src/feature_registry.py
+
+"""
+Türev feature'ların tek kaynaklı (declarative) tanımları ve çalıştırıcısı.
+
+Her türev feature için:
+- girdi kolonları (ham Kaggle kolonları veya daha önce tanımlanmış türevler),
+- vektörel bir kernel (numpy dizileri alır, dizi döner),
+- ait olduğu preprocessing adımı (stage)
+
+bir kez `FeatureSpec` olarak kaydedilir. `build_plan` hangi feature'ların
+hangi sırayla (ve hangi seviyelerde birbirinden bağımsız) hesaplanacağını
+bir kez çözer; `compute_features` bu planı çalıştırır.
+
+`src.data_preprocessing` ve `src.feature_engineering` içindeki adım
+fonksiyonları bu registry'nin ince görünümleridir. Notebook'taki (eğitimde
+kullanılmayan) farklı tanımlar ayrı bir kopya olarak değil, `VARIANTS`
+altında adlandırılmış varyant spec'leri (NOTEBOOK) olarak tutulur.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Delinquency ile ilgili ham kolonlar
+DELINQ_COLS: List[str] = [
+    "NumberOfTime30-59DaysPastDueNotWorse",
+    "NumberOfTime60-89DaysPastDueNotWorse",
+    "NumberOfTimes90DaysLate",
+]
+
+# Ham (Kaggle) feature kolonları
+RAW_FEATURE_COLS: List[str] = [
+    "RevolvingUtilizationOfUnsecuredLines",
+    "age",
+    "NumberOfTime30-59DaysPastDueNotWorse",
+    "DebtRatio",
+    "MonthlyIncome",
+    "NumberOfOpenCreditLinesAndLoans",
+    "NumberOfTimes90DaysLate",
+    "NumberRealEstateLoansOrLines",
+    "NumberOfTime60-89DaysPastDueNotWorse",
+    "NumberOfDependents",
+]
+
+# === Kompakt dtype planı (compact=True) ===
+# Bayraklar int8, sayaçlar int8/int16, oran / para değerleri float32,
+# bin'ler zaten int8 kodlu Categorical. Tamsayı hedefler NaN veya taşma
+# içeriyorsa float32'ye düşülür (bkz. to_compact).
+FLAG_DTYPE = "int8"
+COUNT_DTYPE = "int16"
+VALUE_DTYPE = "float32"
+
+RAW_DTYPES = {
+    "RevolvingUtilizationOfUnsecuredLines": VALUE_DTYPE,
+    "age": VALUE_DTYPE,  # age == 0 -> NaN yapıldığı için float
+    "NumberOfTime30-59DaysPastDueNotWorse": "int8",
+    "DebtRatio": VALUE_DTYPE,
+    "MonthlyIncome": VALUE_DTYPE,
+    "NumberOfOpenCreditLinesAndLoans": "int8",
+    "NumberOfTimes90DaysLate": "int8",
+    "NumberRealEstateLoansOrLines": "int8",
+    "NumberOfTime60-89DaysPastDueNotWorse": "int8",
+    "NumberOfDependents": VALUE_DTYPE,
+}
+
+# HighDebtFlag için DebtToIncomeRatio üst quantile seviyesi
+HIGH_DEBT_QUANTILE = 0.93
+
+# Binning tanımları: hedef kolon -> (kaynak kolon, sınırlar, etiketler, right)
+BIN_SPECS = {
+    "AgeBin": (
+        "age",
+        [0, 30, 45, 60, np.inf],
+        ["18-30", "31-45", "46-60", "60+"],
+        True,
+    ),
+    "IncomeBin": (
+        "MonthlyIncome",
+        [0, 3000, 6000, 10000, np.inf],
+        ["0-3k", "3-6k", "6-10k", "10k+"],
+        True,
+    ),
+    "UtilizationBin": (
+        "RevolvingUtilizationOfUnsecuredLines",
+        [0, 0.3, 0.7, 1.0, np.inf],
+        ["0-30%", "30-70%", "70-100%", "100%+"],
+        True,
+    ),
+    "DelinqBin": (
+        "TotalDelinquency",
+        [0, 1, 2, 4, np.inf],
+        ["0", "1", "2-3", "4+"],
+        False,
+    ),
+}
+
+
+@dataclass(frozen=True)
+class FeatureSpec:
+    """
+    Tek bir türev feature tanımı.
+
+    - name     : Üretilen kolon adı
+    - inputs   : Kernel'e sırasıyla verilen girdi kolonları
+    - kernel   : kernel(*arrays) -> array (uses_state ise state= de alır)
+    - stage    : data_preprocessing içindeki adım adı (core, delinquency, ...)
+    - fallback : Girdiler eksikse kolon bu sabitle doldurulur (None ise atlanır)
+    - input_fallback: Verilirse eksik *ham* girdi kolonları tek tek bu
+                 sabitle doldurulup kernel yine çalıştırılır (df.get(col, 0))
+    - dtype    : compact=True iken kullanılan dtype (None: kernel çıktısı aynen)
+    """
+
+    name: str
+    inputs: Tuple[str, ...]
+    kernel: Callable[..., Any]
+    stage: str
+    fallback: Optional[int] = None
+    uses_state: bool = False
+    dtype: Optional[str] = None
+    input_fallback: Optional[int] = None
+
+
+# Kayıt sırası aynı zamanda (topolojik) üretim ve kolon sırasıdır
+FEATURES: Dict[str, FeatureSpec] = {}
+
+
+def register(
+    name: str,
+    inputs: Iterable[str],
+    stage: str,
+    fallback: Optional[int] = None,
+    uses_state: bool = False,
+    dtype: Optional[str] = VALUE_DTYPE,
+    input_fallback: Optional[int] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Kernel fonksiyonunu registry'ye ekleyen decorator.
+
+    Girdiler ya ham kolon ya da daha önce kaydedilmiş bir türev olmalıdır;
+    böylece kayıt sırası her zaman geçerli bir hesaplama sırasıdır.
+    """
+    inputs = tuple(inputs)
+    unknown = [c for c in inputs if c not in RAW_FEATURE_COLS and c not in FEATURES]
+    if unknown:
+        raise ValueError(f"[{name}] bilinmeyen girdi kolonları: {unknown}")
+    if name in FEATURES:
+        raise ValueError(f"[{name}] zaten kayıtlı")
+
+    def decorator(kernel: Callable[..., Any]) -> Callable[..., Any]:
+        FEATURES[name] = FeatureSpec(name, inputs, kernel, stage, fallback, uses_state, dtype, input_fallback)
+        return kernel
+
+    return decorator
+
+
+def _safe_divide(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    """num / den; payda 0 ise ve sonuç NaN ise 0 döner."""
+    ratio = num / np.where(den == 0, np.nan, den)
+    ratio[np.isnan(ratio)] = 0
+    return ratio
+
+
+def _as_flag(mask: np.ndarray) -> np.ndarray:
+    return mask.astype(np.int64)
+
+
+def to_compact(values: Any, dtype: str) -> Any:
+    """
+    Diziyi kompakt dtype'a çevirir.
+
+    Tamsayı hedefte NaN, kesirli veya aralık dışı değer varsa bilgi
+    kaybetmemek için float32 kullanılır. Sayısal olmayan değerler
+    (örn. Categorical bin'ler) olduğu gibi döner.
+    """
+    if isinstance(values, pd.Series):
+        values = values.to_numpy()
+    if not isinstance(values, np.ndarray) or values.dtype.kind not in "biuf" or values.dtype == dtype:
+        return values
+
+    target = np.dtype(dtype)
+    if target.kind in "iu":
+        info = np.iinfo(target)
+        if values.dtype.kind == "f" and (np.isnan(values).any() or (values != np.round(values)).any()):
+            target = np.dtype(VALUE_DTYPE)
+        elif values.size and (values.min() < info.min or values.max() > info.max):
+            target = np.dtype(VALUE_DTYPE)
+    return values.astype(target)
+
+
+def compact_dtype(col: str) -> Optional[str]:
+    """Kompakt planda kolonun dtype'ı (ham kolon veya türev; yoksa None)."""
+    if col in RAW_DTYPES:
+        return RAW_DTYPES[col]
+    spec = FEATURES.get(col)
+    return spec.dtype if spec is not None else None
+
+
+def _widen(values: Any) -> Any:
+    """Kompakt tamsayıları kernel içinde int64'e açar (çarpımlar taşmasın)."""
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iu" and values.dtype.itemsize < 8:
+        return values.astype(np.int64)
+    return values
+
+
+# === Core numeric ===
+@register("RevolvingUtilizationOfUnsecuredLines_log1p", ["RevolvingUtilizationOfUnsecuredLines"], "core")
+def _util_log1p(util):
+    return np.log1p(util)
+
+
+@register("DebtRatio_log1p", ["DebtRatio"], "core")
+def _debt_log1p(debt):
+    return np.log1p(debt)
+
+
+@register("MonthlyIncome_log1p", ["MonthlyIncome"], "core")
+def _income_log1p(income):
+    return np.log1p(income)
+
+
+@register("DebtToIncomeRatio", ["DebtRatio", "MonthlyIncome"], "core")
+def _debt_to_income(debt, income):
+    return _safe_divide(debt, income)
+
+
+# Limitin üstüne çıkmış veya çok yakın (>= 1.0)
+@register("HighUtilizationFlag", ["RevolvingUtilizationOfUnsecuredLines"], "core", dtype=FLAG_DTYPE)
+def _high_utilization(util):
+    return _as_flag(util >= 1.0)
+
+
+# === Delinquency ===
+@register("TotalDelinquency", DELINQ_COLS, "delinquency", fallback=0, dtype=COUNT_DTYPE)
+def _total_delinquency(d30, d60, d90):
+    return np.nansum(np.stack([d30, d60, d90]), axis=0)
+
+
+@register("EverDelinquent", ["TotalDelinquency"], "delinquency", dtype=FLAG_DTYPE)
+def _ever_delinquent(total):
+    return _as_flag(total > 0)
+
+
+@register("Ever90DaysLate", ["NumberOfTimes90DaysLate"], "delinquency", fallback=0, dtype=FLAG_DTYPE)
+def _ever_90_days_late(d90):
+    return _as_flag(d90 > 0)
+
+
+@register("MultipleDelinquencyFlag", ["TotalDelinquency"], "delinquency", dtype=FLAG_DTYPE)
+def _multiple_delinquency(total):
+    return _as_flag(total >= 2)
+
+
+# 30–59: ×1, 60–89: ×2, 90+: ×3 (eksik kolon tek başına 0 sayılır)
+@register("DelinquencySeverityScore", DELINQ_COLS, "delinquency", dtype=COUNT_DTYPE, input_fallback=0)
+def _delinquency_severity(d30, d60, d90):
+    return d30 * 1 + d60 * 2 + d90 * 3
+
+
+# === Risk flags ===
+# En riskli ~%7–8'lik segment; eşik state'ten ya da batch quantile'ından
+@register("HighDebtFlag", ["DebtToIncomeRatio"], "risk", fallback=0, uses_state=True, dtype=FLAG_DTYPE)
+def _high_debt(dti, state=None):
+    if state is not None:
+        thr = state["high_debt_threshold"]
+    elif dti.size == 0 or np.isnan(dti).all():
+        thr = np.nan
+    else:
+        thr = np.nanquantile(dti, HIGH_DEBT_QUANTILE)
+    return _as_flag(dti >= thr)
+
+
+# === Binning ===
+def bin_codes(values: np.ndarray, bin_col: str) -> np.ndarray:
+    """
+    pd.cut ile aynı aralık semantiğiyle tamsayı bin kodları üretir
+    (np.searchsorted). Aralık dışı veya NaN değerler için -1 döner.
+    """
+    _, bins, labels, right = BIN_SPECS[bin_col]
+    return _cut_codes(values, bins, len(labels), right)
+
+
+def _cut_codes(values: np.ndarray, bins, n_labels: int, right: bool) -> np.ndarray:
+    """bin_codes'un sınırları açıkça verilen hali."""
+    values = np.asarray(values, dtype=np.float64)
+    side = "left" if right else "right"
+    codes = np.searchsorted(bins, values, side=side) - 1
+    codes[(codes < 0) | (codes >= n_labels) | np.isnan(values)] = -1
+    return codes
+
+
+def label_codes(values, bin_col: str) -> np.ndarray:
+    """
+    Bin label'larını (string veya Categorical) registry kodlarına çevirir.
+
+    NaN -> -1, BIN_SPECS'te olmayan label -> -2 (çağıran taraf karar verir).
+    """
+    labels = BIN_SPECS[bin_col][2]
+    series = pd.Series(values, copy=False)
+    lookup = {label: code for code, label in enumerate(labels)}
+    codes = series.astype(object).map(lookup)
+    unknown = codes.isna().to_numpy() & series.notna().to_numpy()
+    codes = np.array(codes.fillna(-1), dtype=np.int64)
+    codes[unknown] = -2
+    return codes
+
+
+def _bin_kernel(bin_col: str) -> Callable[[np.ndarray], pd.Categorical]:
+    """
+    Bin kolonu: int8 kodlar + metadata olarak label'lar.
+
+    pd.cut ile aynı (ordered) Categorical'ı üretir ama string eşleştirme
+    yapmadan, doğrudan searchsorted kodlarından kurar. Kodlar
+    `.cat.codes` ile (compiled scorer), label'lar ise kategori olarak
+    (dashboard / sklearn pipeline) okunabilir.
+    """
+    labels = BIN_SPECS[bin_col][2]
+
+    def kernel(values):
+        codes = bin_codes(values, bin_col).astype(np.int8)
+        return pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+
+    return kernel
+
+
+for _bin_col, (_source_col, *_rest) in BIN_SPECS.items():
+    register(_bin_col, [_source_col], "binning", dtype=None)(_bin_kernel(_bin_col))
+
+
+# === Interaction ===
+@register("Utilization_x_DebtRatio", ["RevolvingUtilizationOfUnsecuredLines", "DebtRatio"], "interaction")
+def _util_x_debt(util, debt):
+    return util * debt
+
+
+@register("Income_x_Age", ["MonthlyIncome", "age"], "interaction")
+def _income_x_age(income, age):
+    return income * age
+
+
+@register("Delinq_x_Utilization", ["TotalDelinquency", "RevolvingUtilizationOfUnsecuredLines"], "interaction")
+def _delinq_x_util(total, util):
+    return total * util
+
+
+@register(
+    "OpenLines_x_RealEstate",
+    ["NumberOfOpenCreditLinesAndLoans", "NumberRealEstateLoansOrLines"],
+    "interaction",
+    dtype=COUNT_DTYPE,
+)
+def _open_x_real_estate(open_lines, real_estate):
+    return open_lines * real_estate
+
+
+@register("HighUtil_x_DebtRatio", ["HighUtilizationFlag", "DebtRatio"], "interaction")
+def _high_util_x_debt(flag, debt):
+    return flag * debt
+
+
+# === Domain ===
+@register("EffectiveDebtLoad", ["DebtRatio", "MonthlyIncome"], "domain")
+def _effective_debt_load(debt, income):
+    return debt * income
+
+
+@register("CreditLineDensity", ["NumberOfOpenCreditLinesAndLoans", "age"], "domain")
+def _credit_line_density(open_lines, age):
+    return _safe_divide(open_lines, age)
+
+
+@register("RealEstateExposure", ["NumberRealEstateLoansOrLines", "DebtRatio"], "domain")
+def _real_estate_exposure(real_estate, debt):
+    return real_estate * debt
+
+
+@register("FinancialStressIndex", ["DebtRatio", "RevolvingUtilizationOfUnsecuredLines"], "domain")
+def _financial_stress(debt, util):
+    return np.log1p(debt * util)
+
+
+# === Varyantlar ===
+# Aynı kolonun alternatif tanımları. Varsayılan (FEATURES) tanımlar eğitimde
+# kullanılır; varyant adı verilen compute_features / apply_features çağrıları
+# o varyantta tanımlı kolonlar için varyant spec'ini, diğerleri için
+# varsayılanı kullanır. Hesaplama sırası her zaman FEATURES sırasıdır.
+VARIANTS: Dict[str, Dict[str, FeatureSpec]] = {}
+
+# 03_feature_engineering.ipynb tanımları (src.feature_engineering)
+NOTEBOOK = "notebook"
+NOTEBOOK_HIGH_DEBT_THRESHOLD = 0.4
+# IncomeBin: sol-kapalı aralıklar, eksik gelir 0 kabul edilir
+NOTEBOOK_INCOME_BINS = [0, 3000, 6000, 10000, np.inf]
+
+
+def register_variant(
+    variant: str,
+    name: str,
+    inputs: Iterable[str],
+    fallback: Optional[int] = None,
+    dtype: Optional[str] = VALUE_DTYPE,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Kayıtlı bir feature'ın alternatif tanımını ekleyen decorator.
+
+    Varyant aynı kolonu üretir ve aynı adıma (stage) aittir; girdileri ham
+    kolon veya kayıtlı türev olmalıdır.
+    """
+    inputs = tuple(inputs)
+    if name not in FEATURES:
+        raise ValueError(f"[{variant}/{name}] varsayılan tanımı olmayan varyant")
+    unknown = [c for c in inputs if c not in RAW_FEATURE_COLS and c not in FEATURES]
+    if unknown:
+        raise ValueError(f"[{variant}/{name}] bilinmeyen girdi kolonları: {unknown}")
+
+    def decorator(kernel: Callable[..., Any]) -> Callable[..., Any]:
+        spec = FeatureSpec(name, inputs, kernel, FEATURES[name].stage, fallback, False, dtype)
+        VARIANTS.setdefault(variant, {})[name] = spec
+        return kernel
+
+    return decorator
+
+
+def spec_for(name: str, variant: Optional[str] = None) -> FeatureSpec:
+    """Kolonun (varsa varyanttaki, yoksa varsayılan) tanımı."""
+    if variant is None:
+        return FEATURES[name]
+    if variant not in VARIANTS:
+        raise ValueError(f"Bilinmeyen feature varyantı: {variant}")
+    return VARIANTS[variant].get(name, FEATURES[name])
+
+
+def _fill0(values: np.ndarray) -> np.ndarray:
+    """NaN -> 0 (pandas fillna(0))."""
+    return np.where(np.isnan(values), 0, values)
+
+
+def _finite0(values: np.ndarray) -> np.ndarray:
+    """NaN / ±inf -> 0."""
+    return np.where(np.isfinite(values), values, 0)
+
+
+@register_variant(NOTEBOOK, "HighUtilizationFlag", ["RevolvingUtilizationOfUnsecuredLines"], dtype=FLAG_DTYPE)
+def _nb_high_utilization(util):
+    # Limit aşımı: > 1.0 (eğitim tanımı >= 1.0); NaN -> 0
+    return _as_flag(_fill0(util) > 1.0)
+
+
+@register_variant(NOTEBOOK, "Utilization_x_DebtRatio", ["RevolvingUtilizationOfUnsecuredLines", "DebtRatio"])
+def _nb_util_x_debt(util, debt):
+    return _fill0(util) * _finite0(debt)
+
+
+@register_variant(NOTEBOOK, "Delinq_x_Utilization", ["TotalDelinquency", "RevolvingUtilizationOfUnsecuredLines"])
+def _nb_delinq_x_util(total, util):
+    return total * _fill0(util)
+
+
+@register_variant(NOTEBOOK, "HighUtil_x_DebtRatio", ["HighUtilizationFlag", "DebtRatio"])
+def _nb_high_util_x_debt(flag, debt):
+    return flag * _finite0(debt)
+
+
+@register_variant(NOTEBOOK, "EffectiveDebtLoad", ["DebtRatio", "MonthlyIncome"])
+def _nb_effective_debt_load(debt, income):
+    return _finite0(debt) * _fill0(income)
+
+
+@register_variant(NOTEBOOK, "CreditLineDensity", ["NumberOfOpenCreditLinesAndLoans", "age"])
+def _nb_credit_line_density(open_lines, age):
+    return _finite0(_safe_divide(_fill0(open_lines), age))
+
+
+@register_variant(NOTEBOOK, "RealEstateExposure", ["NumberRealEstateLoansOrLines", "DebtRatio"])
+def _nb_real_estate_exposure(real_estate, debt):
+    return _fill0(real_estate) * _finite0(debt)
+
+
+@register_variant(NOTEBOOK, "FinancialStressIndex", ["DebtRatio", "RevolvingUtilizationOfUnsecuredLines"])
+def _nb_financial_stress(debt, util):
+    return np.log1p(_finite0(debt) * _fill0(util))
+
+
+# Sabit politika eşiği (eğitimde state / quantile eşiği); sadece
+# DebtToIncomeRatio hazırsa üretilir (fallback yok)
+@register_variant(NOTEBOOK, "HighDebtFlag", ["DebtToIncomeRatio"], dtype=FLAG_DTYPE)
+def _nb_high_debt(dti):
+    return _as_flag(_finite0(dti) > NOTEBOOK_HIGH_DEBT_THRESHOLD)
+
+
+def income_bin_kernel(bins: Iterable[float]) -> Callable[[np.ndarray], pd.Categorical]:
+    """
+    Notebook IncomeBin kernel'i: sol-kapalı aralıklar, eksik gelir 0.
+    (Varsayılan sınırlar NOTEBOOK_INCOME_BINS; deneysel sınırlar verilebilir.)
+    """
+    bins = list(bins)
+    labels = BIN_SPECS["IncomeBin"][2]
+
+    def kernel(income):
+        codes = _cut_codes(_fill0(np.asarray(income, dtype=np.float64)), bins, len(labels), False)
+        return pd.Categorical.from_codes(codes.astype(np.int8), categories=labels, ordered=True)
+
+    return kernel
+
+
+register_variant(NOTEBOOK, "IncomeBin", ["MonthlyIncome"], dtype=None)(income_bin_kernel(NOTEBOOK_INCOME_BINS))
+
+
+# === Plan / executor ===
+def stage_features(stage: str) -> List[str]:
+    """Bir preprocessing adımına ait feature'ları kayıt sırasıyla döner."""
+    return [name for name, spec in FEATURES.items() if spec.stage == stage]
+
+
+def dependencies(targets: Iterable[str]) -> Set[str]:
+    """Hedef feature'lar ve tüm ara türev bağımlılıkları (ham kolonlar hariç)."""
+    needed: Set[str] = set()
+    stack = [t for t in targets if t in FEATURES]
+    while stack:
+        name = stack.pop()
+        if name in needed:
+            continue
+        needed.add(name)
+        stack.extend(c for c in FEATURES[name].inputs if c in FEATURES)
+    return needed
+
+
+def downstream(columns: Iterable[str]) -> List[str]:
+    """
+    Verilen kolonlar değiştiğinde yeniden hesaplanması gereken türevler
+    (seçici yeniden hesaplama için).
+    """
+    dirty = set(columns)
+    affected = []
+    for name, spec in FEATURES.items():
+        if dirty.intersection(spec.inputs):
+            dirty.add(name)
+            affected.append(name)
+    return affected
+
+
+@dataclass(frozen=True)
+class FeaturePlan:
+    """
+    Çözülmüş hesaplama planı.
+
+    - levels   : Her seviye, birbirinden bağımsız (paralel çalışabilir)
+                 feature adlarından oluşur; seviyeler sırayla çalışır.
+    - fallbacks: Girdileri eksik olduğu için sabitle doldurulacak feature'lar
+    """
+
+    levels: Tuple[Tuple[str, ...], ...]
+    fallbacks: Tuple[str, ...]
+
+    @property
+    def order(self) -> List[str]:
+        """Üretilen kolonların kayıt (çıktı) sırası."""
+        planned = {name for level in self.levels for name in level}
+        planned.update(self.fallbacks)
+        return [name for name in FEATURES if name in planned]
+
+
+def _input_resolved(col: str, spec: FeatureSpec, resolved: set) -> bool:
+    return col in resolved or (spec.input_fallback is not None and col in RAW_FEATURE_COLS)
+
+
+@lru_cache(maxsize=128)
+def build_plan(
+    available: FrozenSet[str], targets: FrozenSet[str], variant: Optional[str] = None
+) -> FeaturePlan:
+    """
+    Mevcut kolonlar ve hedef feature'lar için planı bir kez çözer.
+
+    Bir hedef, girdilerinin tamamı mevcutsa (veya plan içinde daha önce
+    üretiliyorsa) hesaplanır; input_fallback'i varsa eksik ham girdiler
+    sabitle doldurularak yine hesaplanır; değilse fallback'i varsa sabitle
+    doldurulur, yoksa atlanır. Hedef kümesi dışındaki türevler hesaplanmaz.
+    `variant` verilirse o varyantta tanımlı kolonlar varyant spec'iyle çözülür.
+    """
+    resolved = set(available)
+    depth: Dict[str, int] = {}
+    fallbacks = []
+    for name in FEATURES:
+        if name not in targets:
+            continue
+        spec = spec_for(name, variant)
+        if all(_input_resolved(col, spec, resolved) for col in spec.inputs):
+            depth[name] = 1 + max((depth.get(col, 0) for col in spec.inputs), default=0)
+            resolved.add(name)
+        elif spec.fallback is not None:
+            fallbacks.append(name)
+            depth[name] = 0
+            resolved.add(name)
+
+    n_levels = max(depth.values(), default=0)
+    levels = tuple(
+        tuple(name for name in FEATURES if depth.get(name) == lvl and name not in fallbacks)
+        for lvl in range(1, n_levels + 1)
+    )
+    return FeaturePlan(levels=levels, fallbacks=tuple(fallbacks))
+
+
+def compute_features(
+    columns: Mapping[str, Any],
+    targets: Iterable[str],
+    state: Optional[dict] = None,
+    n_rows: Optional[int] = None,
+    n_jobs: int = 1,
+    timings: Optional[Dict[str, float]] = None,
+    compact: bool = False,
+    variant: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Hedef feature'ları hesaplar ve {kolon: dizi} sözlüğü döner.
+
+    - columns: Girdi kolonları (numpy dizisi veya Series; numpy'a çevrilir)
+    - targets: Hesaplanacak feature'lar (bağımlılıklar dahil edilmelidir,
+               bkz. `dependencies`)
+    - state  : Fit edilmiş preprocessing sabitleri (HighDebtFlag eşiği vb.)
+    - n_jobs : >1 ise aynı seviyedeki bağımsız feature'lar thread havuzunda
+               paralel hesaplanır (numpy ufunc'ları GIL'i bırakır)
+    - timings: Verilirse feature başına süre (ms) bu sözlüğe yazılır
+    - compact: True ise her feature üretilir üretilmez FeatureSpec.dtype'a
+               çevrilir; sonraki feature'lar kompakt girdiyle çalışır
+               (tamsayılar kernel içinde int64'e açılır, float32 korunur)
+    - variant: Verilirse (örn. NOTEBOOK) VARIANTS'taki alternatif tanımlar
+               kullanılır
+    """
+    plan = build_plan(frozenset(columns), frozenset(targets), variant)
+    values: Dict[str, Any] = {}
+
+    def lookup(col: str, spec: FeatureSpec) -> Any:
+        if col in values:
+            return values[col]
+        if col not in columns:
+            return np.full(n_rows, spec.input_fallback, dtype=np.int64)
+        value = columns[col]
+        return value.to_numpy() if isinstance(value, pd.Series) else value
+
+    if n_rows is None:
+        n_rows = len(next(iter(columns.values()))) if columns else 0
+
+    def run(name: str) -> Tuple[str, Any, float]:
+        spec = spec_for(name, variant)
+        start = time.perf_counter()
+        args = [lookup(col, spec) for col in spec.inputs]
+        if compact:
+            args = [_widen(a) for a in args]
+        result = spec.kernel(*args, state=state) if spec.uses_state else spec.kernel(*args)
+        if compact and spec.dtype is not None:
+            result = to_compact(result, spec.dtype)
+        return name, result, (time.perf_counter() - start) * 1000
+
+    for name in plan.fallbacks:
+        spec = spec_for(name, variant)
+        dtype = spec.dtype if compact and spec.dtype is not None else np.int64
+        values[name] = np.full(n_rows, spec.fallback, dtype=dtype)
+
+    pool = ThreadPoolExecutor(max_workers=n_jobs) if n_jobs > 1 else None
+    try:
+        for level in plan.levels:
+            if pool is not None and len(level) > 1:
+                results = list(pool.map(run, level))
+            else:
+                results = [run(name) for name in level]
+            for name, result, elapsed_ms in results:
+                values[name] = result
+                if timings is not None:
+                    timings[name] = elapsed_ms
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return {name: values[name] for name in plan.order}
+
+
+def apply_features(
+    df: pd.DataFrame,
+    targets: Iterable[str],
+    state: Optional[dict] = None,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """
+    DataFrame görünümü: hedef feature'ları hesaplar ve df'nin bir
+    kopyasına kolon olarak ekler (mevcut aynı isimli kolonların üzerine yazar).
+    Yeni kolonlar `targets` sırasıyla eklenir.
+    """
+    targets = list(targets)
+    df = df.copy()
+    columns = {col: df[col] for col in df.columns}
+    computed = compute_features(columns, targets, state, n_rows=len(df), **kwargs)
+    for name in sorted(computed, key=lambda n: targets.index(n) if n in targets else len(targets)):
+        df[name] = computed[name]
+    return df
@@ -10,16 +10,28 @@ modelin beklediği feature setine dönüştürür. Sonrasında
 final model üzerinden tahmin üretir.
 """
 
-from typing import Tuple
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
-from src.data_preprocessing import prepare_training
-from src.predict import predict_from_df
+from src.data_io import PARQUET_SUFFIXES, ChunkReader, _require_pyarrow, _suffix
+from src.data_preprocessing import (
+    STATE_INPUT_COLS,
+    compact_frame,
+    fit_preprocessing,
+    prepare_training,
+)
+from src.feature_registry import BIN_SPECS
+from src.payloads import frame_from_records, select_record_columns
+from src.predict import get_model_features, get_preprocessing_state, predict_from_df
 
 
-def predict_from_raw(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+def predict_from_raw(
+    df: pd.DataFrame,
+    engine: str = "auto",
+    compact: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
     """
     Ham Kaggle formatındaki veriyi alır, preprocessing yapar ve tahmin döner.
     
@@ -40,25 +52,195 @@ def predict_from_raw(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
             - NumberOfDependents
             - (SeriousDlqin2yrs opsiyonel - varsa düşülür)
     
+    Model paketinde fit edilmiş preprocessing sabitleri varsa bunlar
+    kullanılır; böylece her satırın skoru batch'in geri kalanından
+    bağımsızdır. Paketteki "features" listesine göre sadece modelin
+    tükettiği türev kolonlar hesaplanır. `engine` predict_from_df'e
+    iletilir ("sklearn", "compiled" veya "auto"). Varsayılan "auto":
+    bin kolonlarının integer kodları OneHotEncoder'a string olarak
+    gitmeden doğrudan one-hot slotlarına yazılır. `compact=True` ise
+    hazırlanan feature tablosu kompakt dtype planıyla (int8 / float32)
+    üretilir.
+
     Returns:
         y_pred  : (n,) -> 0/1 tahminler
         y_proba : (n,) -> default olasılığı
     """
     # 1) Ham veriyi preprocessing pipeline'ından geçir
-    df_prepared = prepare_training(df)
+    #    (sadece modelin kullandığı feature'lar hesaplanır)
+    df_prepared = prepare_training(
+        df,
+        state=get_preprocessing_state(),
+        fused=True,
+        features=get_model_features(),
+        compact=compact,
+    )
 
     # 2) Final model dosyası üzerinden tahmin al
-    y_pred, y_proba = predict_from_df(df_prepared)
+    y_pred, y_proba = predict_from_df(df_prepared, engine=engine)
     
     return y_pred, y_proba
 
 
+def iter_predict_chunks(
+    chunks: Iterable[pd.DataFrame],
+    raw: bool = True,
+    engine: str = "auto",
+    compact: bool = False,
+    state: Optional[dict] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Parça parça gelen veriyi (örn. pd.read_csv(..., chunksize=n)) skorlar.
+
+    Her parçaya Predicted_Label ve Default_Probability kolonları eklenip
+    aynı DataFrame geri verilir (kopya alınmaz; parçalar reader'a aittir).
+    Model paketi ModelRegistry üzerinden bir kez yüklenir.
+
+    Args:
+        chunks: DataFrame parçaları
+        raw: True ise ham Kaggle formatı (predict_from_raw), False ise
+             hazır feature tablosu (predict_from_df)
+        engine: predict_from_df motoru
+        compact: True ise her parça okunur okunmaz kompakt dtype planına
+                 çevrilir (compact_frame); çıktı parçası da kompakt kolonlarla
+                 döner
+        state: Ham veride tüm parçalara uygulanacak preprocessing sabitleri
+               (örn. fit_file_state ile dosyanın tamamından). Verilmezse
+               paketteki state kullanılır.
+
+    Not:
+        Ham veride ne `state` verilmiş ne de pakette state varsa medyan /
+        quantile her parçanın kendi istatistiklerinden hesaplanır; sonuçlar
+        parça boyutuna bağlı olur.
+    """
+    features = get_model_features()
+    if raw and state is None:
+        state = get_preprocessing_state()
+
+    for chunk in chunks:
+        if compact:
+            chunk = compact_frame(chunk)
+        if raw:
+            prepared = prepare_training(
+                chunk, state=state, fused=True, features=features, compact=compact
+            )
+            y_pred, y_proba = predict_from_df(prepared, engine=engine)
+        else:
+            y_pred, y_proba = predict_from_df(chunk, engine=engine)
+
+        chunk["Predicted_Label"] = y_pred
+        chunk["Default_Probability"] = y_proba
+        yield chunk
+
+
+def iter_predict_raw(
+    data: Union[pd.DataFrame, Sequence[Mapping[str, Any]]],
+    chunk_size: int,
+    engine: str = "auto",
+) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+    """
+    Bellekteki ham tabloyu veya kayıt listesini `chunk_size` satırlık
+    parçalar halinde skorlar.
+
+    Her parça bitince (başlangıç satırı, y_pred, y_proba) verilir; sonuçlar
+    biriktirilmez (örn. API'de NDJSON akışı). Kayıt listesinde her parçanın
+    DataFrame'i sadece o parçanın kayıtlarından kurulur; tüm isteğin tablosu
+    oluşturulmaz. Paket içinde preprocessing state yoksa medyan / quantile
+    parçalamadan önce bir kez, tüm veri üzerinden (sadece STATE_INPUT_COLS)
+    fit edilir; böylece sonuç predict_from_raw(tüm veri) ile birebir aynıdır.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size pozitif olmalı.")
+
+    is_frame = isinstance(data, pd.DataFrame)
+    if not is_frame:
+        # Tüm kayıtların kolon birleşimi: bir kolon sadece bazı parçalarda
+        # eksikse o parçada NaN olur (pd.DataFrame(tüm kayıtlar) gibi)
+        all_cols = list(dict.fromkeys(col for rec in data for col in rec))
+    state = get_preprocessing_state()
+    if state is None:
+        state_frame = data if is_frame else select_record_columns(data, STATE_INPUT_COLS)
+        state = fit_preprocessing(state_frame)
+    features = get_model_features()
+
+    for start in range(0, len(data), chunk_size):
+        if is_frame:
+            chunk = data.iloc[start:start + chunk_size]
+        else:
+            chunk = frame_from_records(data[start:start + chunk_size])
+            if len(chunk.columns) != len(all_cols):
+                chunk = chunk.reindex(columns=all_cols)
+        prepared = prepare_training(chunk, state=state, fused=True, features=features)
+        y_pred, y_proba = predict_from_df(prepared, engine=engine)
+        yield start, y_pred, y_proba
+
+
+def csv_dtypes(raw: bool) -> Optional[dict]:
+    """
+    Hazır feature tablosunda bin kolonları her zaman string okunmalı:
+    parça içinde sadece "0" / "1" gibi değerler varsa pandas DelinqBin'i
+    sayı sanar ve one-hot kategorileriyle eşleşmez.
+    """
+    return None if raw else {col: str for col in BIN_SPECS}
+
+
+def fit_file_state(path) -> dict:
+    """
+    Dosyanın tamamı üzerinden preprocessing state'i fit eder.
+
+    Sadece STATE_INPUT_COLS okunur (satır başı 4 float); tablonun geri
+    kalanı belleğe alınmaz. Sonuç fit_preprocessing(read_table(path)) ile
+    aynıdır.
+    """
+    if _suffix(path) in PARQUET_SUFFIXES:
+        pq = _require_pyarrow()
+        names = set(pq.read_schema(path).names)
+        columns = [c for c in STATE_INPUT_COLS if c in names]
+        return fit_preprocessing(pd.read_parquet(path, columns=columns))
+    return fit_preprocessing(pd.read_csv(path, usecols=lambda c: c in STATE_INPUT_COLS))
+
+
+def iter_predict_file(
+    reader: ChunkReader,
+    raw: bool = True,
+    engine: str = "auto",
+) -> Iterator[pd.DataFrame]:
+    """
+    ChunkReader'dan gelen parçaları skorlar (Predicted_Label ve
+    Default_Probability eklenmiş parça döner; kolonlar inference_pipeline
+    çıktısıyla aynıdır).
+
+    Ham veride paket içinde preprocessing state yoksa önce fit_file_state
+    ile tüm dosya üzerinden fit edilir; böylece sonuç parça boyutundan
+    bağımsızdır ve inference_pipeline(raw=True) ile birebir aynıdır.
+    İlerleme reader.progress() ile izlenebilir.
+    """
+    state = None
+    features = get_model_features()
+    if raw:
+        state = get_preprocessing_state()
+        if state is None:
+            state = fit_file_state(reader.path)
+
+    for chunk in reader:
+        if raw:
+            prepared = prepare_training(chunk, state=state, fused=True, features=features)
+            y_pred, y_proba = predict_from_df(prepared, engine=engine)
+        else:
+            y_pred, y_proba = predict_from_df(chunk, engine=engine)
+
+        chunk["Predicted_Label"] = y_pred
+        chunk["Default_Probability"] = y_proba
+        yield chunk
+
+
 if __name__ == "__main__":
     # Hızlı yerel test için mini örnek
     from src.config import RAW_TRAIN
+    from src.data_io import read_table
 
     print("Ham veri yükleniyor...")
-    df_raw = pd.read_csv(RAW_TRAIN)
+    df_raw = read_table(RAW_TRAIN)
 
     print(f"Ham veri shape: {df_raw.shape}")
     print("İlk 5 satır:")
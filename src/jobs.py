@@ -0,0 +1,482 @@
+# src/jobs.py
+
+"""
+Asenkron batch skorlama job'ları.
+
+Büyük portföyler HTTP bağlantısını açık tutmadan skorlanır: istemci bir
+dosya (yükleme veya sunucudaki yol) gönderir, job id alır, durumu /
+ilerlemeyi sorgular ve bitince sonucu indirir.
+
+- JobStore: job kayıtları yerel bir SQLite dosyasında (JOBS_DB) tutulur;
+  process yeniden başlasa da kaybolmaz.
+- JobManager: job'ları en fazla `max_workers` thread'lik bir havuzda
+  çalıştırır. Skorlama /predict/file ile aynı yoldan gider (ChunkReader +
+  src.inference.iter_predict_file); model paketi process içindeki
+  ModelRegistry önbelleğinden gelir.
+- Birden fazla process (örn. aynı JOBS_DB'yi paylaşan uvicorn worker'ları):
+  job tek bir koşullu UPDATE ile sahiplenilir (`JobStore.claim`); aynı job'u
+  sadece bir worker çalıştırır. Çalışan job'da sahip (host:pid) ve periyodik
+  heartbeat tutulur.
+- Restart: `start()` sadece sahibi ölmüş veya heartbeat'i eskimiş (running)
+  job'ları kuyruğa geri alır ve kuyruktaki job'ları çalıştırır; başka canlı
+  bir worker'ın job'una dokunulmaz. Job baştan skorlanır; sonuç önce geçici
+  dosyaya yazılıp bitince yerine taşındığı için yarım çıktı indirilemez.
+- Kapasite planı için job başına satır/sn, kuyrukta bekleme, çalışma
+  süresi, uçtan uca gecikme ve ortalama parça süresi kaydedilir.
+
+Kullanım:
+    manager = JobManager()
+    manager.start()
+    job = manager.submit(DATA_DIR / "portfolio.csv", raw=True)
+    manager.wait(job["id"])
+    print(manager.get(job["id"])["rows_per_sec"])
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.config import (
+    FILE_CHUNK_SIZE,
+    JOB_HEARTBEAT_S,
+    JOB_INPUT_DIR,
+    JOB_MAX_WORKERS,
+    JOB_STALE_S,
+    JOBS_DB,
+    JOBS_DIR,
+)
+from src.data_io import PARQUET_SUFFIXES, ChunkReader, ChunkWriter, _suffix
+from src.inference import csv_dtypes, iter_predict_file
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+_COLUMNS = [
+    "id", "status", "input_path", "output_path", "raw", "chunk_size", "owns_input",
+    "n_rows", "n_chunks", "progress", "error",
+    "created_at", "started_at", "finished_at",
+    "queue_s", "elapsed_s", "latency_s", "rows_per_sec", "avg_chunk_ms",
+    "owner", "heartbeat_at",
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    input_path TEXT NOT NULL,
+    output_path TEXT NOT NULL,
+    raw INTEGER NOT NULL,
+    chunk_size INTEGER NOT NULL,
+    owns_input INTEGER NOT NULL DEFAULT 0,
+    n_rows INTEGER NOT NULL DEFAULT 0,
+    n_chunks INTEGER NOT NULL DEFAULT 0,
+    progress REAL NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    queue_s REAL,
+    elapsed_s REAL,
+    latency_s REAL,
+    rows_per_sec REAL,
+    avg_chunk_ms REAL,
+    owner TEXT,
+    heartbeat_at REAL
+)
+"""
+
+# Eski JOBS_DB dosyalarına sonradan eklenen kolonlar
+_MIGRATIONS = {"owner": "TEXT", "heartbeat_at": "REAL"}
+
+
+def process_owner() -> str:
+    """Bu process'in job sahibi kimliği: "host:pid"."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _owner_is_dead(owner: str) -> bool:
+    """
+    Sahip aynı host'taysa pid'i yaşıyor mu bakılır. Başka host'taki sahip
+    için karar verilemez (False); orada sadece heartbeat belirleyicidir.
+    """
+    host, _, pid = owner.rpartition(":")
+    if host != socket.gethostname() or not pid.isdigit():
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except OSError:
+        # örn. PermissionError: process var ama başka kullanıcıya ait
+        return False
+    return False
+
+
+class JobStore:
+    """
+    SQLite tabanlı job kayıtları.
+
+    Her çağrı kendi bağlantısını açar; böylece API thread'leri ve worker
+    thread'leri aynı dosyayı güvenle paylaşır (WAL modu).
+    """
+
+    def __init__(self, path: Path = JOBS_DB):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            existing = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for name, sql_type in _MIGRATIONS.items():
+                if name not in existing:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {sql_type}")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def create(self, job: dict) -> None:
+        names = ", ".join(job)
+        marks = ", ".join("?" for _ in job)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(f"INSERT INTO jobs ({names}) VALUES ({marks})", list(job.values()))
+
+    def update(self, job_id: str, **fields) -> None:
+        unknown = set(fields) - set(_COLUMNS)
+        if unknown:
+            raise KeyError(f"Bilinmeyen job alanları: {sorted(unknown)}")
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", [*fields.values(), job_id])
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def list(self, status: Optional[str] = None, limit: int = 100) -> List[dict]:
+        query = "SELECT * FROM jobs"
+        params: list = []
+        if status is not None:
+            query += " WHERE status = ?"
+            params.append(status)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+        with closing(self._connect()) as conn:
+            return [dict(row) for row in conn.execute(query, params)]
+
+    def claim(self, job_id: str, owner: str, started_at: float) -> bool:
+        """
+        Kuyruktaki job'u tek bir koşullu UPDATE ile sahiplenir. Başka bir
+        worker / process önce davrandıysa (job artık queued değilse) False.
+        """
+        with closing(self._connect()) as conn, conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ?, owner = ?, heartbeat_at = ?, "
+                "error = NULL WHERE id = ? AND status = ?",
+                (RUNNING, started_at, owner, started_at, job_id, QUEUED),
+            )
+            return cursor.rowcount == 1
+
+    def heartbeat(self, owner: str) -> int:
+        """Sahibin çalışan job'larının heartbeat'ini günceller; sayısını döner."""
+        with closing(self._connect()) as conn, conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET heartbeat_at = ? WHERE owner = ? AND status = ?",
+                (time.time(), owner, RUNNING),
+            )
+            return cursor.rowcount
+
+    def requeue_running(self, stale_s: float = JOB_STALE_S) -> int:
+        """
+        Yarım kalan (running) job'lardan sahibi ölmüş (aynı host'ta pid yok)
+        veya heartbeat'i `stale_s` saniyeden eski olanları kuyruğa geri
+        alır; sayısını döner. Canlı bir worker'ın job'una dokunulmaz.
+        """
+        now = time.time()
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT id, owner, heartbeat_at FROM jobs WHERE status = ?", (RUNNING,)
+            ).fetchall()
+        orphaned = [
+            row for row in rows
+            if row["owner"] is None
+            or row["heartbeat_at"] is None
+            or now - row["heartbeat_at"] > stale_s
+            or _owner_is_dead(row["owner"])
+        ]
+
+        n_requeued = 0
+        with closing(self._connect()) as conn, conn:
+            for row in orphaned:
+                # Bu arada sahibi heartbeat yazdıysa veya job bittiyse dokunma
+                cursor = conn.execute(
+                    "UPDATE jobs SET status = ?, started_at = NULL, owner = NULL, heartbeat_at = NULL, "
+                    "n_rows = 0, n_chunks = 0, progress = 0 "
+                    "WHERE id = ? AND status = ? AND owner IS ? AND heartbeat_at IS ?",
+                    (QUEUED, row["id"], RUNNING, row["owner"], row["heartbeat_at"]),
+                )
+                n_requeued += cursor.rowcount
+        return n_requeued
+
+
+class JobManager:
+    """
+    Job'ları sınırlı bir thread havuzunda çalıştırır ve JobStore'a işler.
+
+    Args:
+        jobs_dir: Yüklenen girdilerin ve sonuç dosyalarının klasörü
+        db_path: SQLite dosyası (varsayılan jobs_dir / jobs.sqlite)
+        max_workers: Aynı anda çalışan en fazla job sayısı
+        input_dir: Yol ile gönderilen girdiler bu klasörün altında olmalı
+    """
+
+    def __init__(
+        self,
+        jobs_dir: Path = JOBS_DIR,
+        db_path: Optional[Path] = None,
+        max_workers: int = JOB_MAX_WORKERS,
+        input_dir: Path = JOB_INPUT_DIR,
+    ):
+        if max_workers <= 0:
+            raise ValueError("max_workers pozitif olmalı.")
+        self.jobs_dir = Path(jobs_dir)
+        self.db_path = Path(db_path) if db_path is not None else self.jobs_dir / JOBS_DB.name
+        self.max_workers = max_workers
+        self.input_dir = Path(input_dir).resolve()
+        self.store: Optional[JobStore] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+        self.owner = process_owner()
+
+    # --- yaşam döngüsü ---
+
+    def start(self) -> "JobManager":
+        """
+        Store'u açar, worker havuzunu ve heartbeat thread'ini başlatır,
+        sahibi ölmüş / heartbeat'i eskimiş job'ları kuyruğa alır ve
+        kuyruktaki job'ları çalıştırır. Tekrar çağrılırsa bir şey yapmaz.
+        """
+        store = self._open_store()
+        with self._lock:
+            if self._executor is not None:
+                return self
+            self._stopping.clear()
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="credit-risk-job"
+            )
+            self._heartbeat = threading.Thread(
+                target=self._heartbeat_loop, name="credit-risk-job-heartbeat", daemon=True
+            )
+            self._heartbeat.start()
+
+        n_requeued = store.requeue_running()
+        if n_requeued:
+            print(f"[INFO] {n_requeued} yarım kalan job yeniden kuyruğa alındı.")
+        for job in reversed(store.list(status=QUEUED, limit=-1)):
+            self._schedule(job["id"])
+        return self
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Havuzu kapatır. Çalışan job'lar bir sonraki parça sınırında durur ve
+        kuyrukta kalır; bir sonraki start() ile baştan çalışır.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        self._stopping.set()
+        executor.shutdown(wait=wait, cancel_futures=True)
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+            self._heartbeat = None
+
+    def __enter__(self) -> "JobManager":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+    def _open_store(self) -> JobStore:
+        """Store'u ilk kullanımda açar (import sırasında diske dokunulmaz)."""
+        with self._lock:
+            if self.store is None:
+                self.jobs_dir.mkdir(parents=True, exist_ok=True)
+                self.store = JobStore(self.db_path)
+            return self.store
+
+    # --- job'lar ---
+
+    def resolve_input(self, path) -> Path:
+        """
+        Yol ile gönderilen girdiyi doğrular: input_dir altında var olan bir
+        dosya olmalı (aksi halde ValueError).
+        """
+        resolved = Path(path)
+        if not resolved.is_absolute():
+            resolved = self.input_dir / resolved
+        resolved = resolved.resolve()
+        if not resolved.is_relative_to(self.input_dir):
+            raise ValueError(f"Girdi {self.input_dir} altında olmalı: {path}")
+        if not resolved.is_file():
+            raise ValueError(f"Girdi dosyası bulunamadı: {path}")
+        return resolved
+
+    def submit(
+        self,
+        input_path,
+        raw: bool = True,
+        chunk_size: int = FILE_CHUNK_SIZE,
+        owns_input: bool = False,
+    ) -> dict:
+        """
+        Yeni job oluşturup kuyruğa alır ve kaydını döner.
+
+        `owns_input=True` ise girdi (örn. API'ye yüklenen dosya) job'a aittir
+        ve job bitince silinir. Çıktı formatı girdiyle aynıdır (Parquet girdi
+        -> Parquet sonuç, aksi halde CSV).
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size pozitif olmalı.")
+        self.start()
+
+        job_id = uuid.uuid4().hex
+        suffix = ".parquet" if _suffix(input_path) in PARQUET_SUFFIXES else ".csv"
+        self.store.create(
+            {
+                "id": job_id,
+                "status": QUEUED,
+                "input_path": str(input_path),
+                "output_path": str(self.jobs_dir / f"{job_id}{suffix}"),
+                "raw": int(raw),
+                "chunk_size": chunk_size,
+                "owns_input": int(owns_input),
+                "created_at": time.time(),
+            }
+        )
+        self._schedule(job_id)
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """Job kaydı (bilinmeyen id için None)."""
+        job = self._open_store().get(job_id)
+        if job is not None:
+            job["raw"] = bool(job["raw"])
+            job["owns_input"] = bool(job["owns_input"])
+        return job
+
+    def list(self, status: Optional[str] = None, limit: int = 100) -> List[dict]:
+        return self._open_store().list(status=status, limit=limit)
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[dict]:
+        """Job bitene kadar bekler (bu process'te çalışıyorsa) ve kaydını döner."""
+        future = self._futures.get(job_id)
+        if future is not None:
+            future.result(timeout=timeout)
+        return self.get(job_id)
+
+    def _schedule(self, job_id: str) -> None:
+        with self._lock:
+            if self._executor is None:
+                return
+            future = self._executor.submit(self._run, job_id)
+            self._futures[job_id] = future
+        future.add_done_callback(lambda _: self._futures.pop(job_id, None))
+
+    def _heartbeat_loop(self) -> None:
+        """Bu process'in çalışan job'larına JOB_HEARTBEAT_S aralıkla heartbeat yazar."""
+        while not self._stopping.wait(JOB_HEARTBEAT_S):
+            try:
+                self.store.heartbeat(self.owner)
+            except sqlite3.Error as e:
+                print(f"[UYARI] Job heartbeat yazılamadı: {e}")
+
+    def _run(self, job_id: str) -> None:
+        job = self.get(job_id)
+        if job is None or job["status"] != QUEUED or self._stopping.is_set():
+            return
+
+        # Sahiplenme tek koşullu UPDATE: başka bir worker aldıysa çalıştırma
+        started_at = time.time()
+        if not self.store.claim(job_id, self.owner, started_at):
+            return
+        output_path = Path(job["output_path"])
+        partial_path = output_path.with_name(f"{output_path.stem}.partial{output_path.suffix}")
+        n_rows = 0
+        n_chunks = 0
+        start = time.perf_counter()
+
+        try:
+            with ChunkReader(job["input_path"], job["chunk_size"], dtype=csv_dtypes(job["raw"])) as reader, \
+                    ChunkWriter(partial_path) as writer:
+                for chunk in iter_predict_file(reader, raw=job["raw"]):
+                    writer.write(chunk)
+                    n_rows += len(chunk)
+                    n_chunks += 1
+                    self.store.update(
+                        job_id,
+                        n_rows=n_rows,
+                        n_chunks=n_chunks,
+                        progress=reader.progress(),
+                        heartbeat_at=time.time(),
+                    )
+                    if self._stopping.is_set():
+                        # Kapanış: job kuyrukta kalır, sonraki start() baştan çalıştırır
+                        self.store.update(
+                            job_id,
+                            status=QUEUED,
+                            started_at=None,
+                            owner=None,
+                            heartbeat_at=None,
+                            n_rows=0,
+                            n_chunks=0,
+                            progress=0,
+                        )
+                        partial_path.unlink(missing_ok=True)
+                        return
+            os.replace(partial_path, output_path)
+        except Exception as e:
+            partial_path.unlink(missing_ok=True)
+            self.store.update(
+                job_id, status=FAILED, error=f"{type(e).__name__}: {e}", finished_at=time.time()
+            )
+            self._release_input(job)
+            print(f"[UYARI] Job {job_id} başarısız: {e}")
+            return
+
+        elapsed = time.perf_counter() - start
+        rows_per_sec = n_rows / elapsed if elapsed > 0 else 0.0
+        finished_at = time.time()
+        self.store.update(
+            job_id,
+            status=DONE,
+            progress=1.0,
+            finished_at=finished_at,
+            queue_s=started_at - job["created_at"],
+            elapsed_s=elapsed,
+            latency_s=finished_at - job["created_at"],
+            rows_per_sec=rows_per_sec,
+            avg_chunk_ms=elapsed * 1000 / n_chunks if n_chunks else 0.0,
+        )
+        self._release_input(job)
+        print(f"[INFO] Job {job_id}: {n_rows} satır, {elapsed:.2f} sn | {rows_per_sec:,.0f} satır/sn")
+
+    @staticmethod
+    def _release_input(job: dict) -> None:
+        """Job'a ait (yüklenmiş) girdiyi siler; yol ile gönderilenlere dokunmaz."""
+        if job["owns_input"]:
+            Path(job["input_path"]).unlink(missing_ok=True)
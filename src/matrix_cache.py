@@ -0,0 +1,258 @@
+# src/matrix_cache.py
+
+"""
+Hazır feature matrisi için içerik adresli, memory-mapped disk önbelleği.
+
+Her eğitim / test / değerlendirme çalışması aynı veriyi yeniden parse edip
+(CSV) feature engineering uygulayıp sayısal matrise çeviriyor. Bu modül
+hazırlanmış tabloyu bir kez diske yazar:
+
+    <MATRIX_CACHE_DIR>/<key>/
+        X_<part>.npy     -> float32 (n, k) tasarım matrisi
+                            (bin kolonları kategori kodu olarak, NaN = -1)
+        y_<part>.npy     -> hedef vektörü (varsa)
+        schema.json      -> kolon sırası, bin label'ları, parçalar, meta
+
+ve sonraki çalışmalar `np.load(..., mmap_mode="r")` ile kopyasız açar.
+Anahtar; kaynak dosyanın içeriğinden (SHA-256), preprocessing / feature
+tanımlarının kaynak kodundan ve çağıranın verdiği parametrelerden üretilir.
+Bunlardan biri değişirse yeni bir giriş oluşur; eski girişler kendiliğinden
+kullanılmaz hale gelir.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.config import MATRIX_CACHE_DIR, SRC_DIR
+from src.feature_registry import BIN_SPECS, label_codes
+
+# Bu dosyalar değişirse (feature tanımları / temizlik) önbellek geçersizleşir
+_CODE_DEPENDENCIES = ["data_preprocessing.py", "feature_registry.py", "matrix_cache.py"]
+
+SCHEMA_FILE = "schema.json"
+
+
+def _sha256_file(path: Path, h=None) -> "hashlib._Hash":
+    h = h or hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h
+
+
+def cache_key(source_path, **params) -> str:
+    """
+    Kaynak dosya içeriği + feature kodu + parametrelerden önbellek anahtarı.
+    """
+    h = _sha256_file(Path(source_path))
+    for name in _CODE_DEPENDENCIES:
+        _sha256_file(SRC_DIR / name, h)
+    h.update(json.dumps(params, sort_keys=True, default=str).encode())
+    return h.hexdigest()[:32]
+
+
+@dataclass
+class FeatureMatrix:
+    """
+    Önbellekteki tek bir parça (örn. train / val).
+
+    X: float32 (n, k) memmap (kolon-major), kolonlar `columns` sırasında
+    y: hedef vektörü (memmap) veya None
+    categorical: bin kolonu -> label listesi (X'te kod olarak saklanır)
+    """
+
+    X: np.ndarray
+    y: Optional[np.ndarray]
+    columns: List[str]
+    categorical: Dict[str, List[str]]
+    target_col: Optional[str] = None
+
+    def __len__(self) -> int:
+        return self.X.shape[0]
+
+    def to_frame(self, include_target: bool = True) -> pd.DataFrame:
+        """
+        pandas DataFrame görünümü (sklearn pipeline'ı için).
+
+        Sayısal kolonlar float32 memmap'in kolonlarıdır; bin kolonları
+        kodlardan Categorical olarak (label'larla) kurulur.
+        """
+        data = {}
+        for i, col in enumerate(self.columns):
+            values = self.X[:, i]
+            if col in self.categorical:
+                codes = values.astype(np.int8)
+                data[col] = pd.Categorical.from_codes(codes, categories=self.categorical[col], ordered=True)
+            else:
+                data[col] = values
+        if include_target and self.y is not None and self.target_col is not None:
+            data = {self.target_col: self.y, **data}
+        return pd.DataFrame(data, copy=False)
+
+
+def _encode_frame(df: pd.DataFrame, target_col: Optional[str]):
+    """Hazır DataFrame -> (X float32, y, kolonlar, bin label'ları)."""
+    columns = [c for c in df.columns if c != target_col]
+    categorical = {}
+    # Kolon-major (Fortran): memmap'in her kolonu bitişik, to_frame kopyasız
+    X = np.empty((len(df), len(columns)), dtype=np.float32, order="F")
+
+    for i, col in enumerate(columns):
+        series = df[col]
+        if col in BIN_SPECS:
+            # Categorical veya CSV'den gelen string label'lar -> registry kodları
+            codes = label_codes(series, col)
+            if (codes == -2).any():
+                raise ValueError(f"'{col}' kolonunda bilinmeyen bin label'ları var.")
+            categorical[col] = list(BIN_SPECS[col][2])
+            X[:, i] = codes
+        elif pd.api.types.is_numeric_dtype(series.dtype):
+            X[:, i] = series.to_numpy(dtype=np.float32, na_value=np.nan)
+        else:
+            raise ValueError(f"'{col}' kolonu sayısal veya bilinen bir bin değil.")
+
+    y = None
+    if target_col is not None and target_col in df.columns:
+        y = df[target_col].to_numpy()
+    return X, y, columns, categorical
+
+
+class CacheEntry:
+    """Diskteki bir önbellek girişi: parçalar + meta."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path / SCHEMA_FILE, encoding="utf-8") as f:
+            self.schema = json.load(f)
+        self.meta: dict = self.schema.get("meta", {})
+
+    @property
+    def parts(self) -> List[str]:
+        return list(self.schema["parts"])
+
+    def __getitem__(self, part: str) -> FeatureMatrix:
+        if part not in self.schema["parts"]:
+            raise KeyError(f"Önbellekte '{part}' parçası yok: {self.parts}")
+        y_path = self.path / f"y_{part}.npy"
+        return FeatureMatrix(
+            X=np.load(self.path / f"X_{part}.npy", mmap_mode="r"),
+            y=np.load(y_path, mmap_mode="r") if y_path.exists() else None,
+            columns=self.schema["columns"],
+            categorical=self.schema["categorical"],
+            target_col=self.schema.get("target_col"),
+        )
+
+
+class MatrixCache:
+    """
+    İçerik adresli feature matrisi önbelleği.
+
+    Kullanım:
+        cache = MatrixCache()
+        key = cache_key(RAW_TRAIN, split="train/val", seed=SEED)
+        entry = cache.get(key)
+        if entry is None:
+            entry = cache.put(key, {"train": df_train, "val": df_val}, "SeriousDlqin2yrs")
+        X_train = entry["train"].X  # memmap, kopyasız
+    """
+
+    def __init__(self, cache_dir: Path = MATRIX_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        path = self.cache_dir / key
+        if not (path / SCHEMA_FILE).exists():
+            return None
+        return CacheEntry(path)
+
+    def put(
+        self,
+        key: str,
+        frames: Dict[str, pd.DataFrame],
+        target_col: Optional[str] = None,
+        meta: Optional[dict] = None,
+    ) -> CacheEntry:
+        """
+        Parçaları yazar. Önce geçici klasöre yazılıp atomik olarak taşınır;
+        yarım kalmış bir giriş hiçbir zaman okunmaz.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        final_path = self.cache_dir / key
+        tmp_path = Path(tempfile.mkdtemp(prefix=f".{key}-", dir=self.cache_dir))
+
+        try:
+            schema = None
+            for part, df in frames.items():
+                X, y, columns, categorical = _encode_frame(df, target_col)
+                if schema is None:
+                    schema = {
+                        "columns": columns,
+                        "categorical": categorical,
+                        "target_col": target_col,
+                        "parts": {},
+                        "meta": meta or {},
+                    }
+                elif columns != schema["columns"] or categorical != schema["categorical"]:
+                    raise ValueError(f"'{part}' parçasının şeması diğer parçalardan farklı.")
+
+                np.save(tmp_path / f"X_{part}.npy", X)
+                if y is not None:
+                    np.save(tmp_path / f"y_{part}.npy", y)
+                schema["parts"][part] = {"n_rows": int(X.shape[0])}
+
+            with open(tmp_path / SCHEMA_FILE, "w", encoding="utf-8") as f:
+                json.dump(schema, f, indent=2)
+
+            try:
+                os.replace(tmp_path, final_path)
+            except OSError:
+                # Başka bir process aynı anahtarı önce yazdı: onunkini kullan
+                shutil.rmtree(tmp_path, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            raise
+
+        return CacheEntry(final_path)
+
+    def get_or_build(
+        self,
+        key: str,
+        builder: Callable[[], Dict[str, pd.DataFrame]],
+        target_col: Optional[str] = None,
+        meta: Optional[dict] = None,
+    ) -> CacheEntry:
+        """Önbellekte yoksa `builder()` ile üretip yazar."""
+        entry = self.get(key)
+        if entry is None:
+            entry = self.put(key, builder(), target_col, meta)
+        return entry
+
+
+def load_prepared_matrix(
+    path=None,
+    target_col: Optional[str] = "SeriousDlqin2yrs",
+    cache_dir: Path = MATRIX_CACHE_DIR,
+) -> FeatureMatrix:
+    """
+    Hazır feature tablosunu (varsayılan: TRAINING_PREPARED) önbellekten
+    memory-mapped olarak açar; yoksa bir kez okuyup önbelleğe yazar.
+    """
+    from src.config import TRAINING_PREPARED
+    from src.data_io import read_table
+
+    path = Path(path or TRAINING_PREPARED)
+    key = cache_key(path, kind="prepared")
+
+    def build():
+        return {"all": read_table(path, dtype={col: str for col in BIN_SPECS})}
+
+    return MatrixCache(cache_dir).get_or_build(key, build, target_col)["all"]
@@ -0,0 +1,403 @@
+# src/metrics.py
+
+"""
+API için Prometheus metin formatında metrikler (harici bağımlılık yok).
+
+GET /metrics bu modüldeki `REGISTRY.render()` çıktısını döner; Prometheus
+veya `curl` ile doğrudan okunabilir, ayrı bir collector gerekmez.
+
+Ölçülenler:
+- credit_risk_requests_total{endpoint, method, status}: istek sayısı
+- credit_risk_request_latency_seconds{endpoint}: yanıt başlığına kadar süre
+- credit_risk_requests_in_flight: işlenmekte olan istek sayısı
+- credit_risk_stage_latency_seconds{stage}: /predict aşamaları
+    parse      : gövdenin çözülmesi (istek başına)
+    queue      : micro-batch kuyruğunda bekleme (istek başına)
+    preprocess : temizlik + feature engineering (batch başına)
+    predict    : model çağrısı (batch başına)
+    serialize  : yanıtın kodlanması (istek başına)
+- credit_risk_ready, credit_risk_cold_start_seconds{phase}: başlangıç
+  ısınması (bkz. src.warmup)
+- credit_risk_slo_*: /predict gecikmesinin config'teki TARGET_AVG / P95 /
+  P99_LATENCY_MS hedefleriyle karşılaştırılması (bkz. SloTracker)
+
+Batch boyutu histogramı ve model yükleme süresi gibi başka bileşenlerde
+zaten tutulan değerler `REGISTRY.add_collector` ile scrape anında okunur.
+"""
+
+import bisect
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.config import (
+    SLO_WINDOW_REQUESTS,
+    TARGET_AVG_LATENCY_MS,
+    TARGET_P95_LATENCY_MS,
+    TARGET_P99_LATENCY_MS,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Saniye cinsinden gecikme kovaları (tek kayıt ~ms, büyük batch ~sn)
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.2, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_sample(name: str, value: float, labels: Optional[Dict[str, str]] = None) -> str:
+    """Tek bir örnek satırı: name{k="v",...} değer."""
+    if labels:
+        body = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+        return f"{name}{{{body}}} {_format_value(value)}"
+    return f"{name} {_format_value(value)}"
+
+
+def format_header(name: str, kind: str, help_text: str) -> List[str]:
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} etiketleri {self.labelnames} olmalı: {sorted(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: LabelValues) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    @abstractmethod
+    def samples(self) -> Iterator[str]:
+        """Metriğin örnek satırları (HELP / TYPE başlıkları hariç)."""
+
+    def render(self) -> List[str]:
+        return format_header(self.name, self.kind, self.help_text) + list(self.samples())
+
+
+class Counter(_Metric):
+    """Sadece artan sayaç."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        if amount < 0:
+            raise ValueError("Counter azaltılamaz.")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield format_sample(self.name, value, self._labels(key))
+
+
+class Gauge(Counter):
+    """Artıp azalabilen anlık değer."""
+
+    kind = "gauge"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class Histogram(_Metric):
+    """Kümülatif kovalı histogram (_bucket / _sum / _count)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # etiket -> (kova sayıları [+Inf dahil], toplam)
+        self._values: Dict[LabelValues, Tuple[List[int], float]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)  # le: value <= sınır
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """with HISTOGRAM.time(stage="parse"): ... bloğunun süresini gözlemler."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        counts, _ = self._values.get(self._key(labels), ([0], 0.0))
+        return sum(counts)
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted((key, (list(c), t)) for key, (c, t) in self._values.items())
+        for key, (counts, total) in items:
+            yield from histogram_samples(self.name, self.buckets, counts, total, self._labels(key))
+
+
+def histogram_samples(
+    name: str,
+    buckets: Sequence[float],
+    counts: Sequence[int],
+    total: float,
+    labels: Optional[Dict[str, str]] = None,
+) -> Iterator[str]:
+    """Kova başına (kümülatif olmayan) sayılardan histogram satırları üretir."""
+    labels = labels or {}
+    cumulative = 0
+    for bound, count in zip(list(buckets) + [math.inf], counts):
+        cumulative += count
+        yield format_sample(f"{name}_bucket", cumulative, {**labels, "le": _format_value(bound)})
+    yield format_sample(f"{name}_sum", total, labels or None)
+    yield format_sample(f"{name}_count", cumulative, labels or None)
+
+
+class MetricsRegistry:
+    """Metrikleri ve scrape anında çağrılan collector'ları toplar."""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], Iterable[str]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[str]]) -> None:
+        """collector(): hazır metin satırları (HELP / TYPE dahil) döner."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+class SloTracker:
+    """
+    /predict gecikmesini config'teki hedeflerle karşılaştırır.
+
+    - Her istek için gecikme TARGET_P95 / TARGET_P99_LATENCY_MS'i aşarsa
+      credit_risk_slo_requests_over_target_total{target} artar.
+    - Gecikmeler `window` isteklik ardışık pencerelerde toplanır; pencere
+      dolunca ortalama, p95 ve p99 hesaplanır, hedefi aşan her değer için
+      credit_risk_slo_breaches_total{target} bir artar. Son pencerenin
+      değerleri credit_risk_slo_window_latency_seconds{stat} gauge'unda
+      görünür.
+    """
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        window: int = SLO_WINDOW_REQUESTS,
+        avg_ms: float = TARGET_AVG_LATENCY_MS,
+        p95_ms: float = TARGET_P95_LATENCY_MS,
+        p99_ms: float = TARGET_P99_LATENCY_MS,
+    ):
+        if window <= 0:
+            raise ValueError("window pozitif olmalı.")
+        self.window = window
+        self.targets_s = {"avg": avg_ms / 1000, "p95": p95_ms / 1000, "p99": p99_ms / 1000}
+        self._latencies: List[float] = []
+        self._lock = threading.Lock()
+
+        self.target = registry.register(
+            Gauge("credit_risk_slo_target_latency_seconds", "Config'teki gecikme hedefi.", ["target"])
+        )
+        self.over_target = registry.register(
+            Counter(
+                "credit_risk_slo_requests_over_target_total",
+                "Gecikmesi p95 / p99 hedefini aşan /predict istekleri.",
+                ["target"],
+            )
+        )
+        self.breaches = registry.register(
+            Counter(
+                "credit_risk_slo_breaches_total",
+                "Ortalama / p95 / p99 değeri hedefi aşan pencere sayısı.",
+                ["target"],
+            )
+        )
+        self.windows = registry.register(
+            Counter("credit_risk_slo_windows_total", "Değerlendirilen pencere sayısı.")
+        )
+        self.last_window = registry.register(
+            Gauge(
+                "credit_risk_slo_window_latency_seconds",
+                "Son pencerenin ortalama / p95 / p99 gecikmesi.",
+                ["stat"],
+            )
+        )
+        self.windows.inc(0)
+        for name, seconds in self.targets_s.items():
+            self.target.set(seconds, target=name)
+            self.breaches.inc(0, target=name)
+            if name != "avg":
+                self.over_target.inc(0, target=name)
+
+    def observe(self, latency_s: float) -> None:
+        for name in ("p95", "p99"):
+            if latency_s > self.targets_s[name]:
+                self.over_target.inc(target=name)
+
+        with self._lock:
+            self._latencies.append(latency_s)
+            if len(self._latencies) < self.window:
+                return
+            window, self._latencies = np.asarray(self._latencies), []
+
+        observed = {
+            "avg": float(window.mean()),
+            "p95": float(np.percentile(window, 95)),
+            "p99": float(np.percentile(window, 99)),
+        }
+        self.windows.inc()
+        for name, value in observed.items():
+            self.last_window.set(value, stat=name)
+            if value > self.targets_s[name]:
+                self.breaches.inc(target=name)
+
+
+# --- API'nin paylaştığı varsayılan metrikler ---
+
+REGISTRY = MetricsRegistry()
+
+REQUESTS = REGISTRY.register(
+    Counter("credit_risk_requests_total", "HTTP istek sayısı.", ["endpoint", "method", "status"])
+)
+REQUEST_LATENCY = REGISTRY.register(
+    Histogram(
+        "credit_risk_request_latency_seconds",
+        "İstek başından yanıt başlığına kadar geçen süre.",
+        ["endpoint"],
+    )
+)
+IN_FLIGHT = REGISTRY.register(
+    Gauge("credit_risk_requests_in_flight", "Şu anda işlenen istek sayısı.")
+)
+STAGE_LATENCY = REGISTRY.register(
+    Histogram(
+        "credit_risk_stage_latency_seconds",
+        "/predict aşama süreleri (parse / queue / serialize istek, preprocess / predict batch başına).",
+        ["stage"],
+    )
+)
+SLO = SloTracker(REGISTRY)
+IN_FLIGHT.set(0)
+READY = REGISTRY.register(
+    Gauge("credit_risk_ready", "Başlangıç ısınması bitti ve servis hazır mı (1/0).")
+)
+READY.set(0)
+COLD_START = REGISTRY.register(
+    Gauge(
+        "credit_risk_cold_start_seconds",
+        "Başlangıç ısınması aşama süreleri (model_load, scorer_build, batch_<n>, total).",
+        ["phase"],
+    )
+)
+
+
+def batcher_collector(batcher, buckets: Sequence[float]) -> Callable[[], List[str]]:
+    """MicroBatcher.stats() -> batch boyutu histogramı ve kuyruk derinliği."""
+
+    def collect() -> List[str]:
+        stats = batcher.stats()
+        name = "credit_risk_batch_size_rows"
+        lines = format_header(name, "histogram", "Micro-batch başına satır sayısı.")
+        lines += histogram_samples(
+            name, buckets, list(stats["batch_size_histogram"].values()), stats["n_rows"]
+        )
+        lines += format_header(
+            "credit_risk_batch_queue_depth", "gauge", "Micro-batch kuyruğunda bekleyen istek."
+        )
+        lines.append(format_sample("credit_risk_batch_queue_depth", stats["queue_depth"]))
+        return lines
+
+    return collect
+
+
+def model_collector(registry) -> Callable[[], List[str]]:
+    """ModelRegistry.stats() -> model yükleme süresi ve önbellek sayaçları."""
+
+    def collect() -> List[str]:
+        stats = registry.stats()
+        lines = format_header(
+            "credit_risk_model_loaded", "gauge", "Model paketi bellekte mi (1/0)."
+        )
+        lines.append(format_sample("credit_risk_model_loaded", int(stats["loaded"])))
+        lines += format_header(
+            "credit_risk_model_load_seconds", "gauge", "Son model yüklemesinin süresi."
+        )
+        lines.append(
+            format_sample("credit_risk_model_load_seconds", (stats["last_load_time_ms"] or 0.0) / 1000)
+        )
+        for key, help_text in [
+            ("cache_hits", "Model önbelleği isabetleri."),
+            ("cache_misses", "Model önbelleği ıskaları (yükleme)."),
+            ("reloads", "Dosya değiştiği için yapılan yeniden yüklemeler."),
+        ]:
+            name = f"credit_risk_model_{key}_total"
+            lines += format_header(name, "counter", help_text)
+            lines.append(format_sample(name, stats[key]))
+        return lines
+
+    return collect
@@ -0,0 +1,184 @@
+# src/parallel.py
+
+"""
+Çok çekirdekli batch skorlama.
+
+XGBoost sadece ağaç geçişini paralelleştirir; preprocessing (temizlik +
+feature engineering) tek çekirdekte çalışır. `ParallelScorer` girdiyi
+shard'lara böler ve her shard'ın preprocessing + tahmin adımlarını bir
+process havuzunda çalıştırır:
+
+- Her worker model paketini başlangıçta bir kez yükler (initializer).
+- Sonuçlar girdi sırasıyla birleştirilir.
+- Ham veride pakette preprocessing state yoksa medyan / quantile
+  sabitleri tüm girdi üzerinden bir kez fit edilip worker'lara gönderilir;
+  böylece sonuç, tek çekirdekte predict_from_raw(df) ile birebir aynıdır
+  (shard'lar kendi istatistiklerini hesaplamaz). Girdi büyük bir dosyanın
+  bir parçasıysa (streaming) çağıran taraf dosya geneli state'i `state=`
+  ile verir; aksi halde sonuç parça boyutuna bağlı olurdu.
+
+Kullanım:
+    with ParallelScorer(n_workers=4, shard_size=50_000) as scorer:
+        y_pred, y_proba = scorer.score(df_raw)
+        print(scorer.last_stats["rows_per_sec"])
+"""
+
+import multiprocessing as mp
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.data_preprocessing import fit_preprocessing, prepare_training
+from src.predict import get_model_features, get_model_registry, get_preprocessing_state, predict_from_df
+
+DEFAULT_SHARD_SIZE = 50_000
+
+
+def _init_worker(n_threads: int) -> None:
+    """
+    Worker başlangıcı: model paketini bir kez yükler ve XGBoost thread
+    sayısını worker başına sınırlar (çekirdekler aşırı paylaşılmasın).
+    """
+    package = get_model_registry().get()
+    model = package["model"]
+    xgb_model = model.named_steps["model"] if hasattr(model, "named_steps") else model
+    xgb_model.set_params(n_jobs=n_threads)
+    xgb_model.get_booster().set_param({"nthread": n_threads})
+
+
+def _score_shard(shard: pd.DataFrame, raw: bool, state: Optional[dict], engine: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Tek shard: (ham ise) preprocessing + tahmin."""
+    if raw:
+        shard = prepare_training(shard, state=state, fused=True, features=get_model_features())
+    return predict_from_df(shard, engine=engine)
+
+
+class ParallelScorer:
+    """
+    Process havuzu üzerinde shard bazlı batch skorlama.
+
+    Args:
+        n_workers: Worker process sayısı (varsayılan: CPU sayısı)
+        shard_size: Shard başına satır sayısı
+        engine: predict_from_df motoru ("sklearn", "compiled", "auto")
+
+    Havuz ilk `score` çağrısında açılır ve `close` (veya `with` bloğunun
+    sonu) ile kapanır; böylece aynı havuz birden çok batch için
+    (örn. streaming parçaları) tekrar kullanılır.
+    """
+
+    def __init__(
+        self,
+        n_workers: Optional[int] = None,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        engine: str = "auto",
+    ):
+        if shard_size <= 0:
+            raise ValueError("shard_size pozitif olmalı.")
+        self.n_workers = max(1, n_workers or os.cpu_count() or 1)
+        self.shard_size = shard_size
+        self.engine = engine
+        self.last_stats: dict = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "ParallelScorer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # fork + OpenMP (XGBoost) kilitlenebildiği için spawn
+            n_threads = max(1, (os.cpu_count() or 1) // self.n_workers)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                mp_context=mp.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(n_threads,),
+            )
+        return self._executor
+
+    def score(
+        self,
+        df: pd.DataFrame,
+        raw: bool = True,
+        state: Optional[dict] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        df'i shard'lara bölüp paralel skorlar.
+
+        Args:
+            df: Ham (raw=True) veya hazır feature tablosu (raw=False)
+            raw: Girdi ham Kaggle formatında mı?
+            state: Ham veride kullanılacak preprocessing sabitleri. Verilmezse
+                paketteki state, o da yoksa df üzerinden fit edilen state
+                kullanılır.
+
+        Returns:
+            y_pred, y_proba (girdi sırasıyla)
+        """
+        start = time.perf_counter()
+
+        if not raw:
+            state = None
+        elif state is None:
+            state = get_preprocessing_state()
+            if state is None:
+                # Tüm batch'in istatistikleri: tek çekirdekle aynı sonuç
+                state = fit_preprocessing(df)
+
+        shards = [df.iloc[i:i + self.shard_size] for i in range(0, len(df), self.shard_size)]
+
+        if self.n_workers == 1 or len(shards) <= 1:
+            results = [_score_shard(shard, raw, state, self.engine) for shard in shards]
+        else:
+            executor = self._get_executor()
+            n = len(shards)
+            results = list(executor.map(_score_shard, shards, [raw] * n, [state] * n, [self.engine] * n))
+
+        if results:
+            y_pred = np.concatenate([r[0] for r in results])
+            y_proba = np.concatenate([r[1] for r in results])
+        else:
+            y_pred, y_proba = np.array([], dtype=int), np.array([], dtype=np.float32)
+
+        elapsed = time.perf_counter() - start
+        self.last_stats = {
+            "n_rows": len(df),
+            "n_shards": len(shards),
+            "n_workers": self.n_workers,
+            "shard_size": self.shard_size,
+            "elapsed_s": elapsed,
+            "rows_per_sec": len(df) / elapsed if elapsed > 0 else 0.0,
+        }
+        return y_pred, y_proba
+
+
+def predict_parallel(
+    df: pd.DataFrame,
+    raw: bool = True,
+    n_workers: Optional[int] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tek seferlik paralel skorlama (havuz açılır, skorlanır, kapanır).
+    """
+    with ParallelScorer(n_workers=n_workers, shard_size=shard_size) as scorer:
+        y_pred, y_proba = scorer.score(df, raw=raw)
+        stats = scorer.last_stats
+
+    print(
+        f"[INFO] Paralel skorlama: {stats['n_rows']} satır, {stats['n_shards']} shard, "
+        f"{stats['n_workers']} worker | {stats['rows_per_sec']:,.0f} satır/sn"
+    )
+    return y_pred, y_proba
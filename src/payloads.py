@@ -0,0 +1,212 @@
+# src/payloads.py
+
+"""
+API istek gövdelerini ham Kaggle tablosuna çeviren yardımcılar.
+
+İki JSON formatı desteklenir:
+
+- Kayıt bazlı (records): [{"age": 45, "MonthlyIncome": 5000, ...}, ...]
+  Küçük / tek müşterilik istekler için doğal format.
+- Kolon bazlı (columns): {"age": [45, 52, ...], "MonthlyIncome": [5000, null, ...]}
+  Toplu çağıranlar için; her kolon doğrudan bir float64 numpy dizisine
+  dönüşür, satır satır dict pivotu yapılmaz. Eksik değer null.
+
+Binary formatlar (Content-Type / Accept ile seçilir, varsayılan JSON):
+
+- Arrow IPC stream (application/vnd.apache.arrow.stream)
+  İstek: ham feature tablosu. Yanıt: Predicted_Label (int8) ve
+  Default_Probability (float32) kolonlu tek record batch. pyarrow gerekir.
+- msgpack (application/msgpack)
+  İstek: {"records": [...]} veya {"columns": {kolon: liste | bytes}};
+  bytes değerler little-endian float64 dizisidir. Yanıt:
+  {"n_records", "predictions": bytes (int8), "probabilities": bytes
+  (little-endian float32)}. msgpack paketi gerekir.
+
+Yanıtlarda eleman başına Python nesnesi oluşturulmaz; diziler doğrudan
+buffer olarak yazılır.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from src.feature_registry import RAW_FEATURE_COLS
+
+JSON = "application/json"
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+MSGPACK = "application/msgpack"
+MSGPACK_TYPES = (MSGPACK, "application/x-msgpack")
+
+# Binary yanıtlardaki dtype'lar (little-endian)
+LABEL_DTYPE = np.dtype("<i1")
+PROBA_DTYPE = np.dtype("<f4")
+
+
+def frame_from_records(records: Union[Sequence[Mapping[str, Any]], pd.DataFrame]) -> pd.DataFrame:
+    """
+    Kayıt bazlı payload -> DataFrame (DataFrame ise olduğu gibi döner).
+
+    Küçük isteklerde bir kolonun tüm değerleri None olabilir (örn. tek
+    kayıtta eksik MonthlyIncome); pandas bunu object kolon yapar. Ham
+    feature kolonları float'a çevrilir (sayı olmayan değer ValueError).
+    """
+    if isinstance(records, pd.DataFrame):
+        return records
+    return _coerce_raw_numeric(pd.DataFrame(records))
+
+
+def _coerce_raw_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sayısal olmayan (object / string / kategorik) ham feature kolonlarını
+    float64'e çevirir; çevrilemeyen değerler ValueError (API'de 400) olur.
+    """
+    cast_cols = [
+        c for c in RAW_FEATURE_COLS if c in df.columns and not pd.api.types.is_numeric_dtype(df[c])
+    ]
+    if cast_cols:
+        try:
+            df[cast_cols] = df[cast_cols].astype(np.float64)
+        except (TypeError, ValueError) as e:
+            # örn. msgpack kayıtlarında iç içe map / liste, Arrow'da string kolon
+            raise ValueError(f"Ham feature değerleri sayısal olmalı: {e}") from None
+    return df
+
+
+def select_record_columns(records: Sequence[Mapping[str, Any]], columns: Sequence[str]) -> pd.DataFrame:
+    """
+    Kayıt listesinden sadece verilen kolonların DataFrame'ini kurar.
+
+    Tüm isteğin tablosu oluşturulmadan (örn. preprocessing state fit'i
+    için) birkaç kolon okunur. Hiçbir kayıtta olmayan kolon atlanır, bazı
+    kayıtlarda eksikse NaN olur.
+    """
+    present = [col for col in columns if any(col in rec for rec in records)]
+    return frame_from_columns({col: [rec.get(col) for rec in records] for col in present})
+
+
+def frame_from_columns(columns: Mapping[str, Sequence[Optional[float]]]) -> pd.DataFrame:
+    """
+    Kolon bazlı payload -> DataFrame (kolon başına tek numpy dizisi).
+
+    Tüm kolonlar aynı uzunlukta olmalıdır; aksi halde ValueError.
+    None değerler NaN olur.
+    """
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Kolon uzunlukları farklı: {sorted(lengths)}")
+
+    data: Dict[str, np.ndarray] = {col: _column_array(values) for col, values in columns.items()}
+    return pd.DataFrame(data, copy=False)
+
+
+def _column_array(values: Union[bytes, Sequence[Optional[float]]]) -> np.ndarray:
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        if len(values) % 8:
+            raise ValueError("Binary kolon uzunluğu 8'in katı olmalı (float64).")
+        return np.frombuffer(values, dtype="<f8")
+    try:
+        array = np.array(values, dtype=np.float64)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Kolon değerleri sayısal olmalı: {e}") from None
+    if array.ndim != 1:
+        raise ValueError("Kolon değerleri tek boyutlu bir dizi olmalı.")
+    return array
+
+
+def _require_msgpack():
+    try:
+        import msgpack
+    except ImportError as e:
+        raise ImportError("msgpack formatı için msgpack gerekli: pip install msgpack") from e
+    return msgpack
+
+
+def media_type(header: Optional[str]) -> str:
+    """Content-Type / Accept başlığından desteklenen format (yoksa JSON)."""
+    header = (header or "").lower()
+    if ARROW_STREAM in header:
+        return ARROW_STREAM
+    if any(t in header for t in MSGPACK_TYPES):
+        return MSGPACK
+    return JSON
+
+
+def decode_arrow(body: bytes) -> pd.DataFrame:
+    """
+    Arrow IPC stream -> ham feature tablosu.
+
+    Ham feature kolonları JSON / msgpack ile aynı şekilde float'a çevrilir
+    (string kolon ValueError).
+    """
+    from src.data_io import _require_pyarrow
+
+    _require_pyarrow()
+    import pyarrow as pa
+
+    with pa.ipc.open_stream(body) as reader:
+        return _coerce_raw_numeric(reader.read_all().to_pandas())
+
+
+def decode_msgpack(body: bytes) -> Union[List[Dict[str, Any]], pd.DataFrame]:
+    """
+    msgpack gövdesi -> kayıt listesi veya (columns ise) DataFrame.
+
+    ValueError: gövde bir map değilse, records / columns içermiyorsa veya
+    columns değerleri sayısal diziler değilse.
+    """
+    msgpack = _require_msgpack()
+    payload = msgpack.unpackb(body, raw=False)
+    if not isinstance(payload, dict):
+        raise ValueError("msgpack gövdesi bir map olmalı.")
+    if "columns" in payload and "records" not in payload:
+        if not isinstance(payload["columns"], dict):
+            raise ValueError("`columns` kolon adı -> değerler map'i olmalı.")
+        columns = {col: _column_array(values) for col, values in payload["columns"].items()}
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Kolon uzunlukları farklı: {sorted(lengths)}")
+        return pd.DataFrame(columns, copy=False)
+    if "records" in payload and "columns" not in payload:
+        return payload["records"]
+    raise ValueError("msgpack gövdesi `records` veya `columns` alanlarından birini içermeli.")
+
+
+def encode_arrow(y_pred: np.ndarray, y_proba: np.ndarray) -> bytes:
+    """Tahminler -> Arrow IPC stream (Predicted_Label int8, Default_Probability float32)."""
+    from src.data_io import _require_pyarrow
+
+    _require_pyarrow()
+    import pyarrow as pa
+
+    batch = pa.record_batch(
+        [
+            pa.array(np.asarray(y_pred, dtype=LABEL_DTYPE)),
+            pa.array(np.asarray(y_proba, dtype=PROBA_DTYPE)),
+        ],
+        names=["Predicted_Label", "Default_Probability"],
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
+
+
+def encode_msgpack(y_pred: np.ndarray, y_proba: np.ndarray) -> bytes:
+    """Tahminler -> msgpack map (diziler ham bytes olarak)."""
+    msgpack = _require_msgpack()
+    return msgpack.packb(
+        {
+            "n_records": len(y_pred),
+            "predictions": np.asarray(y_pred, dtype=LABEL_DTYPE).tobytes(),
+            "probabilities": np.asarray(y_proba, dtype=PROBA_DTYPE).tobytes(),
+        }
+    )
+
+
+def columns_from_frame(df: pd.DataFrame) -> Dict[str, List[Optional[float]]]:
+    """DataFrame -> kolon bazlı payload (NaN -> None); istemciler / testler için."""
+    return {
+        col: [None if np.isnan(v) else float(v) for v in df[col].to_numpy(dtype=np.float64)]
+        for col in df.columns
+    }
@@ -15,84 +15,146 @@ Kullanım:
 
     # Inference (hazır eğitim verisi üzerinden skor üretimi)
     python -m src.pipeline predict
+
+    # Streaming inference (büyük ham dosyalar, sabit bellek; --workers ile paralel)
+    python -m src.pipeline predict --input bureau.csv --output scores.csv \
+        --raw --chunksize 100000
+
+    # Kompakt dtype planı (int8 / float32; bellek ~yarıya iner)
+    python -m src.pipeline predict --input bureau.csv --raw --compact
+
+    # Eski bir model paketine (yeniden eğitmeden) preprocessing state ekleme
+    python -m src.pipeline attach-state --input data/cs-training.csv
+    python -m src.pipeline attach-state --state state.json
 """
 
+import argparse
+import contextlib
+import json
+import time
 from pathlib import Path
+from typing import Optional
 import pandas as pd
 import numpy as np
-import joblib
-from sklearn.model_selection import train_test_split
-from sklearn.compose import ColumnTransformer
-from sklearn.preprocessing import OneHotEncoder
-from sklearn.pipeline import Pipeline
-from xgboost import XGBClassifier
-from sklearn.model_selection import RandomizedSearchCV, StratifiedKFold
-from sklearn.metrics import (
-    roc_auc_score,
-    precision_score,
-    recall_score,
-    f1_score,
-)
 
 from src.config import (
     RAW_TRAIN,
     TRAINING_PREPARED,
-    DATA_DIR,
     MODELS_DIR,
     FINAL_MODEL,
     SEED,
     MODEL_PARAMS,
     SCALE_POS_WEIGHT,
     DEFAULT_THRESHOLD,
+    TRAINING_PREDICTIONS,
+)
+from src.data_preprocessing import (
+    PREPROCESSING_STATE_KEY,
+    compact_frame,
+    fit_preprocessing,
+    prepare_training,
 )
-from src.data_preprocessing import prepare_training
-from src.predict import predict_from_df
+from src.data_io import ChunkReader, ChunkWriter, read_table, write_table
+from src.matrix_cache import MatrixCache, cache_key
+from src.inference import csv_dtypes, fit_file_state, iter_predict_chunks, predict_from_raw
+from src.parallel import DEFAULT_SHARD_SIZE, ParallelScorer
+from src.predict import get_preprocessing_state, predict_from_df
+from src.profiling import profile
 
 
 def train_pipeline(
     input_path: Path = RAW_TRAIN,
     output_model_path: Path = FINAL_MODEL,
+    use_matrix_cache: bool = False,
 ) -> dict:
     """
     Tüm ML akışını gerçekleştiren training pipeline'ı.
     
     Adımlar:
     1. Ham veriyi yükle
-    2. Data cleaning + feature engineering uygula
-    3. Train/validation split
+    2. Train/validation split (ham veri üzerinde)
+    3. Preprocessing sabitlerini train set'ten fit et, data cleaning +
+       feature engineering uygula
     4. Preprocessing pipeline oluştur (ColumnTransformer)
     5. XGBoost modeli eğit (RandomizedSearchCV ile hiperparametre optimizasyonu)
     6. Validation set üzerinde değerlendirme (ROC-AUC, precision, recall, F1)
-    7. Model paketini kaydet (model + threshold + feature isimleri)
+    7. Model paketini kaydet (model + threshold + feature isimleri +
+       preprocessing sabitleri)
     
     Args:
         input_path: Ham eğitim verisi yolu
         output_model_path: Model kayıt yolu
+        use_matrix_cache: Hazır train/val matrislerini içerik adresli disk
+            önbelleğinden (src.matrix_cache, memory-mapped) oku / yaz
+            (opt-in; CLI: --matrix-cache). Önbellek boşsa model yine
+            bellekte hazırlanan tablolarla eğitilir, matrisler sadece
+            sonraki çalışmalar için yazılır.
     
     Returns:
         Eğitilmiş model, threshold ve feature isimlerini içeren sözlük
     """
+    # Eğitime özel ağır bağımlılıklar (sklearn model_selection / metrics,
+    # xgboost, joblib) sadece burada yüklenir; tahmin / serving yolu
+    # `import src.pipeline` ile bunları çekmez.
+    import joblib
+    from sklearn.compose import ColumnTransformer
+    from sklearn.metrics import f1_score, precision_score, recall_score, roc_auc_score
+    from sklearn.model_selection import RandomizedSearchCV, StratifiedKFold, train_test_split
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import OneHotEncoder
+    from xgboost import XGBClassifier
+
     print("=" * 60)
     print("TRAINING PIPELINE BAŞLADI")
     print("=" * 60)
     
-    # 1. Veri yükleme ve preprocessing
-    print("\n1. Veri yükleniyor ve preprocessing uygulanıyor...")
-    df_raw = pd.read_csv(input_path)
+    # 1. Veri yükleme
+    print("\n1. Veri yükleniyor...")
+    df_raw = read_table(input_path)
     print(f"   Ham veri shape: {df_raw.shape}")
     
-    df_prepared = prepare_training(df_raw)
-    print(f"   Hazırlanmış veri shape: {df_prepared.shape}")
-    
-    # 2. Train/validation split
+    # 2. Train/validation split (ham veri üzerinde; istatistikler sadece
+    #    train set'ten fit edilsin diye preprocessing'den önce yapılır)
     print("\n2. Train/validation split yapılıyor...")
     TARGET_COL = "SeriousDlqin2yrs"
-    X = df_prepared.drop(columns=[TARGET_COL])
-    y = df_prepared[TARGET_COL]
-    
-    X_train, X_val, y_train, y_val = train_test_split(
-        X, y, test_size=0.2, stratify=y, random_state=SEED
+    raw_train, raw_val = train_test_split(
+        df_raw, test_size=0.2, stratify=df_raw[TARGET_COL], random_state=SEED
     )
+    
+    def build_splits():
+        # Medyan / quantile sabitlerini fit et ve iki sete aynı şekilde uygula
+        state = fit_preprocessing(raw_train)
+        frames = {
+            "train": prepare_training(raw_train, state=state),
+            "val": prepare_training(raw_val, state=state),
+        }
+        return frames, state
+    
+    if use_matrix_cache:
+        # Aynı ham veri + aynı split + aynı feature kodu -> diskteki memmap'i kullan
+        cache = MatrixCache()
+        key = cache_key(input_path, split="train/val", test_size=0.2, seed=SEED)
+        entry = cache.get(key)
+        if entry is None:
+            frames, preprocessing_state = build_splits()
+            df_train, df_val = frames["train"], frames["val"]
+            cache.put(key, frames, TARGET_COL, meta={PREPROCESSING_STATE_KEY: preprocessing_state})
+        else:
+            print(f"   Hazır feature matrisi önbellekten açıldı: {entry.path}")
+            preprocessing_state = entry.meta[PREPROCESSING_STATE_KEY]
+            df_train = entry["train"].to_frame()
+            df_val = entry["val"].to_frame()
+    else:
+        frames, preprocessing_state = build_splits()
+        df_train, df_val = frames["train"], frames["val"]
+    print(f"   Fit edilen preprocessing sabitleri: {preprocessing_state}")
+    
+    print(f"   Hazırlanmış veri shape: {df_train.shape[0] + df_val.shape[0]} x {df_train.shape[1]}")
+    
+    X_train = df_train.drop(columns=[TARGET_COL])
+    y_train = df_train[TARGET_COL]
+    X_val = df_val.drop(columns=[TARGET_COL])
+    y_val = df_val[TARGET_COL]
     print(f"   Train set: {X_train.shape[0]} gözlem")
     print(f"   Validation set: {X_val.shape[0]} gözlem")
     
@@ -181,6 +243,7 @@ def train_pipeline(
         "model": xgb_best,
         "threshold": DEFAULT_THRESHOLD,
         "features": all_feature_names,
+        PREPROCESSING_STATE_KEY: preprocessing_state,
     }
     
     joblib.dump(final_artifact, output_model_path)
@@ -193,9 +256,61 @@ def train_pipeline(
     return final_artifact
 
 
+def attach_state_pipeline(
+    input_path: Optional[Path] = None,
+    state_path: Optional[Path] = None,
+    model_path: Path = FINAL_MODEL,
+) -> dict:
+    """
+    Mevcut bir model paketine preprocessing state ekler (yeniden eğitim yok).
+
+    `preprocessing` alanı olmayan eski paketlerde her serving yolu medyanları
+    ve HighDebtFlag eşiğini skorlanan batch'ten fit eder; skorlar batch'e
+    bağlı olur. Bu adım state'i bir kez pakete yazar.
+
+    Args:
+        input_path: Ham eğitim verisi; state buradan fit edilir
+            (sadece STATE_INPUT_COLS okunur)
+        state_path: Alternatif olarak hazır state sözlüğü (JSON)
+        model_path: Güncellenecek model paketi
+
+    Returns:
+        Pakete yazılan state sözlüğü
+    """
+    import joblib
+
+    if state_path is not None:
+        state = json.loads(Path(state_path).read_text())
+        source = state_path
+    else:
+        input_path = input_path or RAW_TRAIN
+        state = fit_file_state(input_path)
+        source = input_path
+
+    missing = {"age_median", "income_median", "dependents_median", "high_debt_threshold"} - set(state)
+    if missing:
+        raise ValueError(f"Preprocessing state eksik alanlar içeriyor: {sorted(missing)}")
+    state = {key: float(state[key]) for key in sorted(state)}
+
+    package = joblib.load(model_path)
+    package[PREPROCESSING_STATE_KEY] = state
+    joblib.dump(package, model_path)
+
+    print(f"[INFO] Preprocessing state ({source}) pakete eklendi: {model_path}")
+    for key, value in state.items():
+        print(f"   {key}: {value}")
+
+    return state
+
+
 def inference_pipeline(
     input_path: Path = TRAINING_PREPARED,
     output_path: Path | None = None,
+    raw: bool = False,
+    n_workers: int | None = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    columns: list | None = None,
+    compact: bool = False,
 ) -> pd.DataFrame:
     """
     Inference pipeline: Eğitilmiş model ile tahmin alma.
@@ -203,6 +318,15 @@ def inference_pipeline(
     Args:
         input_path: Tahmin yapılacak veri yolu
         output_path: Sonuçların kaydedileceği yol (opsiyonel)
+        raw: True ise girdi ham Kaggle formatındadır (predict_from_raw)
+        n_workers: Verilirse (> 1) preprocessing + tahmin bu kadar process'e
+                   shard_size satırlık parçalar halinde dağıtılır (ParallelScorer)
+        shard_size: Paralel modda shard başına satır sayısı
+        columns: Sadece bu kolonları oku (örn. modelin kullandığı kolonlar)
+        compact: Okunan tabloya kompakt dtype planını uygula (int8 / float32,
+                 bin'ler kategori kodu; bkz. compact_frame)
+    
+    Girdi / çıktı formatı uzantıdan seçilir (.csv veya .parquet, bkz. src.data_io).
     
     Returns:
         Tahmin sonuçları DataFrame
@@ -212,18 +336,31 @@ def inference_pipeline(
     print("=" * 60)
     
     print(f"\nVeri yükleniyor: {input_path}")
-    df = pd.read_csv(input_path)
-    print(f"Veri shape: {df.shape}")
+    df = read_table(input_path, columns=columns, dtype=csv_dtypes(raw))
+    if compact:
+        df = compact_frame(df)
+    print(f"Veri shape: {df.shape} | {df.memory_usage(deep=True).sum() / 1e6:,.1f} MB")
     
     print("\nTahmin yapılıyor...")
-    y_pred, y_proba = predict_from_df(df)
+    if n_workers and n_workers > 1:
+        with ParallelScorer(n_workers=n_workers, shard_size=shard_size) as scorer:
+            y_pred, y_proba = scorer.score(df, raw=raw)
+            stats = scorer.last_stats
+        print(
+            f"   {stats['n_shards']} shard, {stats['n_workers']} worker | "
+            f"{stats['rows_per_sec']:,.0f} satır/sn"
+        )
+    elif raw:
+        y_pred, y_proba = predict_from_raw(df, compact=compact)
+    else:
+        y_pred, y_proba = predict_from_df(df)
     
     result_df = df.copy()
     result_df["Predicted_Label"] = y_pred
     result_df["Default_Probability"] = y_proba
     
     if output_path is not None:
-        result_df.to_csv(output_path, index=False)
+        write_table(result_df, output_path)
         print(f"\nSonuçlar kaydedildi: {output_path}")
     
     print("\n" + "=" * 60)
@@ -233,14 +370,215 @@ def inference_pipeline(
     return result_df
 
 
-if __name__ == "__main__":
-    import sys
-    
-    if len(sys.argv) > 1 and sys.argv[1] == "train":
+def _iter_parallel_chunks(
+    chunks, scorer: ParallelScorer, raw: bool, compact: bool = False, state: Optional[dict] = None
+):
+    """iter_predict_chunks'ın ParallelScorer ile skorlayan karşılığı."""
+    for chunk in chunks:
+        if compact:
+            chunk = compact_frame(chunk)
+        y_pred, y_proba = scorer.score(chunk, raw=raw, state=state)
+        chunk["Predicted_Label"] = y_pred
+        chunk["Default_Probability"] = y_proba
+        yield chunk
+
+
+def stream_inference_pipeline(
+    input_path: Path,
+    output_path: Path,
+    chunksize: int = 100_000,
+    raw: bool = False,
+    n_workers: int | None = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    compact: bool = False,
+) -> dict:
+    """
+    Streaming inference: girdiyi `chunksize` satırlık parçalar halinde okur,
+    her parçayı skorlar ve sonucu çıktı dosyasına ekleyerek yazar.
+
+    Bellek kullanımı dosya boyutuna değil parça boyutuna bağlıdır; sonuçlar
+    ilk parçadan itibaren diske yazılır. Çıktı kolonları inference_pipeline
+    ile aynıdır.
+
+    Ham veride preprocessing state (paketteki, yoksa fit_file_state ile
+    dosyanın tamamından bir kez fit edilen) tüm parçalara aynen uygulanır;
+    skorlar parça boyutundan ve worker sayısından bağımsızdır.
+
+    Args:
+        input_path: Tahmin yapılacak CSV / Parquet yolu
+        output_path: Sonuçların yazılacağı CSV / Parquet yolu (varsa üzerine yazılır)
+        chunksize: Parça başına satır sayısı
+        raw: True ise girdi ham Kaggle formatındadır (predict_from_raw)
+        n_workers: Verilirse (> 1) her parça ParallelScorer ile shard'lara
+                   bölünüp paralel skorlanır (havuz tüm parçalar için ortak)
+        shard_size: Paralel modda shard başına satır sayısı
+        compact: Her parçaya kompakt dtype planını uygula (bkz. compact_frame)
+
+    Returns:
+        Özet: {"n_rows", "n_chunks", "elapsed_s", "rows_per_sec"}
+    """
+    if chunksize <= 0:
+        raise ValueError("chunksize pozitif olmalı.")
+
+    print("=" * 60)
+    print("STREAMING INFERENCE BAŞLADI")
+    print("=" * 60)
+    print(f"\nGirdi: {input_path} | Çıktı: {output_path} | chunksize: {chunksize}")
+
+    state = None
+    if raw:
+        state = get_preprocessing_state()
+        if state is None:
+            print(
+                "[INFO] Model paketinde preprocessing sabitleri yok; medyan / quantile "
+                "dosyanın tamamından bir kez fit ediliyor."
+            )
+            state = fit_file_state(input_path)
+
+    scorer = ParallelScorer(n_workers, shard_size) if n_workers and n_workers > 1 else None
+    n_rows = 0
+    n_chunks = 0
+    start = time.perf_counter()
+
+    with contextlib.ExitStack() as stack:
+        reader = stack.enter_context(ChunkReader(input_path, chunksize, dtype=csv_dtypes(raw)))
+        writer = stack.enter_context(ChunkWriter(output_path))
+        if scorer is None:
+            scored = iter_predict_chunks(reader, raw=raw, compact=compact, state=state)
+        else:
+            stack.enter_context(scorer)
+            scored = _iter_parallel_chunks(reader, scorer, raw, compact, state)
+
+        for chunk in scored:
+            writer.write(chunk)
+            n_rows += len(chunk)
+            n_chunks += 1
+
+            elapsed = time.perf_counter() - start
+            print(
+                f"   [{reader.progress():6.1%}] parça {n_chunks}: {n_rows} satır | "
+                f"{n_rows / elapsed:,.0f} satır/sn"
+            )
+
+    elapsed = time.perf_counter() - start
+    summary = {
+        "n_rows": n_rows,
+        "n_chunks": n_chunks,
+        "elapsed_s": elapsed,
+        "rows_per_sec": n_rows / elapsed if elapsed > 0 else 0.0,
+    }
+
+    print(f"\nSonuçlar kaydedildi: {output_path}")
+    print(f"Toplam: {n_rows} satır, {n_chunks} parça, {elapsed:.1f} sn")
+    print("\n" + "=" * 60)
+    print("STREAMING INFERENCE TAMAMLANDI")
+    print("=" * 60)
+
+    return summary
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Kredi risk modeli train / predict pipeline'ı")
+    parser.add_argument(
+        "command", nargs="?", choices=["train", "predict", "attach-state"], default="predict"
+    )
+    parser.add_argument("--input", type=Path, default=None, help="Girdi CSV yolu")
+    parser.add_argument("--output", type=Path, default=None, help="Çıktı CSV yolu")
+    parser.add_argument(
+        "--state",
+        type=Path,
+        default=None,
+        help="attach-state ile: --input yerine pakete yazılacak hazır state (JSON)",
+    )
+    parser.add_argument(
+        "--matrix-cache",
+        action="store_true",
+        help="train ile: hazır train/val matrislerini data/matrix_cache önbelleğinden oku / yaz",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="Verilirse girdi bu boyutta parçalar halinde okunup skorlanır (streaming)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Paralel skorlama için worker process sayısı (> 1 ise ParallelScorer)",
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=DEFAULT_SHARD_SIZE,
+        help="Paralel modda shard başına satır sayısı",
+    )
+    parser.add_argument(
+        "--raw",
+        action="store_true",
+        help="Girdi ham Kaggle formatında (preprocessing uygulanır)",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Kompakt dtype planı (int8 bayrak / sayaç, float32 oran, bin kodları)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Aşama bazında süre / satır / bellek profili yazdır (worker process'ler hariç)",
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=Path,
+        default=None,
+        help="--profile ile birlikte: profil raporunu bu JSON dosyasına da yaz",
+    )
+    return parser.parse_args(argv)
+
+
+def _run_command(args: argparse.Namespace) -> None:
+    if args.command == "train":
         # Training mode
-        train_pipeline()
+        train_pipeline(input_path=args.input or RAW_TRAIN, use_matrix_cache=args.matrix_cache)
+    elif args.command == "attach-state":
+        attach_state_pipeline(input_path=args.input, state_path=args.state)
     else:
         # Inference mode (default)
-        default_output = DATA_DIR / "training_predictions.csv"
-        inference_pipeline(TRAINING_PREPARED, default_output)
+        input_path = args.input or TRAINING_PREPARED
+        output_path = args.output or TRAINING_PREDICTIONS
+        if args.chunksize:
+            stream_inference_pipeline(
+                input_path,
+                output_path,
+                args.chunksize,
+                raw=args.raw,
+                n_workers=args.workers,
+                shard_size=args.shard_size,
+                compact=args.compact,
+            )
+        else:
+            inference_pipeline(
+                input_path,
+                output_path,
+                raw=args.raw,
+                n_workers=args.workers,
+                shard_size=args.shard_size,
+                compact=args.compact,
+            )
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+
+    if not args.profile:
+        _run_command(args)
+    else:
+        with profile() as report:
+            _run_command(args)
 
+        print("\nPROFİL (aşama bazında)")
+        print(report.format())
+        if args.profile_output is not None:
+            args.profile_output.write_text(json.dumps(report.to_dict(), indent=2))
+            print(f"Profil kaydedildi: {args.profile_output}")
@@ -11,22 +11,186 @@ Model paketi yapısı:
     {
         "model":    Pipeline veya estimator (XGBClassifier),
         "threshold": float (ör. 0.81),
-        "features":  list[str] (isteğe bağlı – açıklama amaçlı)
+        "features":  list[str] (isteğe bağlı – açıklama amaçlı),
+        "preprocessing": dict (isteğe bağlı – fit edilmiş medyan/quantile
+                         sabitleri, bkz. data_preprocessing.fit_preprocessing)
     }
+
+Model paketi process başına bir kez yüklenir ve `ModelRegistry` içinde
+önbelleğe alınır. Dosya değişirse (mtime / boyut / SHA-256) yeni paket
+atomik olarak devreye alınır (hot reload).
 """
 
-from typing import Tuple
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import joblib
 import numpy as np
 import pandas as pd
 
 from src.config import FINAL_MODEL
+from src.data_preprocessing import PREPROCESSING_STATE_KEY
+from src.profiling import profiled, stage
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    """Yüklenmiş model paketi ve onu üreten dosyanın parmak izi."""
+
+    package: dict
+    fingerprint: Tuple[int, int]  # (st_mtime_ns, st_size)
+    sha256: str
+    loaded_at: float
+    load_time_ms: float
+
+
+def _file_sha256(path: Path) -> str:
+    """Dosyanın SHA-256 özetini parça parça okuyarak hesaplar."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ModelRegistry:
+    """
+    Final model paketini process başına bir kez yükleyen thread-safe önbellek.
+
+    - `get()` her çağrıda sadece `os.stat` yapar; dosya değişmediyse
+      önbellekteki paket döner (cache hit).
+    - mtime veya boyut değiştiyse dosyanın SHA-256 özeti hesaplanır.
+      İçerik gerçekten değiştiyse paket yeniden yüklenir ve tek bir referans
+      ataması ile atomik olarak değiştirilir. Eski paketi kullanan istekler
+      kendi referanslarıyla tamamlanır.
+    - `stats()` yükleme süresi, hit/miss ve reload sayılarını döner; böylece
+      istek başı gecikmenin TARGET_AVG_LATENCY_MS hedefini karşılayıp
+      karşılamadığı izlenebilir.
+    """
+
+    def __init__(self, path: Path = FINAL_MODEL, verify_hash: bool = True):
+        self.path = Path(path)
+        self.verify_hash = verify_hash
+        self._lock = threading.Lock()
+        self._entry: Optional[_CacheEntry] = None
+        self._derived: Dict[str, Tuple[dict, Any]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._reloads = 0
+        self._total_load_time_ms = 0.0
+
+    def _fingerprint(self) -> Tuple[int, int]:
+        st = os.stat(self.path)
+        return st.st_mtime_ns, st.st_size
+
+    def get(self) -> dict:
+        """
+        Güncel model paketini döner; gerekirse diskten (yeniden) yükler.
+        """
+        fingerprint = self._fingerprint()
+        entry = self._entry
+        if entry is not None and entry.fingerprint == fingerprint:
+            with self._lock:
+                self._hits += 1
+            return entry.package
+
+        with self._lock:
+            # Lock beklerken başka bir thread yüklemiş olabilir
+            entry = self._entry
+            if entry is not None and entry.fingerprint == fingerprint:
+                self._hits += 1
+                return entry.package
+
+            sha256 = _file_sha256(self.path) if self.verify_hash else ""
+            if entry is not None and self.verify_hash and entry.sha256 == sha256:
+                # Sadece mtime değişmiş (örn. touch); içerik aynı
+                self._entry = _CacheEntry(
+                    package=entry.package,
+                    fingerprint=fingerprint,
+                    sha256=sha256,
+                    loaded_at=entry.loaded_at,
+                    load_time_ms=entry.load_time_ms,
+                )
+                self._hits += 1
+                return entry.package
+
+            # joblib import'u (~200 ms) ilk yüklemeye ertelenir; `import app.api`
+            # bunu ödemez, maliyet ısınma (src.warmup) sırasında ödenir
+            import joblib
+
+            start = time.perf_counter()
+            package = joblib.load(self.path)
+            load_time_ms = (time.perf_counter() - start) * 1000
+
+            self._misses += 1
+            if entry is not None:
+                self._reloads += 1
+            self._total_load_time_ms += load_time_ms
+            self._entry = _CacheEntry(
+                package=package,
+                fingerprint=fingerprint,
+                sha256=sha256,
+                loaded_at=time.time(),
+                load_time_ms=load_time_ms,
+            )
+            return package
+
+    def get_derived(self, key: str, factory: Callable[[dict], Any]) -> Any:
+        """
+        Güncel paketten türetilen bir nesneyi (örn. derlenmiş scorer) döner.
+
+        Nesne paket başına bir kez `factory(package)` ile üretilir; paket
+        yeniden yüklendiğinde (hot reload) otomatik olarak yeniden üretilir.
+        """
+        package = self.get()
+        with self._lock:
+            cached = self._derived.get(key)
+        if cached is not None and cached[0] is package:
+            return cached[1]
+
+        value = factory(package)
+        with self._lock:
+            self._derived[key] = (package, value)
+        return value
+
+    def clear(self) -> None:
+        """Önbelleği boşaltır; bir sonraki `get()` paketi yeniden yükler."""
+        with self._lock:
+            self._entry = None
+            self._derived.clear()
+
+    def stats(self) -> dict:
+        """Önbellek ve yükleme istatistiklerini döner."""
+        with self._lock:
+            entry = self._entry
+            return {
+                "path": str(self.path),
+                "loaded": entry is not None,
+                "sha256": entry.sha256 if entry else None,
+                "loaded_at": entry.loaded_at if entry else None,
+                "last_load_time_ms": entry.load_time_ms if entry else None,
+                "total_load_time_ms": self._total_load_time_ms,
+                "cache_hits": self._hits,
+                "cache_misses": self._misses,
+                "reloads": self._reloads,
+            }
+
+
+_REGISTRY = ModelRegistry()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Process genelinde paylaşılan model registry'sini döner."""
+    return _REGISTRY
 
 
 def _load_model_package() -> dict:
     """
-    Kaydedilmiş final model paketini yükler.
+    Kaydedilmiş final model paketini (önbellekten) yükler.
 
     Hata alırsan:
     - src.config içindeki FINAL_MODEL yolunu,
@@ -34,11 +198,50 @@ def _load_model_package() -> dict:
 
     kontrol et.
     """
-    model_package = joblib.load(FINAL_MODEL)
-    return model_package
+    return _REGISTRY.get()
+
+
+def get_preprocessing_state() -> Optional[dict]:
+    """
+    Model paketindeki fit edilmiş preprocessing sabitlerini döner.
+
+    Eski paketlerde bu alan yoktur; bu durumda None döner ve
+    preprocessing batch istatistikleriyle çalışır.
+    """
+    return _load_model_package().get(PREPROCESSING_STATE_KEY)
+
+
+def get_model_features() -> Optional[List[str]]:
+    """
+    Modelin tükettiği (one-hot sonrası) feature isimlerini döner.
+
+    prepare_training bu listeyi kullanarak sadece gerekli türevleri hesaplar.
+    """
+    return _load_model_package().get("features")
+
+
+def get_model_input_columns() -> Optional[List[str]]:
+    """
+    Modelin okuduğu (one-hot öncesi) kolon isimlerini döner.
+
+    Hazır feature tablosunu columnar bir dosyadan sadece bu kolonlarla
+    okumak için kullanılır (bkz. src.data_io.read_table(columns=...)).
+    """
+    model = _load_model_package()["model"]
+    columns = getattr(model, "feature_names_in_", None)
+    return list(columns) if columns is not None else None
+
 
+# predict_from_df motorları:
+#   "sklearn"  -> kayıtlı Pipeline.predict_proba (varsayılan)
+#   "compiled" -> src.scorer.CompiledScorer (sabit kolon sırası, dense float32,
+#                 Booster.inplace_predict); paket desteklenmiyorsa ValueError
+#   "auto"     -> destekleniyorsa compiled, değilse sklearn
+ENGINES = ("sklearn", "compiled", "auto")
 
-def predict_from_df(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+
+@profiled()
+def predict_from_df(df: pd.DataFrame, engine: str = "sklearn") -> Tuple[np.ndarray, np.ndarray]:
     """
     Girdi olarak verilen DataFrame üzerinden tahmin üretir.
 
@@ -49,13 +252,36 @@ def predict_from_df(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
 
     Adımlar:
     - Varsa hedef kolonu (SeriousDlqin2yrs) düşülür.
-    - Final model dosyası içindeki model ile predict_proba çağrılır.
+    - Final model dosyası içindeki model ile predict_proba çağrılır
+      (engine="compiled" ise sklearn atlanıp Booster doğrudan çağrılır;
+      sonuçlar birebir aynıdır).
     - Kayıtlı threshold'a göre 0/1 tahmin üretilir.
 
     Dönen:
         y_pred  : (n,)  -> 0/1 tahminler
         y_proba : (n,)  -> default olasılığı
     """
+    if engine not in ENGINES:
+        raise ValueError(f"Bilinmeyen engine: {engine!r}. Seçenekler: {ENGINES}")
+
+    model_package = _load_model_package()
+    threshold = model_package["threshold"]
+
+    if engine != "sklearn":
+        # Döngüsel import olmaması için burada
+        from src.scorer import get_compiled_scorer
+
+        scorer = get_compiled_scorer()
+        if scorer is not None:
+            # Sadece modelin kolonları okunur; hedef / ekstra kolonlar yok sayılır
+            with stage("model.transform", len(df)):
+                X = scorer.transform(df)
+            with stage("model.predict_proba", len(df)):
+                y_proba = scorer.predict_proba(X)
+            return (y_proba >= threshold).astype(int), y_proba
+        if engine == "compiled":
+            raise ValueError("Model paketi compiled engine ile skorlanamıyor.")
+
     df_model = df.copy()
 
     # Hedef kolonu yanlışlıkla geldiyse düşelim (data leakage önleme)
@@ -63,15 +289,14 @@ def predict_from_df(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
     if target_col in df_model.columns:
         df_model = df_model.drop(columns=[target_col])
 
-    model_package = _load_model_package()
     model = model_package["model"]
-    threshold = model_package["threshold"]
 
     # Not:
     # model, 05_xgboost.ipynb içinde ColumnTransformer + XGBoost
     # pipeline'ı olarak kaydedildiği için burada ekstra scaler / OHE
     # yapılmaz; tüm preprocessing pipeline içinde halledilir.
-    y_proba = model.predict_proba(df_model)[:, 1]
+    with stage("model.predict_proba", len(df_model)):
+        y_proba = model.predict_proba(df_model)[:, 1]
     y_pred = (y_proba >= threshold).astype(int)
 
     return y_pred, y_proba
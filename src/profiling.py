@@ -0,0 +1,244 @@
+# src/profiling.py
+
+"""
+Preprocessing ve model çağrısı için opt-in aşama profili.
+
+Her aşama için duvar saati süresi, işlenen satır sayısı ve bellek farkı
+kaydedilir. İki şekilde açılır:
+
+- Ortam değişkeni: CREDIT_RISK_PROFILE=1 -> process boyunca tüm aşamalar
+  GLOBAL_REPORT'a yazılır (API: GET /profile).
+- Context manager: `with profile() as report: ...` -> sadece bu blok
+  (aynı thread / context) içindeki aşamalar `report`'a yazılır
+  (CLI: pipeline.py --profile).
+
+Kapalıyken `stage()` paylaşılan bir nullcontext döner ve `profiled`
+sarmalayıcısı tek bir bool kontrolünden sonra fonksiyonu doğrudan çağırır;
+bu yüzden hook'lar production kodunda kalabilir.
+
+Bellek farkı tracemalloc açıksa izlenen Python / numpy belleğinden, değilse
+process RSS'inden (/proc/self/statm) hesaplanır; RSS'in okunamadığı
+platformlarda None'dır.
+
+Kullanım:
+    from src.profiling import profile
+
+    with profile() as report:
+        predict_from_raw(df)
+    print(report.format())
+    report.to_dict()  # {"n_records": ..., "stages": [...]}
+"""
+
+import contextlib
+import contextvars
+import functools
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+PROFILE_ENV = "CREDIT_RISK_PROFILE"
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+_NULL_STAGE = contextlib.nullcontext()
+
+
+@dataclass
+class StageRecord:
+    """Tek bir aşama çalışması."""
+
+    stage: str
+    wall_ms: float
+    rows: Optional[int] = None
+    mem_delta_mb: Optional[float] = None
+
+
+class ProfileReport:
+    """Aşama kayıtlarını toplar; aşama bazında özet ve tablo üretir."""
+
+    def __init__(self):
+        self.records: List[StageRecord] = []
+        self._lock = threading.Lock()
+
+    def add(self, record: StageRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.records = []
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Aşama başına toplam (ilk görülme sırasıyla)."""
+        with self._lock:
+            records = list(self.records)
+
+        stages: Dict[str, Dict[str, Any]] = {}
+        for r in records:
+            s = stages.setdefault(
+                r.stage,
+                {"stage": r.stage, "calls": 0, "wall_ms": 0.0, "rows": 0, "mem_delta_mb": None},
+            )
+            s["calls"] += 1
+            s["wall_ms"] += r.wall_ms
+            s["rows"] += r.rows or 0
+            if r.mem_delta_mb is not None:
+                s["mem_delta_mb"] = (s["mem_delta_mb"] or 0.0) + r.mem_delta_mb
+
+        for s in stages.values():
+            s["mean_ms"] = s["wall_ms"] / s["calls"]
+            s["rows_per_sec"] = s["rows"] / (s["wall_ms"] / 1000) if s["wall_ms"] > 0 else None
+        return list(stages.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"n_records": len(self.records), "stages": self.summary()}
+
+    def raw(self) -> List[Dict[str, Any]]:
+        """Tüm kayıtlar (çağrı başına) sözlük listesi olarak."""
+        with self._lock:
+            return [asdict(r) for r in self.records]
+
+    def format(self) -> str:
+        """Okunabilir tablo (CLI çıktısı)."""
+        lines = [
+            f"{'aşama':<30}{'çağrı':>7}{'toplam ms':>12}{'ort. ms':>10}{'satır':>11}{'bellek Δ MB':>13}"
+        ]
+        for s in self.summary():
+            mem = f"{s['mem_delta_mb']:>13.1f}" if s["mem_delta_mb"] is not None else f"{'-':>13}"
+            lines.append(
+                f"{s['stage']:<30}{s['calls']:>7}{s['wall_ms']:>12.1f}{s['mean_ms']:>10.2f}"
+                f"{s['rows']:>11}{mem}"
+            )
+        return "\n".join(lines)
+
+
+GLOBAL_REPORT = ProfileReport()
+
+_ENV_ENABLED = os.environ.get(PROFILE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+_current: contextvars.ContextVar[Optional[ProfileReport]] = contextvars.ContextVar(
+    "credit_risk_profile", default=None
+)
+_sessions = 0
+_sessions_lock = threading.Lock()
+# Hızlı yol: hiçbir profil açık değilse hook'lar sadece bunu kontrol eder
+_enabled = _ENV_ENABLED
+
+
+def is_enabled() -> bool:
+    """Herhangi bir profil (ortam değişkeni veya açık bir profile() bloğu) açık mı?"""
+    return _enabled
+
+
+def env_enabled() -> bool:
+    """CREDIT_RISK_PROFILE ile process genelinde açık mı?"""
+    return _ENV_ENABLED
+
+
+def _set_sessions(delta: int) -> None:
+    global _sessions, _enabled
+    with _sessions_lock:
+        _sessions += delta
+        _enabled = _ENV_ENABLED or _sessions > 0
+
+
+@contextlib.contextmanager
+def profile(report: Optional[ProfileReport] = None) -> Iterator[ProfileReport]:
+    """Blok içindeki aşamaları `report`'a (verilmezse yeni bir rapor) kaydeder."""
+    report = report if report is not None else ProfileReport()
+    token = _current.set(report)
+    _set_sessions(+1)
+    try:
+        yield report
+    finally:
+        _set_sessions(-1)
+        _current.reset(token)
+
+
+def _targets() -> List[ProfileReport]:
+    targets = []
+    current = _current.get()
+    if current is not None:
+        targets.append(current)
+    if _ENV_ENABLED and current is not GLOBAL_REPORT:
+        targets.append(GLOBAL_REPORT)
+    return targets
+
+
+def _memory_bytes() -> Optional[int]:
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def record(
+    name: str,
+    wall_ms: float,
+    rows: Optional[int] = None,
+    mem_delta_mb: Optional[float] = None,
+) -> None:
+    """Dışarıda ölçülmüş bir aşamayı kaydeder (profil kapalıysa bir şey yapmaz)."""
+    if not _enabled:
+        return
+    entry = StageRecord(name, wall_ms, rows, mem_delta_mb)
+    for report in _targets():
+        report.add(entry)
+
+
+class _Stage:
+    __slots__ = ("name", "rows", "_start", "_mem")
+
+    def __init__(self, name: str, rows: Optional[int]):
+        self.name = name
+        self.rows = rows
+
+    def __enter__(self) -> "_Stage":
+        self._mem = _memory_bytes()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        wall_ms = (time.perf_counter() - self._start) * 1000
+        mem_after = _memory_bytes()
+        mem_delta = None
+        if self._mem is not None and mem_after is not None:
+            mem_delta = (mem_after - self._mem) / 1024**2
+        record(self.name, wall_ms, self.rows, mem_delta)
+
+
+def stage(name: str, rows: Optional[int] = None):
+    """
+    `with stage("clean_basic", rows=len(df)): ...` bloğunu ölçer.
+    Profil kapalıysa paylaşılan nullcontext döner.
+    """
+    if not _enabled:
+        return _NULL_STAGE
+    return _Stage(name, rows)
+
+
+def profiled(name: Optional[str] = None) -> Callable:
+    """
+    Fonksiyonu bir aşama olarak ölçen decorator. Satır sayısı ilk
+    argümanın uzunluğudur (DataFrame / dizi); aşama adı verilmezse
+    fonksiyon adı kullanılır.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        stage_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            rows = len(args[0]) if args and hasattr(args[0], "__len__") else None
+            with _Stage(stage_name, rows):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
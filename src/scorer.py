@@ -0,0 +1,299 @@
+# src/scorer.py
+
+"""
+Kaydedilmiş model paketinden "derlenmiş" (compiled) scorer üretir.
+
+sklearn Pipeline (ColumnTransformer + OneHotEncoder + XGBClassifier) her
+çağrıda kolon seçimi, one-hot, hstack ve dtype dönüşümü yapar. Tek bir
+müşteri için gecikmenin neredeyse tamamı bu framework yüküdür.
+
+`CompiledScorer` paketi bir kez çözümler:
+- modelin beklediği sabit kolon sırası (sayısal kolonlar + one-hot slotları),
+- her bin kodunun düştüğü one-hot slotu,
+- fit edilmiş preprocessing sabitleri,
+- doğrudan çağrılacak XGBoost Booster'ı.
+
+`predict_record` tek bir ham kayıt sözlüğünü pandas kullanmadan önceden
+ayrılmış bir numpy feature vektörüne çevirir ve Booster'ı doğrudan çağırır.
+Sonuç `predict_from_raw` ile birebir aynıdır.
+
+`predict_proba_df` ise hazır (prepare_training sonrası) bir batch'i sabit
+kolon sırasıyla dense float32 matrise yazar; kategorik bin'ler integer
+kodlar üzerinden doğrudan one-hot slotlarına işlenir
+(bkz. predict_from_df(..., engine="compiled")).
+"""
+
+import math
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.data_preprocessing import PREPROCESSING_STATE_KEY, required_columns
+from src.feature_registry import (
+    BIN_SPECS,
+    DELINQ_COLS,
+    RAW_FEATURE_COLS,
+    bin_codes,
+    compute_features,
+    label_codes,
+)
+from src.predict import get_model_registry
+
+
+def _as_float(value: Any) -> float:
+    """
+    JSON'dan gelen değeri float'a çevirir (None -> NaN). Sayısal olmayan
+    değerler (örn. msgpack'te iç içe map) ValueError olur.
+    """
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except TypeError as e:
+        raise ValueError(f"Ham feature değerleri sayısal olmalı: {e}") from None
+
+
+class CompiledScorer:
+    """
+    Model paketinden çözümlenmiş, framework yükü olmayan scorer.
+
+    Paket yapısı beklenenden farklıysa (ColumnTransformer'da sadece
+    'num' passthrough + 'cat' OneHotEncoder ve XGBClassifier) ValueError
+    fırlatır; bu durumda çağıran taraf sklearn pipeline'ına geri döner.
+    """
+
+    def __init__(
+        self,
+        booster: Any,
+        threshold: float,
+        numeric_cols: List[str],
+        cat_cols: List[str],
+        cat_slots: Dict[str, np.ndarray],
+        n_features: int,
+        state: Optional[dict] = None,
+        iteration_range: Tuple[int, int] = (0, 0),
+    ):
+        self.booster = booster
+        self.threshold = threshold
+        self.numeric_cols = list(numeric_cols)
+        self.cat_cols = list(cat_cols)
+        self.cat_slots = cat_slots
+        self.state = state
+        self.iteration_range = iteration_range
+        self.n_features = n_features
+
+        # Sayısal kolonlar için hesaplanması gereken türevler (bin'ler hariç)
+        needed = required_columns(self.numeric_cols + self.cat_cols)
+        self._derived_targets = frozenset(c for c in needed if c not in BIN_SPECS)
+
+    @classmethod
+    def from_package(cls, package: dict) -> "CompiledScorer":
+        """Kaydedilmiş model paketinden scorer üretir."""
+        # Paket yüklendiyse sklearn zaten import edilmiştir; modül seviyesinde
+        # import etmek `import app.api` maliyetine eklenirdi
+        from sklearn.preprocessing import FunctionTransformer
+
+        model = package["model"]
+        steps = getattr(model, "named_steps", None)
+        if steps is None or set(steps) != {"preprocess", "model"}:
+            raise ValueError("Model paketi preprocess + model adımlı bir Pipeline değil.")
+
+        preprocess = steps["preprocess"]
+        xgb_model = steps["model"]
+        if getattr(preprocess, "remainder", None) != "drop":
+            raise ValueError("ColumnTransformer remainder='drop' olmalı.")
+
+        transformers = {name: (trans, cols) for name, trans, cols in preprocess.transformers_}
+        if set(transformers) - {"num", "cat", "remainder"}:
+            raise ValueError(f"Beklenmeyen transformer'lar: {sorted(transformers)}")
+
+        num_trans, numeric_cols = transformers["num"]
+        # Sadece "passthrough" veya func'sız (identity) FunctionTransformer kabul edilir
+        is_identity = isinstance(num_trans, FunctionTransformer) and num_trans.func is None
+        if num_trans != "passthrough" and not is_identity:
+            raise ValueError("Sayısal kolonlar passthrough olmalı.")
+        numeric_cols = list(numeric_cols)
+
+        ohe, cat_cols = transformers["cat"]
+        cat_cols = list(cat_cols)
+        unknown = [c for c in cat_cols if c not in BIN_SPECS]
+        if unknown:
+            raise ValueError(f"Bilinmeyen kategorik kolonlar: {unknown}")
+        if ohe.drop_idx_ is not None or getattr(ohe, "infrequent_categories_", None):
+            raise ValueError("OneHotEncoder drop / infrequent kategori desteklenmiyor.")
+
+        # Bin kodu -> one-hot slot indeksi. Son iki eleman:
+        #   [-2] bilinmeyen etiket (handle_unknown='ignore' -> slot yok)
+        #   [-1] NaN / kod -1 (kategori olarak öğrenildiyse kendi slotu)
+        cat_slots = {}
+        offset = len(numeric_cols)
+        for col, categories in zip(cat_cols, ohe.categories_):
+            labels = BIN_SPECS[col][2]
+            position = {}
+            for i, cat in enumerate(categories):
+                key = "nan" if isinstance(cat, float) and math.isnan(cat) else str(cat)
+                position[key] = offset + i
+            slots = np.array(
+                [position.get(label, -1) for label in labels] + [-1, position.get("nan", -1)]
+            )
+            cat_slots[col] = slots
+            offset += len(categories)
+
+        try:
+            best = xgb_model.best_iteration
+            iteration_range = (0, best + 1)
+        except AttributeError:
+            iteration_range = (0, 0)
+
+        return cls(
+            booster=xgb_model.get_booster(),
+            threshold=float(package["threshold"]),
+            numeric_cols=numeric_cols,
+            cat_cols=cat_cols,
+            cat_slots=cat_slots,
+            n_features=offset,
+            state=package.get(PREPROCESSING_STATE_KEY),
+            iteration_range=iteration_range,
+        )
+
+    def _clean_record(self, record: Mapping[str, Any]) -> Dict[str, np.ndarray]:
+        """
+        clean_basic ile aynı temizlik, tek kayıt için numpy üzerinde.
+
+        State yoksa medyanlar tek satırlık batch'ten alınır (predict_from_raw
+        ile aynı davranış): değer eksikse NaN kalır. Kayıtta olmayan ham
+        kolonlar atlanır; türevleri registry fallback'leriyle üretilir.
+        """
+        columns = {
+            col: np.array([_as_float(record[col])]) for col in RAW_FEATURE_COLS if col in record
+        }
+        state = self.state
+
+        age = columns.get("age")
+        if age is not None and age[0] == 0:
+            age[0] = math.nan
+        if state is not None:
+            for col, key in [
+                ("age", "age_median"),
+                ("MonthlyIncome", "income_median"),
+                ("NumberOfDependents", "dependents_median"),
+            ]:
+                if col in columns and math.isnan(columns[col][0]):
+                    columns[col][0] = state[key]
+
+        for col in DELINQ_COLS:
+            if col in columns:
+                np.minimum(columns[col], 10, out=columns[col])
+
+        return columns
+
+    def prepare_record(self, record: Mapping[str, Any]) -> np.ndarray:
+        """
+        Tek bir ham kaydı modelin beklediği (1, n_features) vektöre çevirir.
+
+        Eksik ham kolonlarda predict_from_raw ile aynı kurallar geçerlidir:
+        fallback'i olan türevler (örn. gecikme feature'ları) sabitle
+        doldurulur, model için zorunlu bir kolon üretilemezse KeyError.
+        """
+        columns = self._clean_record(record)
+        columns.update(compute_features(columns, self._derived_targets, self.state, n_rows=1))
+
+        missing = [
+            col for col in self.numeric_cols + [BIN_SPECS[c][0] for c in self.cat_slots]
+            if col not in columns
+        ]
+        if missing:
+            raise KeyError(f"Ham kayıtta eksik kolon(lar): {sorted(set(missing))}")
+
+        vec = np.zeros((1, self.n_features), dtype=np.float32)
+        for i, col in enumerate(self.numeric_cols):
+            vec[0, i] = columns[col][0]
+        for col, slots in self.cat_slots.items():
+            source_col = BIN_SPECS[col][0]
+            slot = slots[bin_codes(columns[source_col], col)[0]]  # -1 -> NaN slotu
+            if slot >= 0:
+                vec[0, slot] = 1.0
+        return vec
+
+    def _bin_codes_from_frame(self, series: pd.Series, col: str) -> np.ndarray:
+        """
+        Hazır DataFrame'deki bin kolonunu registry label kodlarına çevirir.
+
+        Registry'den gelen Categorical kolonlarda kodlar doğrudan kullanılır;
+        CSV'den okunan string kolonlarda label'lara göre kodlanır. Bilinmeyen
+        (NaN olmayan) label'lar -2 alır.
+        """
+        labels = BIN_SPECS[col][2]
+        dtype = series.dtype
+        if isinstance(dtype, pd.CategoricalDtype) and list(dtype.categories) == list(labels):
+            return series.cat.codes.to_numpy()
+        return label_codes(series, col)
+
+    def transform(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Hazır (prepare_training sonrası) DataFrame'i modelin beklediği
+        dense float32 tasarım matrisine çevirir.
+
+        Eksik kolon varsa KeyError fırlatır (sklearn pipeline'ı gibi).
+        """
+        n_rows = len(df)
+        X = np.zeros((n_rows, self.n_features), dtype=np.float32)
+        X[:, :len(self.numeric_cols)] = df[self.numeric_cols].to_numpy(
+            dtype=np.float32, na_value=np.nan
+        )
+
+        rows = np.arange(n_rows)
+        for col, slots in self.cat_slots.items():
+            target = slots[self._bin_codes_from_frame(df[col], col)]
+            mask = target >= 0
+            X[rows[mask], target[mask]] = 1.0
+        return X
+
+    def predict_proba_df(self, df: pd.DataFrame) -> np.ndarray:
+        """Hazır DataFrame için default olasılıklarını döner."""
+        return self.predict_proba(self.transform(df))
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Hazır feature matrisi için default olasılıklarını döner."""
+        return self.booster.inplace_predict(X, iteration_range=self.iteration_range)
+
+    def predict_record(self, record: Mapping[str, Any]) -> Tuple[int, float]:
+        """
+        Tek bir ham kayıt için (0/1 tahmin, default olasılığı) döner.
+        """
+        proba = float(self.predict_proba(self.prepare_record(record))[0])
+        return int(proba >= self.threshold), proba
+
+
+def _build_scorer(package: dict) -> Optional[CompiledScorer]:
+    try:
+        return CompiledScorer.from_package(package)
+    except (ValueError, KeyError, AttributeError):
+        return None
+
+
+def get_compiled_scorer() -> Optional[CompiledScorer]:
+    """
+    Güncel model paketi için önbelleğe alınmış scorer'ı döner.
+
+    Paket desteklenmeyen bir yapıdaysa None döner.
+    """
+    return get_model_registry().get_derived("compiled_scorer", _build_scorer)
+
+
+def predict_record(record: Mapping[str, Any]) -> Tuple[int, float]:
+    """
+    Gerçek zamanlı tek kayıt skorlama (pandas'sız hızlı yol).
+
+    Paket derlenemiyorsa predict_from_raw'a geri döner.
+    """
+    scorer = get_compiled_scorer()
+    if scorer is not None:
+        return scorer.predict_record(record)
+
+    import pandas as pd
+    from src.inference import predict_from_raw
+
+    y_pred, y_proba = predict_from_raw(pd.DataFrame([record]))
+    return int(y_pred[0]), float(y_proba[0])
@@ -0,0 +1,292 @@
+# src/synthetic.py
+
+"""
+Ham Kaggle şemasında (Give Me Some Credit) ölçeklenebilir sentetik veri
+üreticisi: benchmark'lar, yük testleri ve streaming testleri için
+data/cs-training.csv olmadan istenen boyutta veri.
+
+Her satır önce bir risk segmentine (low / medium / high) atanır, kolonlar
+segmentin marjinal dağılımlarından vektörize üretilir:
+
+- RevolvingUtilization: beta (0-1), küçük bir >1 kuyruğu ve nadir aşırı
+  değerler (binler)
+- age: segment ortalamalı normal, 21-100 arası; çok nadir age == 0
+- gecikme sayıları: segment bazlı Poisson; nadiren üç kolon birlikte
+  96 / 98 sentinel'i (Kaggle'daki kodlanmış değerler)
+- MonthlyIncome: log-normal, ~%20 eksik, az sayıda 0; gelir eksikse
+  DebtRatio oran değil mutlak borç tutarıdır (Kaggle'daki gibi büyük değerler)
+- açık kredi / gayrimenkul / bakmakla yükümlü: negatif binom (aşırı yayılım),
+  NumberOfDependents ~%2.6 eksik
+
+Risk karışımı MIXES'teki hazır karışımlardan biri ("low", "mixed",
+"stressed") veya segment -> ağırlık sözlüğüdür. İstenirse segment bazlı
+temerrüt oranıyla SeriousDlqin2yrs hedefi de üretilir.
+
+Veri BLOCK_ROWS satırlık bloklar halinde, her blok (seed, blok no) ile
+tohumlanan ayrı bir generator'la üretilir; bu yüzden çıktı sadece seed ve
+satır sayısına bağlıdır, parça boyutundan bağımsızdır. Bellek kullanımı parça
+boyutuyla sınırlıdır (on milyonlarca satır dosyaya akıtılabilir).
+
+Kullanım:
+    from src.synthetic import generate, iter_synthetic, write_synthetic
+
+    df = generate(100_000, mix="stressed", seed=42)
+    for chunk in iter_synthetic(10_000_000, chunk_size=500_000): ...
+    write_synthetic("data/synthetic.parquet", 10_000_000)
+
+    python -m src.synthetic --rows 10000000 --output data/synthetic.parquet --mix mixed
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Mapping, Union
+
+import numpy as np
+import pandas as pd
+
+from src.config import SEED
+from src.data_io import ChunkWriter
+from src.feature_registry import DELINQ_COLS, RAW_FEATURE_COLS
+
+TARGET_COL = "SeriousDlqin2yrs"
+BLOCK_ROWS = 65_536
+DEFAULT_CHUNK_SIZE = 500_000
+
+# Segmentten bağımsız kenar durum oranları (Kaggle eğitim setine yakın)
+MISSING_INCOME_RATE = 0.198
+ZERO_INCOME_RATE = 0.011
+MISSING_DEPENDENTS_RATE = 0.026
+ZERO_DEBT_RATIO_RATE = 0.03
+EXTREME_UTILIZATION_RATE = 0.002
+AGE_ZERO_RATE = 2e-5
+SENTINEL_96_SHARE = 0.02
+
+
+@dataclass(frozen=True)
+class Segment:
+    """Bir risk segmentinin marjinal dağılım parametreleri."""
+
+    util_a: float
+    util_b: float
+    util_over_one: float  # 1'i aşan kullanım oranı olasılığı
+    age_mean: float
+    age_sd: float
+    late_30_59: float  # Poisson ortalamaları
+    late_60_89: float
+    late_90: float
+    sentinel_rate: float  # 96 / 98 sentinel olasılığı
+    income_log_mean: float
+    debt_ratio_log_mean: float
+    open_lines: float
+    real_estate: float
+    dependents: float
+    default_rate: float
+
+
+SEGMENTS: Dict[str, Segment] = {
+    "low": Segment(0.5, 4.0, 0.002, 56, 14, 0.03, 0.005, 0.005, 0.0005, 8.70, -1.20, 8.6, 1.00, 0.65, 0.02),
+    "medium": Segment(1.0, 1.2, 0.02, 51, 15, 0.40, 0.08, 0.08, 0.002, 8.55, -1.00, 8.4, 1.05, 0.80, 0.10),
+    "high": Segment(3.0, 0.6, 0.08, 44, 12, 1.50, 0.60, 0.90, 0.01, 8.30, -0.85, 7.6, 1.00, 0.95, 0.45),
+}
+
+# Hazır risk karışımları (segment -> ağırlık)
+MIXES: Dict[str, Dict[str, float]] = {
+    "low": {"low": 0.90, "medium": 0.10, "high": 0.00},
+    "mixed": {"low": 0.60, "medium": 0.32, "high": 0.08},
+    "stressed": {"low": 0.05, "medium": 0.25, "high": 0.70},
+}
+
+Mix = Union[str, Mapping[str, float]]
+
+
+def _mix_weights(mix: Mix) -> np.ndarray:
+    """Karışımı SEGMENTS sırasıyla normalize edilmiş ağırlık dizisine çevirir."""
+    if isinstance(mix, str):
+        if mix not in MIXES:
+            raise ValueError(f"Bilinmeyen karışım: {mix!r}. Seçenekler: {list(MIXES)}")
+        mix = MIXES[mix]
+    unknown = set(mix) - set(SEGMENTS)
+    if unknown:
+        raise ValueError(f"Bilinmeyen segment(ler): {sorted(unknown)}. Seçenekler: {list(SEGMENTS)}")
+    weights = np.array([float(mix.get(name, 0.0)) for name in SEGMENTS])
+    if (weights < 0).any() or weights.sum() <= 0:
+        raise ValueError("Karışım ağırlıkları negatif olmamalı ve toplamı pozitif olmalı.")
+    return weights / weights.sum()
+
+
+def _param(name: str) -> np.ndarray:
+    return np.array([getattr(s, name) for s in SEGMENTS.values()], dtype=float)
+
+
+def _neg_binomial(rng: np.random.Generator, mean: np.ndarray, dispersion: float) -> np.ndarray:
+    """Ortalaması `mean`, varyansı mean + mean² / dispersion olan sayımlar."""
+    return rng.negative_binomial(dispersion, dispersion / (dispersion + mean))
+
+
+def _block(seed: int, block_idx: int, n_rows: int, weights: np.ndarray, target: bool) -> pd.DataFrame:
+    """Tek bir bloğu (seed, blok no) ile tohumlanan generator'la üretir."""
+    rng = np.random.default_rng([seed, block_idx])
+    seg = rng.choice(len(weights), size=n_rows, p=weights)
+
+    def p(name: str) -> np.ndarray:
+        return _param(name)[seg]
+
+    # Kullanım oranı: beta + >1 kuyruğu + nadir aşırı değerler
+    util = rng.beta(p("util_a"), p("util_b"))
+    over = rng.random(n_rows) < p("util_over_one")
+    util[over] = rng.lognormal(0.15, 0.25, over.sum()) + 1.0
+    extreme = rng.random(n_rows) < EXTREME_UTILIZATION_RATE
+    util[extreme] = rng.lognormal(6.0, 1.5, extreme.sum()).round()
+
+    age = np.clip(rng.normal(p("age_mean"), p("age_sd")), 21, 100).round().astype(np.int64)
+    age[rng.random(n_rows) < AGE_ZERO_RATE] = 0
+
+    late = {
+        "NumberOfTime30-59DaysPastDueNotWorse": rng.poisson(p("late_30_59")),
+        "NumberOfTime60-89DaysPastDueNotWorse": rng.poisson(p("late_60_89")),
+        "NumberOfTimes90DaysLate": rng.poisson(p("late_90")),
+    }
+    sentinel = rng.random(n_rows) < p("sentinel_rate")
+    code = np.where(rng.random(n_rows) < SENTINEL_96_SHARE, 96, 98)
+    for col in DELINQ_COLS:
+        late[col] = np.where(sentinel, code, late[col]).astype(np.int64)
+
+    income = rng.lognormal(p("income_log_mean"), 0.65).round()
+    income[rng.random(n_rows) < ZERO_INCOME_RATE] = 0.0
+    missing_income = rng.random(n_rows) < MISSING_INCOME_RATE
+    income[missing_income] = np.nan
+
+    # Gelir varken oran, eksikken mutlak aylık borç tutarı
+    debt_ratio = np.where(
+        missing_income,
+        rng.lognormal(7.0, 1.3, n_rows).round(),
+        rng.lognormal(p("debt_ratio_log_mean"), 0.8),
+    )
+    debt_ratio[rng.random(n_rows) < ZERO_DEBT_RATIO_RATE] = 0.0
+
+    dependents = _neg_binomial(rng, p("dependents"), 1.5).astype(float)
+    dependents[rng.random(n_rows) < MISSING_DEPENDENTS_RATE] = np.nan
+
+    data = {
+        "RevolvingUtilizationOfUnsecuredLines": util,
+        "age": age,
+        "NumberOfTime30-59DaysPastDueNotWorse": late["NumberOfTime30-59DaysPastDueNotWorse"],
+        "DebtRatio": debt_ratio,
+        "MonthlyIncome": income,
+        "NumberOfOpenCreditLinesAndLoans": _neg_binomial(rng, p("open_lines"), 4.0),
+        "NumberOfTimes90DaysLate": late["NumberOfTimes90DaysLate"],
+        "NumberRealEstateLoansOrLines": _neg_binomial(rng, p("real_estate"), 2.0),
+        "NumberOfTime60-89DaysPastDueNotWorse": late["NumberOfTime60-89DaysPastDueNotWorse"],
+        "NumberOfDependents": dependents,
+    }
+    df = pd.DataFrame(data, columns=RAW_FEATURE_COLS)
+    if target:
+        df.insert(0, TARGET_COL, (rng.random(n_rows) < p("default_rate")).astype(np.int64))
+    return df
+
+
+def iter_synthetic(
+    n_rows: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    mix: Mix = "mixed",
+    seed: int = SEED,
+    target: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """
+    n_rows satırı en fazla chunk_size satırlık DataFrame parçaları halinde
+    üretir. Parçaların index'i global satır numarasıdır; birleştirilmiş çıktı
+    chunk_size'dan bağımsızdır.
+    """
+    if n_rows < 0:
+        raise ValueError("n_rows negatif olamaz.")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size pozitif olmalı.")
+    weights = _mix_weights(mix)
+
+    pending: List[pd.DataFrame] = []
+    pending_rows = 0
+    offset = 0
+    for block_idx, start in enumerate(range(0, n_rows, BLOCK_ROWS)):
+        block = _block(seed, block_idx, min(BLOCK_ROWS, n_rows - start), weights, target)
+        pending.append(block)
+        pending_rows += len(block)
+        if pending_rows < chunk_size and start + BLOCK_ROWS < n_rows:
+            continue
+
+        buffer = pd.concat(pending, ignore_index=True) if len(pending) > 1 else pending[0]
+        n_full = len(buffer) // chunk_size * chunk_size
+        for i in range(0, n_full, chunk_size):
+            yield _with_offset(buffer.iloc[i : i + chunk_size], offset)
+            offset += chunk_size
+        rest = buffer.iloc[n_full:]
+        pending, pending_rows = ([rest], len(rest)) if len(rest) else ([], 0)
+
+    if pending_rows:
+        yield _with_offset(pd.concat(pending, ignore_index=True), offset)
+
+
+def _with_offset(chunk: pd.DataFrame, offset: int) -> pd.DataFrame:
+    chunk = chunk.copy()
+    chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+    return chunk
+
+
+def generate(n_rows: int, mix: Mix = "mixed", seed: int = SEED, target: bool = False) -> pd.DataFrame:
+    """n_rows satırlık sentetik ham veriyi tek DataFrame olarak döner."""
+    chunks = list(iter_synthetic(n_rows, max(n_rows, 1), mix, seed, target))
+    if not chunks:
+        columns = ([TARGET_COL] if target else []) + RAW_FEATURE_COLS
+        return pd.DataFrame(columns=columns)
+    return chunks[0]
+
+
+def write_synthetic(
+    path,
+    n_rows: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    mix: Mix = "mixed",
+    seed: int = SEED,
+    target: bool = False,
+) -> dict:
+    """
+    Sentetik veriyi parça parça CSV / Parquet dosyasına yazar
+    (bellek chunk_size ile sınırlı).
+
+    Returns:
+        {"n_rows", "n_chunks", "elapsed_s", "rows_per_sec"}
+    """
+    start = time.perf_counter()
+    written = 0
+    with ChunkWriter(path) as writer:
+        for chunk in iter_synthetic(n_rows, chunk_size, mix, seed, target):
+            writer.write(chunk)
+            written += len(chunk)
+        n_chunks = writer.n_chunks
+    elapsed = time.perf_counter() - start
+    return {
+        "n_rows": written,
+        "n_chunks": n_chunks,
+        "elapsed_s": elapsed,
+        "rows_per_sec": written / elapsed if elapsed > 0 else None,
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Ham Kaggle şemasında sentetik veri üretir")
+    parser.add_argument("--rows", type=int, required=True, help="Satır sayısı")
+    parser.add_argument("--output", required=True, help="Çıktı dosyası (.csv, .csv.gz veya .parquet)")
+    parser.add_argument("--mix", default="mixed", choices=list(MIXES), help="Risk karışımı")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNK_SIZE, help="Parça boyutu (satır)")
+    parser.add_argument("--target", action="store_true", help=f"{TARGET_COL} hedef kolonunu da üret")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    summary = write_synthetic(args.output, args.rows, args.chunksize, args.mix, args.seed, args.target)
+    print(
+        f"[INFO] {summary['n_rows']} satır / {summary['n_chunks']} parça yazıldı: {args.output} "
+        f"({summary['elapsed_s']:.1f} sn, {summary['rows_per_sec']:,.0f} satır/sn)"
+    )
@@ -0,0 +1,76 @@
+# src/warmup.py
+
+"""
+Scoring servisi için başlangıç ısınması.
+
+Uvicorn açıldıktan sonraki ilk /predict istekleri model paketinin
+deserialize edilmesini, XGBoost'un tembel başlatmasını ve henüz hiç
+çalışmamış pandas / numpy kod yollarını öder; bu yüzden her deploy
+sonrası ilk istekler TARGET_P99_LATENCY_MS'i aşar. `warmup()` bu maliyeti
+trafik gelmeden önce öder:
+
+1. model_load   : model paketi ModelRegistry'ye yüklenir
+2. scorer_build : compiled scorer (Booster + one-hot slotları) kurulur
+3. batch_<n>    : her WARMUP_BATCH_SIZES boyutu için sentetik ham kayıtlar
+                  API'nin kullandığı yollarla skorlanır (tek kayıt:
+                  predict_record, batch: predict_from_raw)
+
+Sentetik kayıtlar eksik MonthlyIncome / NumberOfDependents, 96 / 98
+gecikme sentinel'leri ve age == 0 gibi temizlik dallarını da içerir.
+Dönen sözlükteki süreler log'a ve /metrics'e (cold start) yazılır.
+"""
+
+import time
+from typing import Dict, Iterable
+
+import pandas as pd
+
+from src.config import SEED, WARMUP_BATCH_SIZES
+from src.inference import predict_from_raw
+from src.predict import get_model_registry
+from src.scorer import get_compiled_scorer, predict_record
+from src.synthetic import generate
+
+
+def synthetic_batch(n_rows: int, seed: int = SEED) -> pd.DataFrame:
+    """
+    Ham Kaggle formatında, temizlik dallarını da tetikleyen sentetik kayıtlar
+    (src.synthetic, "stressed" karışımı: sentinel'ler küçük batch'lerde de görülür).
+    """
+    df = generate(n_rows, mix="stressed", seed=seed)
+    # age == 0 dalı her batch'te çalışsın (üreticide oranı çok düşük)
+    if n_rows > 1:
+        df.loc[0, "age"] = 0
+    return df
+
+
+def warmup(batch_sizes: Iterable[int] = WARMUP_BATCH_SIZES) -> Dict[str, float]:
+    """
+    Modeli yükler ve sentetik batch'leri skorlar.
+
+    Returns:
+        Aşama -> süre (ms): model_load, scorer_build, batch_<n> ve total
+    """
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+
+    t = time.perf_counter()
+    get_model_registry().get()
+    timings["model_load"] = (time.perf_counter() - t) * 1000
+
+    t = time.perf_counter()
+    get_compiled_scorer()
+    timings["scorer_build"] = (time.perf_counter() - t) * 1000
+
+    for n_rows in batch_sizes:
+        df = synthetic_batch(n_rows)
+        t = time.perf_counter()
+        if n_rows == 1 and get_compiled_scorer() is not None:
+            record = {k: (None if pd.isna(v) else float(v)) for k, v in df.iloc[0].items()}
+            predict_record(record)
+        else:
+            predict_from_raw(df)
+        timings[f"batch_{n_rows}"] = (time.perf_counter() - t) * 1000
+
+    timings["total"] = (time.perf_counter() - start) * 1000
+    return timings
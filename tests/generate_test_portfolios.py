@@ -12,17 +12,22 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.append(str(PROJECT_ROOT))
 
 from src.config import DATA_DIR
-from src.inference import predict_from_raw
+from src.parallel import predict_parallel
+from src.synthetic import generate
 
 RANDOM_STATE = 42
 np.random.seed(RANDOM_STATE)
 
 
-def main():
-    # 1. Ham eğitim verisini oku
+def main(n_rows: int = 500):
+    # 1. Ham eğitim verisini oku (yoksa aynı şemada sentetik veri üret)
     raw_path = DATA_DIR / "cs-training.csv"
-    print(f"[INFO] Ham veri okunuyor: {raw_path}")
-    df_raw = pd.read_csv(raw_path)
+    if raw_path.exists():
+        print(f"[INFO] Ham veri okunuyor: {raw_path}")
+        df_raw = pd.read_csv(raw_path)
+    else:
+        print(f"[UYARI] {raw_path} bulunamadı; 150.000 satırlık sentetik veri kullanılıyor (src.synthetic)")
+        df_raw = generate(150_000, mix="mixed", seed=RANDOM_STATE, target=True)
 
     # Target varsa ayır 
     feature_cols = [c for c in df_raw.columns if c != "SeriousDlqin2yrs"]
@@ -30,9 +35,9 @@ def main():
 
     print(f"[INFO] Ham shape: {X_raw.shape}")
 
-    # 2. Modelden risk skorlarını al
+    # 2. Modelden risk skorlarını al (tüm çekirdeklerde; sonuç predict_from_raw ile aynı)
     print("[INFO] Modelden risk skorları alınıyor...")
-    _, y_proba = predict_from_raw(X_raw)
+    _, y_proba = predict_parallel(X_raw)
     df_raw["Default_Probability"] = y_proba
 
     # 3. Farklı portföy senaryoları oluştur
@@ -44,14 +49,14 @@ def main():
 
     # Low risk portföy (çoğunlukla < 0.3)
     low_risk_df = df_raw[df_raw["Default_Probability"] < 0.3]
-    low_risk_portfolio = safe_sample(low_risk_df, 500)
+    low_risk_portfolio = safe_sample(low_risk_df, n_rows)
 
     # Mixed portföy (genel dağılımdan random)
-    mixed_portfolio = safe_sample(df_raw, 500)
+    mixed_portfolio = safe_sample(df_raw, n_rows)
 
     # Stressed portföy (çoğunlukla > 0.7)
     high_risk_df = df_raw[df_raw["Default_Probability"] > 0.7]
-    stressed_portfolio = safe_sample(high_risk_df, 500)
+    stressed_portfolio = safe_sample(high_risk_df, n_rows)
 
     # 4. Target ve skor kolonunu çıkar, sadece özellikleri bırak
     def prepare_for_export(df):
@@ -78,5 +83,6 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # Portföy başına satır sayısı (varsayılan 500)
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
 
@@ -0,0 +1,39 @@
+# tests/test_benchmark_suite.py
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_suite_writes_results_and_flags_regressions(tmp_path):
+    # Gerçekçi olmayan derecede hızlı / küçük bir baseline -> regresyon beklenir
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(
+        json.dumps({"results": [{"benchmark": "predict_from_raw", "batch_size": 8, "p50_ms": 1e-3, "peak_mb": None}]})
+    )
+    output = tmp_path / "latest.json"
+
+    proc = subprocess.run(
+        [
+            sys.executable, "benchmarks/run.py",
+            "--sizes", "1,8", "--max-repeats", "3",
+            "--output", str(output), "--baseline", str(baseline),
+        ],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    report = json.loads(output.read_text())
+
+    assert proc.returncode == 1
+    assert {(r["benchmark"], r["batch_size"]) for r in report["results"]} == {
+        (name, n) for name in ["prepare_training", "predict_from_df", "predict_from_raw", "api"] for n in [1, 8]
+    }
+    for r in report["results"]:
+        assert r["p50_ms"] <= r["p95_ms"] <= r["p99_ms"]
+        assert r["peak_mb"] > 0
+    assert [(r["benchmark"], r["metric"]) for r in report["regressions"]] == [("predict_from_raw", "p50_ms")]
+    assert {c["metric"] for c in report["slo"]} == {"mean_ms", "p95_ms", "p99_ms"}
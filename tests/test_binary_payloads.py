@@ -0,0 +1,134 @@
+# tests/test_binary_payloads.py
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import app
+from src.config import DATA_DIR
+from src.payloads import ARROW_STREAM, MSGPACK
+
+pa = pytest.importorskip("pyarrow")
+msgpack = pytest.importorskip("msgpack")
+
+
+def _load_sample(n_rows: int = 40) -> pd.DataFrame:
+    return pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv").head(n_rows)
+
+
+def _expected(client, df):
+    records = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+    return client.post("/predict", json={"records": records}).json()
+
+
+def _arrow_body(df: pd.DataFrame) -> bytes:
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def test_arrow_ipc_round_trip():
+    df = _load_sample()
+
+    with TestClient(app) as client:
+        expected = _expected(client, df)
+        response = client.post(
+            "/predict",
+            content=_arrow_body(df),
+            headers={"content-type": ARROW_STREAM, "accept": ARROW_STREAM},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == ARROW_STREAM
+    result = pa.ipc.open_stream(response.content).read_all()
+    assert result.schema.field("Predicted_Label").type == pa.int8()
+    assert result.schema.field("Default_Probability").type == pa.float32()
+    assert result["Predicted_Label"].to_pylist() == expected["predictions"]
+    np.testing.assert_allclose(result["Default_Probability"].to_numpy(), expected["probabilities"], rtol=1e-6)
+
+
+def test_msgpack_binary_columns_round_trip():
+    df = _load_sample()
+    body = msgpack.packb(
+        {"columns": {col: df[col].to_numpy(dtype="<f8").tobytes() for col in df.columns}}
+    )
+
+    with TestClient(app) as client:
+        expected = _expected(client, df)
+        response = client.post(
+            "/predict", content=body, headers={"content-type": MSGPACK, "accept": MSGPACK}
+        )
+
+    assert response.status_code == 200
+    result = msgpack.unpackb(response.content)
+    assert result["n_records"] == len(df)
+    assert np.frombuffer(result["predictions"], dtype="<i1").tolist() == expected["predictions"]
+    np.testing.assert_allclose(
+        np.frombuffer(result["probabilities"], dtype="<f4"), expected["probabilities"], rtol=1e-6
+    )
+
+
+def test_msgpack_records_with_json_response_and_bad_bodies():
+    df = _load_sample(3)
+    records = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+    with TestClient(app) as client:
+        expected = _expected(client, df)
+        as_json = client.post(
+            "/predict", content=msgpack.packb({"records": records}), headers={"content-type": MSGPACK}
+        )
+        garbage = client.post("/predict", content=b"\xc1", headers={"content-type": MSGPACK})
+        bad_arrow = client.post("/predict", content=b"not arrow", headers={"content-type": ARROW_STREAM})
+        bad_json = client.post("/predict", content=b"[1, 2]", headers={"content-type": "application/json"})
+
+    assert as_json.json() == expected
+    assert garbage.status_code == 400
+    assert bad_arrow.status_code == 400
+    assert bad_json.status_code == 422
+
+
+def test_msgpack_non_numeric_values_are_client_errors():
+    """
+    Sayısal olmayan kolon / kayıt değerleri 500 değil 400 dönmeli.
+    """
+    df = _load_sample(2)
+    nested = {col: [{"x": 1}, None] for col in df.columns}
+    bodies = [
+        {"columns": nested},
+        {"columns": {col: 5 for col in df.columns}},
+        {"columns": ["age"]},
+        {"columns": {col: ["a", "b"] for col in df.columns}},
+        {"records": [{col: {"x": 1} for col in df.columns}]},
+    ]
+
+    with TestClient(app) as client:
+        responses = [
+            client.post("/predict", content=msgpack.packb(body), headers={"content-type": MSGPACK})
+            for body in bodies
+        ]
+
+    assert [r.status_code for r in responses] == [400] * len(bodies)
+
+
+def test_arrow_string_columns_are_client_errors():
+    """
+    Arrow'da string ham feature kolonu 400 dönmeli; sayı içeren string
+    kolon JSON / msgpack gibi float'a çevrilip skorlanmalı.
+    """
+    df = _load_sample(2)
+    bad = df.assign(age=["a", "b"])
+    numeric_text = df.assign(age=df["age"].astype(str))
+
+    with TestClient(app) as client:
+        expected = _expected(client, df)
+        bad_response = client.post("/predict", content=_arrow_body(bad), headers={"content-type": ARROW_STREAM})
+        ok_response = client.post(
+            "/predict", content=_arrow_body(numeric_text), headers={"content-type": ARROW_STREAM}
+        )
+
+    assert bad_response.status_code == 400
+    assert ok_response.status_code == 200
+    assert ok_response.json()["predictions"] == expected["predictions"]
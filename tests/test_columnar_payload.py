@@ -0,0 +1,43 @@
+# tests/test_columnar_payload.py
+
+import numpy as np
+import pandas as pd
+from fastapi.testclient import TestClient
+
+from app.api import app
+from src.config import DATA_DIR
+from src.payloads import columns_from_frame, frame_from_columns
+
+
+def _load_sample(n_rows: int = 25) -> pd.DataFrame:
+    return pd.read_csv(DATA_DIR / "test_portfolio_stressed.csv").head(n_rows)
+
+
+def test_columnar_and_record_payloads_score_identically():
+    df = _load_sample()
+    records = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+    with TestClient(app) as client:
+        by_records = client.post("/predict", json={"records": records}).json()
+        by_columns = client.post("/predict", json={"columns": columns_from_frame(df)}).json()
+
+    assert by_columns["n_records"] == len(df)
+    assert by_columns["predictions"] == by_records["predictions"]
+    assert by_columns["probabilities"] == by_records["probabilities"]
+
+
+def test_frame_from_columns_maps_null_to_nan():
+    df = frame_from_columns({"age": [45, None], "MonthlyIncome": [None, 5000.0]})
+    assert df.dtypes.tolist() == [np.float64, np.float64]
+    assert df["age"].isna().tolist() == [False, True]
+
+
+def test_invalid_columnar_payloads_are_rejected():
+    with TestClient(app) as client:
+        mismatched = client.post("/predict", json={"columns": {"age": [45, 31], "DebtRatio": [0.1]}})
+        both = client.post("/predict", json={"records": [{"age": 45}], "columns": {"age": [45]}})
+        empty = client.post("/predict", json={"columns": {}})
+
+    assert mismatched.status_code == 400
+    assert both.status_code == 400
+    assert empty.status_code == 400
@@ -0,0 +1,79 @@
+# tests/test_compact_dtypes.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.config import DATA_DIR
+from src.data_preprocessing import compact_frame, fit_preprocessing, prepare_training
+from src.feature_registry import FEATURES, to_compact
+from src.inference import predict_from_raw
+
+
+def _load_portfolios() -> pd.DataFrame:
+    parts = [
+        pd.read_csv(DATA_DIR / f"test_portfolio_{name}.csv")
+        for name in ["low_risk", "mixed", "stressed"]
+    ]
+    return pd.concat(parts, ignore_index=True)
+
+
+def test_compact_plan_dtypes_and_memory():
+    """
+    Bayraklar int8, sayaçlar int8/int16, oranlar float32, bin'ler kategori
+    kodu olmalı; hazır tablo belleği en az yarıya inmeli.
+    """
+    df_raw = _load_portfolios()
+    state = fit_preprocessing(df_raw)
+
+    full = prepare_training(df_raw, state=state, fused=True)
+    compact = prepare_training(compact_frame(df_raw), state=state, compact=True)
+
+    assert list(compact.columns) == list(full.columns)
+    assert compact["HighUtilizationFlag"].dtype == np.int8
+    assert compact["EverDelinquent"].dtype == np.int8
+    assert compact["NumberOfOpenCreditLinesAndLoans"].dtype == np.int8
+    assert compact["DelinquencySeverityScore"].dtype == np.int16
+    assert compact["DebtToIncomeRatio"].dtype == np.float32
+    assert compact["AgeBin"].cat.codes.dtype == np.int8
+
+    assert compact.memory_usage(deep=True).sum() <= 0.5 * full.memory_usage(deep=True).sum()
+    np.testing.assert_allclose(
+        compact["DebtToIncomeRatio"].to_numpy(np.float64),
+        full["DebtToIncomeRatio"].to_numpy(),
+        rtol=1e-6,
+    )
+
+
+def test_compact_predictions_match_within_tolerance():
+    """Kompakt plan ile skorlar float32 hassasiyetinde aynı kalmalı."""
+    df_raw = _load_portfolios()
+
+    y_pred, y_proba = predict_from_raw(df_raw)
+    y_pred_c, y_proba_c = predict_from_raw(compact_frame(df_raw), compact=True)
+
+    np.testing.assert_allclose(y_proba_c, y_proba, atol=1e-4)
+    assert (y_pred_c != y_pred).mean() <= 0.001
+
+
+def test_to_compact_falls_back_to_float32():
+    """Tamsayı hedefe sığmayan değerler (NaN, taşma) float32'ye düşmeli."""
+    assert to_compact(np.array([1.0, np.nan]), "int8").dtype == np.float32
+    assert to_compact(np.array([1, 300]), "int8").dtype == np.float32
+    assert to_compact(np.array([0.0, 98.0]), "int8").dtype == np.int8
+
+    # Kompakt int8 girdiler kernel içinde taşmamalı (58 * 54 > 127)
+    spec = FEATURES["OpenLines_x_RealEstate"]
+    df = pd.DataFrame({"NumberOfOpenCreditLinesAndLoans": [58], "NumberRealEstateLoansOrLines": [54]})
+    out = prepare_training(compact_frame(df), compact=True)
+    assert spec.dtype == "int16"
+    assert out["OpenLines_x_RealEstate"].iloc[0] == 58 * 54
+
+
+@pytest.mark.parametrize("column", ["AgeBin", "DelinqBin"])
+def test_compact_frame_encodes_string_bins(column):
+    """CSV'den string gelen bin'ler int8 kodlu Categorical'a çevrilmeli."""
+    df = pd.DataFrame({column: ["0", None] if column == "DelinqBin" else ["18-30", None]})
+    out = compact_frame(df)
+    assert isinstance(out[column].dtype, pd.CategoricalDtype)
+    assert out[column].isna().tolist() == [False, True]
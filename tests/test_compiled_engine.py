@@ -0,0 +1,52 @@
+# tests/test_compiled_engine.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.config import DATA_DIR
+from src.data_preprocessing import prepare_training
+from src.inference import predict_from_raw
+from src.predict import predict_from_df
+
+BIN_COLS = ["AgeBin", "IncomeBin", "UtilizationBin", "DelinqBin"]
+
+
+@pytest.mark.parametrize("portfolio", ["low_risk", "mixed", "stressed"])
+def test_compiled_engine_matches_sklearn_pipeline(portfolio):
+    """
+    Compiled engine, sklearn Pipeline ile birebir aynı olasılık ve
+    etiketleri üretmeli.
+    """
+    df_raw = pd.read_csv(DATA_DIR / f"test_portfolio_{portfolio}.csv")
+
+    y_pred, y_proba = predict_from_raw(df_raw, engine="sklearn")
+    c_pred, c_proba = predict_from_raw(df_raw, engine="compiled")
+
+    np.testing.assert_array_equal(c_proba, y_proba)
+    np.testing.assert_array_equal(c_pred, y_pred)
+
+
+def test_compiled_engine_handles_string_and_unknown_bins():
+    """
+    CSV'den okunmuş gibi string bin'ler, NaN ve bilinmeyen label'lar
+    OneHotEncoder(handle_unknown='ignore') ile aynı işlenmeli.
+    """
+    df_raw = pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv")
+    df = prepare_training(df_raw)
+    df.insert(0, "SeriousDlqin2yrs", 0)
+    for col in BIN_COLS:
+        df[col] = df[col].astype(object)
+    df.loc[df.index[:3], "IncomeBin"] = "bilinmeyen"
+    df.loc[df.index[3:6], "UtilizationBin"] = np.nan
+
+    _, y_proba = predict_from_df(df)
+    _, c_proba = predict_from_df(df, engine="compiled")
+
+    np.testing.assert_array_equal(c_proba, y_proba)
+
+
+def test_unknown_engine_raises():
+    df = prepare_training(pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv").head(5))
+    with pytest.raises(ValueError):
+        predict_from_df(df, engine="gpu")
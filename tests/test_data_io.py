@@ -0,0 +1,77 @@
+# tests/test_data_io.py
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from src.config import DATA_DIR
+from src.data_io import ChunkReader, ChunkWriter, read_table, write_table
+from src.data_preprocessing import prepare_training
+from src.pipeline import inference_pipeline, stream_inference_pipeline
+from src.predict import get_model_input_columns, predict_from_df
+
+pytest.importorskip("pyarrow")
+
+
+def _prepared() -> pd.DataFrame:
+    return prepare_training(pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv"))
+
+
+def test_parquet_round_trip_keeps_dtypes_and_categoricals(tmp_path):
+    """
+    Parquet, CSV'nin aksine dtype'ları ve kategorik bin'leri korumalı;
+    projection ile sadece istenen kolonlar okunmalı.
+    """
+    df = _prepared()
+    path = tmp_path / "prepared.parquet"
+    write_table(df, path)
+
+    pdt.assert_frame_equal(read_table(path), df.reset_index(drop=True))
+
+    columns = get_model_input_columns()
+    projected = read_table(path, columns=columns)
+    assert list(projected.columns) == columns
+    assert isinstance(projected["IncomeBin"].dtype, pd.CategoricalDtype)
+
+    _, expected = predict_from_df(df)
+    _, y_proba = predict_from_df(projected)
+    np.testing.assert_array_equal(y_proba, expected)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".csv.gz", ".parquet"])
+def test_chunk_reader_and_writer_round_trip(tmp_path, suffix):
+    df = pd.read_csv(DATA_DIR / "test_portfolio_low_risk.csv")
+    src_path = tmp_path / f"raw{suffix}"
+    write_table(df, src_path)
+
+    out_path = tmp_path / f"out{suffix}"
+    with ChunkReader(src_path, chunksize=120) as reader, ChunkWriter(out_path) as writer:
+        for chunk in reader:
+            writer.write(chunk)
+        assert reader.progress() == pytest.approx(1.0)
+
+    assert writer.n_chunks == 5
+    pdt.assert_frame_equal(read_table(out_path), df)
+
+
+def test_pipelines_accept_parquet_input_and_output(tmp_path):
+    """
+    inference_pipeline ve streaming mod Parquet girdi / çıktı ile
+    CSV yolundaki aynı skorları üretmeli.
+    """
+    df = _prepared()
+    csv_path = tmp_path / "prepared.csv"
+    parquet_path = tmp_path / "prepared.parquet"
+    write_table(df, csv_path)
+    write_table(df, parquet_path)
+
+    from_csv = inference_pipeline(csv_path, tmp_path / "pred.csv")
+    from_parquet = inference_pipeline(parquet_path, tmp_path / "pred.parquet")
+    stream_inference_pipeline(parquet_path, tmp_path / "stream.parquet", chunksize=97)
+
+    expected = from_csv["Default_Probability"].to_numpy()
+    np.testing.assert_array_equal(from_parquet["Default_Probability"].to_numpy(), expected)
+    np.testing.assert_array_equal(
+        read_table(tmp_path / "stream.parquet")["Default_Probability"].to_numpy(), expected
+    )
@@ -0,0 +1,55 @@
+# tests/test_feature_pruning.py
+
+import joblib
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from src.config import DATA_DIR, FINAL_MODEL
+from src.data_preprocessing import prepare_training, required_columns
+
+
+def _model_features():
+    return joblib.load(FINAL_MODEL)["features"]
+
+
+def test_required_columns_skip_dropped_features():
+    """
+    Modelin features listesinden türetilen küme, feature selection ile atılan
+    türevleri içermemeli; ara bağımlılıkları (TotalDelinquency) içermeli.
+    """
+    needed = required_columns(_model_features())
+
+    for col in ["Income_x_Age", "MonthlyIncome_log1p", "CreditLineDensity"]:
+        assert col not in needed
+    for col in ["TotalDelinquency", "DebtToIncomeRatio", "AgeBin", "DelinqBin"]:
+        assert col in needed
+
+
+@pytest.mark.parametrize("fused", [False, True])
+def test_pruned_preparation_keeps_model_schema(fused):
+    """
+    Model feature'larına göre budanmış hazırlık, tam zincirle aynı
+    çıktıyı üretmeli.
+    """
+    df_raw = pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv")
+
+    pdt.assert_frame_equal(
+        prepare_training(df_raw, fused=fused, features=_model_features()),
+        prepare_training(df_raw),
+    )
+
+
+@pytest.mark.parametrize("fused", [False, True])
+def test_subset_features_compute_only_their_dependencies(fused):
+    """
+    Daha küçük bir feature listesi verildiğinde sadece o türevler üretilmeli.
+    """
+    df_raw = pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv")
+    features = ["age", "HighDebtFlag", "DelinqBin_0", "DelinqBin_4+"]
+
+    prepared = prepare_training(df_raw, fused=fused, features=features)
+    derived = [c for c in prepared.columns if c not in df_raw.columns]
+
+    assert derived == ["DebtToIncomeRatio", "HighDebtFlag", "DelinqBin"]
+    pdt.assert_frame_equal(prepared[derived], prepare_training(df_raw)[derived])
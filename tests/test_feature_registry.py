@@ -0,0 +1,163 @@
+# tests/test_feature_registry.py
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from src import data_preprocessing, feature_engineering
+from src.config import DATA_DIR
+from src.feature_registry import (
+    BIN_SPECS,
+    FEATURES,
+    NOTEBOOK,
+    RAW_FEATURE_COLS,
+    VARIANTS,
+    apply_features,
+    build_plan,
+    compute_features,
+    dependencies,
+    downstream,
+)
+
+
+def _load_clean() -> pd.DataFrame:
+    df_raw = pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv")
+    return data_preprocessing.clean_basic(df_raw)
+
+
+def test_registry_order_is_topological():
+    """
+    Her feature'ın girdileri ya ham kolon ya da daha önce kayıtlı olmalı.
+    """
+    seen = set(RAW_FEATURE_COLS)
+    for name, spec in FEATURES.items():
+        assert set(spec.inputs) <= seen, name
+        seen.add(name)
+
+
+def test_plan_levels_group_independent_features():
+    """
+    Aynı seviyedeki feature'lar birbirine bağımlı olmamalı.
+    """
+    plan = build_plan(frozenset(RAW_FEATURE_COLS), frozenset(FEATURES))
+
+    computed = set(RAW_FEATURE_COLS)
+    for level in plan.levels:
+        for name in level:
+            assert set(FEATURES[name].inputs) <= computed
+        computed.update(level)
+    assert plan.order == list(FEATURES)
+
+
+def test_parallel_execution_and_timings_match_serial():
+    """
+    n_jobs > 1 ile paralel çalıştırma aynı sonucu vermeli ve feature başına
+    süre raporlanmalı.
+    """
+    df = _load_clean()
+    columns = {c: df[c] for c in df.columns}
+
+    serial = compute_features(columns, FEATURES)
+    timings = {}
+    parallel = compute_features(columns, FEATURES, n_jobs=4, timings=timings)
+
+    assert list(serial) == list(parallel)
+    for name in serial:
+        pdt.assert_series_equal(pd.Series(serial[name]), pd.Series(parallel[name]))
+    assert set(timings) == set(FEATURES)
+
+
+def test_selective_recomputation_of_downstream_features():
+    """
+    DebtRatio değişince sadece ona bağlı türevler yeniden hesaplanmalı.
+    """
+    affected = downstream(["DebtRatio"])
+
+    assert "DebtToIncomeRatio" in affected
+    assert "HighDebtFlag" in affected
+    assert "AgeBin" not in affected
+    assert "EverDelinquent" not in affected
+
+    df = _load_clean()
+    columns = {c: df[c] for c in df.columns}
+    result = compute_features(columns, dependencies(["HighDebtFlag"]))
+    assert list(result) == ["DebtToIncomeRatio", "HighDebtFlag"]
+
+
+def test_severity_score_fills_missing_columns_one_by_one():
+    """
+    Eksik bir gecikme kolonu skoru sıfırlamamalı; baseline gibi
+    (df.get(col, 0)) sadece o kolon 0 sayılmalı.
+    """
+    df = _load_clean().drop(columns=["NumberOfTime60-89DaysPastDueNotWorse"])
+
+    out = data_preprocessing.add_delinquency_features(df)
+
+    expected = df["NumberOfTime30-59DaysPastDueNotWorse"] * 1 + df["NumberOfTimes90DaysLate"] * 3
+    np.testing.assert_array_equal(out["DelinquencySeverityScore"], expected)
+    assert (out["DelinquencySeverityScore"] > 0).any()
+    # TotalDelinquency baseline'daki gibi tüm kolonlar yoksa 0
+    assert (out["TotalDelinquency"] == 0).all()
+
+
+def test_feature_engineering_keeps_notebook_definitions():
+    """
+    Deneysel feature_engineering modülü registry'nin NOTEBOOK varyantını
+    kullanır (farklı eşikler, eksik değerler 0).
+    """
+    df = pd.DataFrame({
+        "RevolvingUtilizationOfUnsecuredLines": [1.0, 1.5, np.nan, 0.2],
+        "DebtRatio": [0.5, np.inf, 0.3, 2.0],
+        "MonthlyIncome": [3000.0, np.nan, 6000.0, 0.0],
+        "DebtToIncomeRatio": [0.4, 0.41, np.inf, 0.0],
+        "NumberOfTime30-59DaysPastDueNotWorse": [0, 1, 0, 0],
+        "NumberOfTime60-89DaysPastDueNotWorse": [0, 0, 1, 0],
+        "NumberOfTimes90DaysLate": [0, 0, 0, 2],
+    })
+
+    out = feature_engineering.apply_all_feature_engineering(df)
+
+    assert out["HighUtilizationFlag"].tolist() == [0, 1, 0, 0]
+    assert out["Utilization_x_DebtRatio"].tolist() == [0.5, 0.0, 0.0, 0.4]
+    assert out["HighUtil_x_DebtRatio"].tolist() == [0.0, 0.0, 0.0, 0.0]
+    assert out["EffectiveDebtLoad"].tolist() == [1500.0, 0.0, 1800.0, 0.0]
+    assert out["HighDebtFlag"].tolist() == [0, 1, 0, 0]
+    assert out["IncomeBin"].astype(str).tolist() == ["3-6k", "0-3k", "6-10k", "0-3k"]
+
+    # Tanımlar ikinci bir kopyadan değil, registry varyantından gelmeli
+    targets = [c for c in out.columns if c not in df.columns]
+    expected = apply_features(df, targets, variant=NOTEBOOK)
+    pdt.assert_frame_equal(out, expected[out.columns])
+    assert {
+        "HighUtilizationFlag", "HighDebtFlag", "IncomeBin", "EffectiveDebtLoad",
+    } <= set(VARIANTS[NOTEBOOK])
+
+
+def test_unknown_variant_is_rejected():
+    """Bilinmeyen varyant adı sessizce varsayılan tanımlara düşmemeli."""
+    df = pd.DataFrame({"RevolvingUtilizationOfUnsecuredLines": [0.5]})
+    with pytest.raises(ValueError):
+        compute_features({c: df[c] for c in df.columns}, ["HighUtilizationFlag"], variant="yok")
+
+
+def test_searchsorted_bins_match_pd_cut():
+    """
+    Bin kernel'ları (searchsorted kodları + label metadata) sınır, sıfır,
+    negatif, sonsuz ve NaN değerlerde pd.cut ile aynı Categorical'ı üretmeli.
+    """
+    rng = np.random.default_rng(0)
+    for bin_col, (source_col, bins, labels, right) in BIN_SPECS.items():
+        finite = [b for b in bins if np.isfinite(b)]
+        values = np.concatenate([
+            rng.uniform(-1, finite[-1] * 2, 500),
+            finite,
+            np.nextafter(finite, np.inf),
+            [-np.inf, np.inf, np.nan],
+        ])
+
+        result = FEATURES[bin_col].kernel(values)
+        expected = pd.cut(values, bins=bins, labels=labels, right=right)
+
+        assert result.codes.dtype == np.int8
+        pdt.assert_series_equal(pd.Series(result), pd.Series(expected))
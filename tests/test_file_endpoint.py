@@ -0,0 +1,47 @@
+# tests/test_file_endpoint.py
+
+import gzip
+import io
+
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import app
+from src.config import DATA_DIR
+from src.pipeline import inference_pipeline
+
+RAW_PATH = DATA_DIR / "test_portfolio_mixed.csv"
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_file_endpoint_matches_inference_pipeline(compress):
+    """
+    Parça parça skorlanan CSV yüklemesi, dosyayı inference_pipeline ile
+    tek seferde skorlamakla aynı tabloyu vermeli (gzip'li veya değil).
+    """
+    body = RAW_PATH.read_bytes()
+    if compress:
+        body = gzip.compress(body)
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/predict/file?chunk_size=64", content=body, headers={"content-type": "text/csv"}
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    expected = inference_pipeline(RAW_PATH, raw=True)
+    pdt.assert_frame_equal(pd.read_csv(io.BytesIO(response.content)), expected, check_dtype=False)
+
+
+def test_file_endpoint_rejects_bad_uploads():
+    with TestClient(app) as client:
+        missing = client.post("/predict/file", content=b"age,DebtRatio\n40,0.2\n")
+        empty = client.post("/predict/file", content=b"")
+        corrupt = client.post("/predict/file", content=gzip.compress(b"age\n40\n")[:12])
+
+    assert missing.status_code == 400
+    assert empty.status_code == 400
+    assert corrupt.status_code == 400
@@ -0,0 +1,45 @@
+# tests/test_fused_preprocessing.py
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from src.config import DATA_DIR
+from src.data_preprocessing import fit_preprocessing, prepare_training
+
+
+@pytest.mark.parametrize("portfolio", ["low_risk", "mixed", "stressed"])
+def test_fused_matches_staged_chain(portfolio):
+    """
+    Fused mod, sıralı zincir ile aynı şema ve değerleri üretmeli
+    (hem batch istatistikleriyle hem de fit edilmiş state ile).
+    """
+    df_raw = pd.read_csv(DATA_DIR / f"test_portfolio_{portfolio}.csv")
+    state = fit_preprocessing(df_raw)
+
+    pdt.assert_frame_equal(prepare_training(df_raw, fused=True), prepare_training(df_raw))
+    pdt.assert_frame_equal(
+        prepare_training(df_raw, state=state, fused=True),
+        prepare_training(df_raw, state=state),
+    )
+
+
+def test_fused_handles_edge_values_and_extra_columns():
+    """
+    age == 0, sıfır gelir, 98 sentinel'i, NaN oranlar, hedef ve ekstra
+    kolonlar fused modda da sıralı zincirle aynı işlenmeli.
+    """
+    df_raw = pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv")
+    df_raw.insert(1, "SeriousDlqin2yrs", 0)
+    df_raw["CustomerID"] = range(len(df_raw))
+    df_raw.loc[:5, "age"] = 0
+    df_raw.loc[6:9, "MonthlyIncome"] = 0
+    df_raw.loc[10, "NumberOfTimes90DaysLate"] = 98
+    df_raw.loc[11, "RevolvingUtilizationOfUnsecuredLines"] = np.nan
+    df_raw.loc[12, "DebtRatio"] = np.nan
+
+    pdt.assert_frame_equal(prepare_training(df_raw, fused=True), prepare_training(df_raw))
+    pdt.assert_frame_equal(
+        prepare_training(df_raw.head(1), fused=True), prepare_training(df_raw.head(1))
+    )
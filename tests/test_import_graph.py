@@ -0,0 +1,46 @@
+# tests/test_import_graph.py
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.config import IMPORT_BUDGET_MS
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+TRAINING_ONLY = ["sklearn.model_selection", "sklearn.metrics", "xgboost", "joblib", "matplotlib", "shap"]
+
+
+def _loaded_after_import(module: str):
+    code = f"import sys; import {module}; print(','.join(m for m in {TRAINING_ONLY!r} if m in sys.modules))"
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    return [m for m in out.stdout.strip().split(",") if m]
+
+
+@pytest.mark.parametrize("module", ["app.api", "src.inference", "src.pipeline"])
+def test_serving_import_skips_training_modules(module):
+    assert _loaded_after_import(module) == []
+
+
+def test_serving_import_fits_budget():
+    """
+    `import app.api` yeni bir process'te IMPORT_BUDGET_MS içinde kalmalı.
+    CI makinelerindeki gürültü için 3 ölçümün en hızlısı, bütçenin 2 katı
+    payla karşılaştırılır (kesin ölçüm: benchmarks/bench_import.py).
+    """
+    code = (
+        "import time; start = time.perf_counter(); import app.api; "
+        "print((time.perf_counter() - start) * 1000)"
+    )
+    timings = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+            ).stdout.strip().splitlines()[-1]
+        )
+        for _ in range(3)
+    ]
+    assert min(timings) < 2 * IMPORT_BUDGET_MS, timings
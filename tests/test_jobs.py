@@ -0,0 +1,195 @@
+# tests/test_jobs.py
+
+import io
+import socket
+import sqlite3
+import subprocess
+import sys
+import time
+
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+from fastapi.testclient import TestClient
+
+import app.api as api
+from src.config import DATA_DIR
+from src.jobs import DONE, QUEUED, RUNNING, JobManager, JobStore, process_owner
+from src.pipeline import inference_pipeline
+
+RAW_PATH = DATA_DIR / "test_portfolio_mixed.csv"
+
+
+def _dead_owner() -> str:
+    """Bu host'ta artık yaşamayan bir process'in sahip kimliği."""
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return f"{socket.gethostname()}:{proc.pid}"
+
+
+def _queued_job(store: JobStore, job_id: str = "job") -> str:
+    store.create(
+        {
+            "id": job_id,
+            "status": QUEUED,
+            "input_path": str(RAW_PATH),
+            "output_path": "out.csv",
+            "raw": 1,
+            "chunk_size": 100,
+            "created_at": time.time(),
+        }
+    )
+    return job_id
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(api, "jobs", JobManager(jobs_dir=tmp_path, max_workers=1))
+    with TestClient(api.app) as client:
+        yield client
+
+
+def _poll(client: TestClient, job_id: str, timeout: float = 30.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        job = client.get(f"/jobs/{job_id}").json()
+        if job["status"] not in (QUEUED, RUNNING) or time.monotonic() > deadline:
+            return job
+        time.sleep(0.05)
+
+
+def test_jobs_from_path_and_upload_match_inference_pipeline(client):
+    expected = inference_pipeline(RAW_PATH, raw=True)
+
+    by_path = client.post("/jobs?chunk_size=64", json={"path": RAW_PATH.name})
+    by_upload = client.post(
+        "/jobs?chunk_size=64", content=RAW_PATH.read_bytes(), headers={"content-type": "text/csv"}
+    )
+    assert by_path.status_code == by_upload.status_code == 202
+
+    for submitted in (by_path.json(), by_upload.json()):
+        job = _poll(client, submitted["id"])
+        assert job["status"] == DONE
+        assert job["n_rows"] == len(expected)
+        assert job["n_chunks"] == 8
+        assert job["progress"] == 1.0
+        assert job["rows_per_sec"] > 0 and job["latency_s"] >= job["elapsed_s"]
+
+        result = client.get(f"/jobs/{submitted['id']}/result")
+        assert result.status_code == 200
+        pdt.assert_frame_equal(pd.read_csv(io.BytesIO(result.content)), expected, check_dtype=False)
+
+
+def test_jobs_reject_bad_requests(client):
+    outside = client.post("/jobs", json={"path": "../src/config.py"})
+    missing = client.post("/jobs", json={"path": "does_not_exist.csv"})
+    unknown = client.get("/jobs/nope")
+
+    assert outside.status_code == 400
+    assert missing.status_code == 400
+    assert unknown.status_code == 404
+
+    failed = client.post("/jobs", content=b"age\n40\n", headers={"content-type": "text/csv"}).json()
+    job = _poll(client, failed["id"])
+    assert job["status"] == "failed" and job["error"]
+    assert client.get(f"/jobs/{failed['id']}/result").status_code == 409
+
+
+def test_interrupted_jobs_resume_after_restart(tmp_path):
+    """
+    Process çalışırken ölürse job `running` kalır; yeni bir manager
+    başladığında kuyruğa geri alınıp tamamlanmalı.
+    """
+    manager = JobManager(jobs_dir=tmp_path)
+    job_id = manager.submit(RAW_PATH, chunk_size=100)["id"]
+    manager.wait(job_id, timeout=30)
+    manager.store.update(job_id, status=RUNNING, progress=0.4, n_rows=200, owner=_dead_owner())
+    manager.shutdown()
+
+    with JobManager(jobs_dir=tmp_path) as restarted:
+        job = restarted.wait(job_id, timeout=30)
+
+    assert job["status"] == DONE
+    assert job["n_rows"] == 500
+
+
+def test_claim_is_atomic(tmp_path):
+    """Aynı job'u iki worker sahiplenmeye çalışırsa sadece biri kazanmalı."""
+    store = JobStore(tmp_path / "jobs.sqlite")
+    job_id = _queued_job(store)
+
+    claims = [store.claim(job_id, owner, time.time()) for owner in ("a:1", "b:2")]
+
+    assert claims == [True, False]
+    job = store.get(job_id)
+    assert job["status"] == RUNNING and job["owner"] == "a:1"
+
+
+def test_requeue_skips_jobs_of_live_workers(tmp_path):
+    """
+    Başlayan process sadece sahibi ölmüş veya heartbeat'i eskimiş job'ları
+    kuyruğa almalı; canlı bir worker'ın job'u (ve ilerlemesi) korunmalı.
+    """
+    store = JobStore(tmp_path / "jobs.sqlite")
+    now = time.time()
+    jobs = {
+        "live": (process_owner(), now),
+        "other_host": ("another-host:1", now),
+        "dead_pid": (_dead_owner(), now),
+        "stale": ("another-host:1", now - 3600),
+    }
+    for job_id, (owner, heartbeat_at) in jobs.items():
+        _queued_job(store, job_id)
+        store.claim(job_id, owner, heartbeat_at)
+        store.update(job_id, n_rows=200, progress=0.4)
+
+    assert store.requeue_running(stale_s=60) == 2
+
+    status = {job_id: store.get(job_id) for job_id in jobs}
+    assert status["live"]["status"] == status["other_host"]["status"] == RUNNING
+    assert status["live"]["n_rows"] == 200
+    assert status["dead_pid"]["status"] == status["stale"]["status"] == QUEUED
+    assert status["dead_pid"]["owner"] is None and status["stale"]["progress"] == 0
+
+
+def test_running_job_is_not_requeued_by_second_manager(tmp_path):
+    """
+    Aynı JOBS_DB'yi paylaşan ikinci manager başladığında diğerinin çalışan
+    job'u kuyruğa alınmamalı; heartbeat çalışan job'larda güncellenmeli.
+    """
+    first = JobManager(jobs_dir=tmp_path).start()
+    job_id = _queued_job(first.store)
+    first.store.claim(job_id, first.owner, time.time() - 10)
+    try:
+        assert first.store.heartbeat(first.owner) == 1
+        assert first.store.get(job_id)["heartbeat_at"] > time.time() - 5
+
+        second = JobManager(jobs_dir=tmp_path).start()
+        second.shutdown()
+        assert first.store.get(job_id)["status"] == RUNNING
+    finally:
+        first.shutdown()
+
+
+def test_store_migrates_old_schema(tmp_path):
+    """owner / heartbeat_at kolonları olmayan eski JOBS_DB açılabilmeli."""
+    path = tmp_path / "jobs.sqlite"
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE jobs (id TEXT PRIMARY KEY, status TEXT NOT NULL, input_path TEXT NOT NULL, "
+            "output_path TEXT NOT NULL, raw INTEGER NOT NULL, chunk_size INTEGER NOT NULL, "
+            "owns_input INTEGER NOT NULL DEFAULT 0, n_rows INTEGER NOT NULL DEFAULT 0, "
+            "n_chunks INTEGER NOT NULL DEFAULT 0, progress REAL NOT NULL DEFAULT 0, error TEXT, "
+            "created_at REAL NOT NULL, started_at REAL, finished_at REAL, queue_s REAL, "
+            "elapsed_s REAL, latency_s REAL, rows_per_sec REAL, avg_chunk_ms REAL)"
+        )
+        conn.execute(
+            "INSERT INTO jobs (id, status, input_path, output_path, raw, chunk_size, created_at) "
+            "VALUES ('old', 'running', 'in.csv', 'out.csv', 1, 100, 0)"
+        )
+    conn.close()
+
+    store = JobStore(path)
+
+    assert store.requeue_running() == 1
+    assert store.get("old")["status"] == QUEUED
@@ -0,0 +1,112 @@
+# tests/test_matrix_cache.py
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from src import pipeline
+from src.config import DATA_DIR
+from src.data_preprocessing import PREPROCESSING_STATE_KEY, prepare_training
+from src.matrix_cache import MatrixCache, cache_key, load_prepared_matrix
+from src.pipeline import train_pipeline
+from src.predict import predict_from_df
+from src.synthetic import generate
+
+
+def _prepared_with_target() -> pd.DataFrame:
+    df_raw = pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv")
+    df_raw.insert(1, "SeriousDlqin2yrs", np.arange(len(df_raw)) % 2)
+    return prepare_training(df_raw)
+
+
+def test_cache_round_trip_is_memory_mapped_and_scores_identically(tmp_path):
+    """
+    Önbellekten açılan matris memmap olmalı, DataFrame görünümü kopyasız
+    kurulmalı ve model aynı skorları üretmeli (XGBoost zaten float32 kullanır).
+    """
+    df = _prepared_with_target()
+    cache = MatrixCache(tmp_path)
+    cache.put("k", {"train": df.iloc[:300], "val": df.iloc[300:]}, "SeriousDlqin2yrs", meta={"a": 1})
+
+    entry = cache.get("k")
+    assert entry.meta == {"a": 1}
+    assert entry.parts == ["train", "val"]
+
+    val = entry["val"]
+    assert isinstance(val.X, np.memmap)
+    assert len(val) == len(df) - 300
+    np.testing.assert_array_equal(val.y, df["SeriousDlqin2yrs"].iloc[300:].to_numpy())
+
+    frame = val.to_frame()
+    assert np.shares_memory(frame["DebtToIncomeRatio"].to_numpy(), val.X)
+    pdt.assert_series_equal(
+        frame["IncomeBin"], df["IncomeBin"].iloc[300:].reset_index(drop=True)
+    )
+
+    _, expected = predict_from_df(df.iloc[300:])
+    _, y_proba = predict_from_df(frame)
+    np.testing.assert_array_equal(y_proba, expected)
+
+
+def test_cache_key_tracks_content_and_params(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a\n1\n")
+
+    key = cache_key(path, seed=42)
+    assert key == cache_key(path, seed=42)
+    assert key != cache_key(path, seed=43)
+
+    path.write_text("a\n2\n")
+    assert key != cache_key(path, seed=42)
+
+
+def test_load_prepared_matrix_builds_once(tmp_path):
+    """
+    Hazır CSV ilk çağrıda önbelleğe yazılmalı, sonraki çağrılar aynı
+    girişi açmalı (string bin'ler registry kodlarına çevrilir).
+    """
+    df = _prepared_with_target()
+    csv_path = tmp_path / "prepared.csv"
+    df.to_csv(csv_path, index=False)
+    cache_dir = tmp_path / "cache"
+
+    first = load_prepared_matrix(csv_path, cache_dir=cache_dir)
+    second = load_prepared_matrix(csv_path, cache_dir=cache_dir)
+
+    assert len(list(cache_dir.iterdir())) == 1
+    np.testing.assert_array_equal(first.X, second.X)
+    pdt.assert_series_equal(second.to_frame()["DelinqBin"], df["DelinqBin"])
+
+
+def test_unknown_bin_labels_are_rejected(tmp_path):
+    df = _prepared_with_target()
+    df["IncomeBin"] = df["IncomeBin"].astype(object)
+    df.loc[0, "IncomeBin"] = "bilinmeyen"
+
+    with pytest.raises(ValueError):
+        MatrixCache(tmp_path).put("k", {"all": df}, "SeriousDlqin2yrs")
+    assert MatrixCache(tmp_path).get("k") is None
+
+
+def test_training_with_cache_matches_training_without(tmp_path, monkeypatch):
+    """
+    Önbellek opt-in: varsayılan eğitim diske yazmamalı; önbellekle (boş
+    veya dolu) eğitilen model, önbelleksiz eğitilen modelle aynı olmalı.
+    """
+    raw_path = tmp_path / "raw.csv"
+    generate(800, seed=5, target=True).to_csv(raw_path, index=False)
+    cache_dir = tmp_path / "matrix_cache"
+    monkeypatch.setattr(pipeline, "MatrixCache", lambda: MatrixCache(cache_dir))
+
+    plain = train_pipeline(raw_path, tmp_path / "plain.pkl")
+    assert not cache_dir.exists()
+    miss = train_pipeline(raw_path, tmp_path / "miss.pkl", use_matrix_cache=True)
+    hit = train_pipeline(raw_path, tmp_path / "hit.pkl", use_matrix_cache=True)
+    assert len(list(cache_dir.iterdir())) == 1
+
+    X = prepare_training(generate(500, seed=6), state=plain[PREPROCESSING_STATE_KEY])
+    expected = plain["model"].predict_proba(X)[:, 1]
+    for artifact in [miss, hit]:
+        assert artifact[PREPROCESSING_STATE_KEY] == plain[PREPROCESSING_STATE_KEY]
+        np.testing.assert_array_equal(artifact["model"].predict_proba(X)[:, 1], expected)
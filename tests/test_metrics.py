@@ -0,0 +1,69 @@
+# tests/test_metrics.py
+
+import re
+
+import pandas as pd
+from fastapi.testclient import TestClient
+
+from app.api import app
+from src.config import DATA_DIR
+from src.metrics import MetricsRegistry, SloTracker
+from src.payloads import columns_from_frame
+
+SAMPLE_LINE = re.compile(r'^[a-z_]+(\{([a-z_]+="[^"]*",?)+\})? -?[0-9.e+-]+$|^[a-z_]+(\{.*\})? \+Inf$')
+
+
+def _samples(text: str) -> dict:
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        assert SAMPLE_LINE.match(line), line
+        name, value = line.rsplit(" ", 1)
+        samples[name] = float(value)
+    return samples
+
+
+def test_slo_tracker_counts_breaches_per_window():
+    registry = MetricsRegistry()
+    slo = SloTracker(registry, window=4, avg_ms=100, p95_ms=200, p99_ms=500)
+
+    for latency in [0.01, 0.02, 0.03, 0.04]:  # hızlı pencere
+        slo.observe(latency)
+    for latency in [0.05, 0.05, 0.05, 0.30]:  # p95 aşılır, ortalama 0.1125 > 0.1
+        slo.observe(latency)
+
+    samples = _samples(registry.render())
+    assert samples["credit_risk_slo_windows_total"] == 2
+    assert samples['credit_risk_slo_breaches_total{target="avg"}'] == 1
+    assert samples['credit_risk_slo_breaches_total{target="p95"}'] == 1
+    assert samples['credit_risk_slo_breaches_total{target="p99"}'] == 0
+    assert samples['credit_risk_slo_requests_over_target_total{target="p95"}'] == 1
+    assert samples['credit_risk_slo_target_latency_seconds{target="p99"}'] == 0.5
+
+
+def test_metrics_endpoint_exposes_requests_stages_and_batches():
+    df = pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv")
+
+    with TestClient(app) as client:
+        before = _samples(client.get("/metrics").text)
+        assert client.post("/predict", json={"columns": columns_from_frame(df)}).status_code == 200
+        assert client.post("/predict", json={"records": []}).status_code == 400
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    after = _samples(response.text)
+
+    def delta(name):
+        return after.get(name, 0) - before.get(name, 0)
+
+    assert delta('credit_risk_requests_total{endpoint="/predict",method="POST",status="200"}') == 1
+    assert delta('credit_risk_requests_total{endpoint="/predict",method="POST",status="400"}') == 1
+    for stage in ["parse", "queue", "preprocess", "predict", "serialize"]:
+        assert delta(f'credit_risk_stage_latency_seconds_count{{stage="{stage}"}}') >= 1
+    assert delta('credit_risk_batch_size_rows_bucket{le="+Inf"}') == 1
+    assert delta("credit_risk_batch_size_rows_sum") == len(df)
+    assert after["credit_risk_requests_in_flight"] == 1  # /metrics isteğinin kendisi
+    assert after["credit_risk_model_loaded"] == 1
+    assert after["credit_risk_model_load_seconds"] > 0
@@ -0,0 +1,122 @@
+# tests/test_micro_batching.py
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+from fastapi.testclient import TestClient
+
+from app.api import app
+from src.batching import MicroBatcher, score_requests
+from src.config import DATA_DIR
+from src.inference import predict_from_raw
+
+
+def _requests():
+    """(JSON'daki gibi eksik değerleri None olan kayıtlar, aynı satırların DataFrame'i)"""
+    df_raw = pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv")
+    as_json = df_raw.astype(object).where(df_raw.notna(), None)
+    sizes = [1, 3, 1, 7, 20, 2, 1, 50]
+    bounds = np.cumsum([0] + sizes)
+    return [
+        (as_json.iloc[a:b].to_dict(orient="records"), df_raw.iloc[a:b].reset_index(drop=True))
+        for a, b in zip(bounds[:-1], bounds[1:])
+    ]
+
+
+def test_coalesced_results_match_individual_scoring():
+    """
+    Eşzamanlı istekler birleştirilmeli ve her istek kendi dilimini
+    tek başına predict_from_raw ile aynı olarak almalı.
+    """
+    requests = _requests()
+
+    async def run():
+        batcher = MicroBatcher(score_requests, max_batch_size=64, max_wait_ms=50)
+        try:
+            results = await asyncio.gather(*(batcher.submit(records) for records, _ in requests))
+            return results, batcher.stats()
+        finally:
+            await batcher.close()
+
+    results, stats = asyncio.run(run())
+
+    for (_, frame), (y_pred, y_proba) in zip(requests, results):
+        expected_pred, expected_proba = predict_from_raw(frame)
+        np.testing.assert_array_equal(y_pred, expected_pred)
+        np.testing.assert_array_equal(y_proba, expected_proba)
+
+    assert stats["n_requests"] == len(requests)
+    assert stats["n_batches"] < len(requests)
+    assert stats["max_batch_rows"] <= 64
+    assert sum(stats["batch_size_histogram"].values()) == stats["n_batches"]
+
+
+def test_failing_request_does_not_fail_the_batch():
+    """Hatalı istek sadece kendi çağıranına hata döndürmeli."""
+    requests = [records for records, _ in _requests()[:3]]
+    bad = [{"age": 40}]
+
+    async def run():
+        batcher = MicroBatcher(score_requests, max_batch_size=64, max_wait_ms=50)
+        try:
+            return await asyncio.gather(
+                *(batcher.submit(r) for r in [*requests, bad]), return_exceptions=True
+            )
+        finally:
+            await batcher.close()
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, tuple) for r in results[:-1])
+    assert isinstance(results[-1], KeyError)
+
+
+def test_loop_survives_errors_outside_scoring(monkeypatch):
+    """
+    Skorlama dışı bir hata (örn. _record) batch'in isteklerine dönmeli;
+    worker loop çalışmaya devam etmeli ve sonraki istekler skorlanmalı.
+    """
+    records, frame = _requests()[1]
+    batcher = MicroBatcher(score_requests, max_batch_size=64, max_wait_ms=0)
+
+    def broken_record(*args):
+        raise RuntimeError("metrik hatası")
+
+    async def run():
+        try:
+            with monkeypatch.context() as m:
+                m.setattr(batcher, "_record", broken_record)
+                failed = await asyncio.wait_for(
+                    asyncio.gather(batcher.submit(records), batcher.submit(records), return_exceptions=True),
+                    timeout=30,
+                )
+            recovered = await asyncio.wait_for(batcher.submit(records), timeout=30)
+            return failed, recovered, batcher.stats()
+        finally:
+            await batcher.close()
+
+    failed, (y_pred, y_proba), stats = asyncio.run(run())
+
+    assert all(isinstance(r, RuntimeError) for r in failed)
+    expected_pred, expected_proba = predict_from_raw(frame)
+    np.testing.assert_array_equal(y_pred, expected_pred)
+    np.testing.assert_array_equal(y_proba, expected_proba)
+    assert stats["n_errors"] == 2
+
+
+def test_predict_endpoint_and_batching_stats():
+    records, frame = _requests()[3]
+    expected_pred, expected_proba = predict_from_raw(frame)
+
+    with TestClient(app) as client:
+        response = client.post("/predict", json={"records": records})
+        assert response.status_code == 200
+        body = response.json()
+        assert body["predictions"] == expected_pred.tolist()
+        np.testing.assert_allclose(body["probabilities"], expected_proba, rtol=1e-6)
+
+        assert client.post("/predict", json={"records": [{"age": 40}]}).status_code == 400
+        assert client.post("/predict", json={"records": []}).status_code == 400
+
+        stats = client.get("/batching/stats").json()
+        assert stats["n_requests"] >= 2
@@ -0,0 +1,88 @@
+# tests/test_model_registry.py
+
+import os
+import shutil
+import threading
+
+import joblib
+
+from src.config import FINAL_MODEL
+from src.predict import ModelRegistry
+
+
+def _copy_model(tmp_path):
+    path = tmp_path / "model.pkl"
+    shutil.copy(FINAL_MODEL, path)
+    return path
+
+
+def test_registry_loads_once_and_counts_hits(tmp_path):
+    """
+    Paket bir kez yüklenmeli, sonraki çağrılar önbellekten dönmeli.
+    """
+    registry = ModelRegistry(_copy_model(tmp_path))
+
+    first = registry.get()
+    second = registry.get()
+
+    assert first is second
+    stats = registry.stats()
+    assert stats["cache_misses"] == 1
+    assert stats["cache_hits"] == 1
+    assert stats["reloads"] == 0
+    assert stats["last_load_time_ms"] > 0
+
+
+def test_registry_ignores_touch_without_content_change(tmp_path):
+    """
+    Sadece mtime değişirse (içerik aynı) paket yeniden yüklenmemeli.
+    """
+    path = _copy_model(tmp_path)
+    registry = ModelRegistry(path)
+    first = registry.get()
+
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    assert registry.get() is first
+    assert registry.stats()["reloads"] == 0
+
+
+def test_registry_hot_reloads_changed_artifact(tmp_path):
+    """
+    Dosya içeriği değişince yeni paket atomik olarak devreye alınmalı.
+    """
+    path = _copy_model(tmp_path)
+    registry = ModelRegistry(path)
+    first = registry.get()
+
+    package = dict(first)
+    package["threshold"] = 0.5
+    joblib.dump(package, path)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    second = registry.get()
+    assert second is not first
+    assert second["threshold"] == 0.5
+    assert registry.stats()["reloads"] == 1
+
+
+def test_registry_is_thread_safe(tmp_path):
+    """
+    Eşzamanlı ilk çağrılar paketi tek bir kez yüklemeli.
+    """
+    registry = ModelRegistry(_copy_model(tmp_path))
+    results = []
+
+    def worker():
+        results.append(registry.get())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len({id(p) for p in results}) == 1
+    assert registry.stats()["cache_misses"] == 1
@@ -0,0 +1,86 @@
+# tests/test_parallel_scorer.py
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from src import inference, parallel, pipeline
+from src.config import DATA_DIR
+from src.data_preprocessing import fit_preprocessing, prepare_training
+from src.inference import predict_from_raw
+from src.parallel import ParallelScorer
+from src.pipeline import inference_pipeline, stream_inference_pipeline
+from src.predict import predict_from_df
+
+
+def _load_raw() -> pd.DataFrame:
+    parts = [
+        pd.read_csv(DATA_DIR / f"test_portfolio_{name}.csv")
+        for name in ["low_risk", "mixed", "stressed"]
+    ]
+    return pd.concat(parts, ignore_index=True)
+
+
+def test_parallel_scorer_matches_single_process_in_input_order():
+    """
+    Shard'lara bölünüp process havuzunda skorlanan sonuçlar, tek çekirdekte
+    tüm batch'i skorlamakla aynı olmalı ve girdi sırasını korumalı.
+    """
+    df_raw = _load_raw()
+    y_pred, y_proba = predict_from_raw(df_raw)
+
+    with ParallelScorer(n_workers=2, shard_size=200) as scorer:
+        p_pred, p_proba = scorer.score(df_raw)
+        # Aynı havuz ikinci batch için tekrar kullanılabilmeli
+        h_pred, h_proba = scorer.score(prepare_training(df_raw), raw=False)
+        stats = scorer.last_stats
+
+    np.testing.assert_array_equal(p_proba, y_proba)
+    np.testing.assert_array_equal(p_pred, y_pred)
+
+    _, expected = predict_from_df(prepare_training(df_raw))
+    np.testing.assert_array_equal(h_proba, expected)
+
+    assert stats["n_shards"] == 8
+    assert stats["n_workers"] == 2
+    assert stats["rows_per_sec"] > 0
+
+
+def test_single_worker_runs_in_process():
+    df_raw = _load_raw().head(300)
+    scorer = ParallelScorer(n_workers=1, shard_size=100)
+
+    _, p_proba = scorer.score(df_raw)
+    _, y_proba = predict_from_raw(df_raw)
+
+    np.testing.assert_array_equal(p_proba, y_proba)
+    assert scorer._executor is None
+
+
+def test_given_state_is_used_for_every_chunk(monkeypatch):
+    """
+    Streaming'de her parça dosya geneli state ile skorlanmalı; parçalar
+    kendi medyan / quantile'ını fit etmemeli (pakette state olmasa bile).
+    """
+    monkeypatch.setattr(parallel, "get_preprocessing_state", lambda: None)
+    df_raw = _load_raw()
+    state = fit_preprocessing(df_raw)
+    expected = predict_from_df(prepare_training(df_raw, state=state))[1]
+
+    with ParallelScorer(n_workers=2, shard_size=50) as scorer:
+        probas = [scorer.score(df_raw.iloc[i:i + 150], state=state)[1] for i in range(0, len(df_raw), 150)]
+
+    np.testing.assert_array_equal(np.concatenate(probas), expected)
+
+
+def test_streaming_with_workers_matches_full_inference(tmp_path, monkeypatch):
+    monkeypatch.setattr(inference, "get_preprocessing_state", lambda: None)
+    monkeypatch.setattr(pipeline, "get_preprocessing_state", lambda: None)
+    input_path = DATA_DIR / "test_portfolio_mixed.csv"
+
+    full_path = tmp_path / "full.csv"
+    stream_path = tmp_path / "stream.csv"
+    inference_pipeline(input_path, full_path, raw=True)
+    stream_inference_pipeline(input_path, stream_path, chunksize=40, raw=True, n_workers=2, shard_size=15)
+
+    pdt.assert_frame_equal(pd.read_csv(stream_path), pd.read_csv(full_path))
@@ -0,0 +1,99 @@
+# tests/test_preprocessing_state.py
+
+import joblib
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from src.config import DATA_DIR, FINAL_MODEL
+from src.data_preprocessing import PREPROCESSING_STATE_KEY, fit_preprocessing, prepare_training
+from src.inference import predict_from_raw
+from src.pipeline import attach_state_pipeline
+from src.predict import get_preprocessing_state
+
+
+def _load_raw() -> pd.DataFrame:
+    return pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv")
+
+
+def test_fit_preprocessing_matches_batch_statistics():
+    """
+    Fit edilen sabitlerle hazırlanan veri, aynı batch üzerinde
+    state'siz (batch istatistikli) hazırlanan veri ile birebir aynı olmalı.
+    """
+    df_raw = _load_raw()
+    state = fit_preprocessing(df_raw)
+
+    for key in ["age_median", "income_median", "dependents_median", "high_debt_threshold"]:
+        assert np.isfinite(state[key])
+
+    pdt.assert_frame_equal(
+        prepare_training(df_raw, state=state),
+        prepare_training(df_raw),
+    )
+
+
+def test_fitted_state_makes_rows_independent_of_batch():
+    """
+    State verildiğinde satırları tek tek veya parça parça hazırlamak,
+    tüm batch'i bir seferde hazırlamakla aynı sonucu vermeli.
+    """
+    df_raw = _load_raw()
+    state = fit_preprocessing(df_raw)
+
+    full = prepare_training(df_raw, state=state)
+
+    rows = pd.concat(
+        [prepare_training(df_raw.iloc[[i]], state=state) for i in range(20)]
+    )
+    pdt.assert_frame_equal(rows, full.iloc[:20])
+
+    chunks = pd.concat(
+        [prepare_training(df_raw.iloc[i:i + 97], state=state) for i in range(0, len(df_raw), 97)]
+    )
+    pdt.assert_frame_equal(chunks, full)
+
+
+def test_single_row_with_missing_income_uses_fitted_median():
+    """
+    Tek satırda MonthlyIncome eksikse eğitim medyanı ile doldurulmalı.
+    """
+    df_raw = _load_raw()
+    state = fit_preprocessing(df_raw)
+
+    row = df_raw[df_raw["MonthlyIncome"].isna()].head(1)
+    prepared = prepare_training(row, state=state)
+
+    assert prepared["MonthlyIncome"].iloc[0] == state["income_median"]
+
+
+def test_live_package_state_none_reproduces_baseline():
+    """
+    Commit'lenmiş model paketi (yeniden eğitim / validasyon olmadan) state
+    taşımamalı; state=None yolu eğitimdeki batch istatistikleriyle baseline
+    skorlarını birebir üretmeli.
+    """
+    assert get_preprocessing_state() is None
+
+    df_raw = _load_raw()
+    package = joblib.load(FINAL_MODEL)
+    prepared = prepare_training(df_raw)
+    X = prepared.drop(columns=["SeriousDlqin2yrs"], errors="ignore")
+    expected = package["model"].predict_proba(X)[:, 1]
+
+    _, proba = predict_from_raw(df_raw)
+
+    np.testing.assert_array_equal(proba, expected)
+
+
+def test_attach_state_writes_package(tmp_path):
+    model_path = tmp_path / "model.pkl"
+    package = joblib.load(FINAL_MODEL)
+    package.pop(PREPROCESSING_STATE_KEY, None)
+    joblib.dump(package, model_path)
+
+    raw_path = DATA_DIR / "test_portfolio_mixed.csv"
+    state = attach_state_pipeline(input_path=raw_path, model_path=model_path)
+
+    assert state == fit_preprocessing(_load_raw())
+    assert joblib.load(model_path)[PREPROCESSING_STATE_KEY] == state
@@ -0,0 +1,81 @@
+# tests/test_profiling.py
+
+import numpy as np
+import pandas as pd
+from fastapi.testclient import TestClient
+
+import src.profiling as profiling
+from app.api import app
+from src.config import DATA_DIR
+from src.data_preprocessing import prepare_training
+from src.inference import predict_from_raw
+from src.payloads import columns_from_frame
+from src.profiling import ProfileReport, profile, stage
+
+PIPELINE_STAGES = [
+    "clean_basic",
+    "add_core_numeric_features",
+    "add_delinquency_features",
+    "add_risk_flags",
+    "add_binning_features",
+    "add_interaction_features",
+    "add_domain_features",
+]
+
+
+def _raw() -> pd.DataFrame:
+    return pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv")
+
+
+def test_profile_records_each_stage_for_fused_and_sequential_paths():
+    df = _raw()
+    expected = predict_from_raw(df)
+
+    with profile() as fused:
+        y_pred, y_proba = predict_from_raw(df)
+    with profile() as sequential:
+        prepare_training(df)
+
+    np.testing.assert_array_equal(y_proba, expected[1])
+    for report in (fused, sequential):
+        stages = {s["stage"]: s for s in report.summary()}
+        for name in PIPELINE_STAGES + ["prepare_training"]:
+            assert stages[name]["calls"] >= 1
+            assert stages[name]["rows"] == len(df) * stages[name]["calls"]
+        assert stages["prepare_training"]["wall_ms"] > 0
+
+    fused_stages = {s["stage"] for s in fused.summary()}
+    assert {"model.predict_proba", "predict_from_df"} <= fused_stages
+    assert "apply_feature_selection" in {s["stage"] for s in sequential.summary()}
+
+    # Blok dışında kayıt tutulmaz
+    n_records = len(fused.records)
+    predict_from_raw(df)
+    assert len(fused.records) == n_records
+
+
+def test_profiling_is_a_no_op_when_disabled():
+    assert not profiling.is_enabled()
+    assert stage("x", 10) is stage("y")
+
+    report = ProfileReport()
+    with stage("clean_basic", 5):
+        pass
+    assert report.records == [] and profiling.GLOBAL_REPORT.records == []
+
+
+def test_profile_endpoint_reports_stages_when_env_enabled(monkeypatch):
+    monkeypatch.setattr(profiling, "_ENV_ENABLED", True)
+    monkeypatch.setattr(profiling, "_enabled", True)
+    df = _raw()
+
+    with TestClient(app) as client:
+        client.delete("/profile")
+        assert client.post("/predict", json={"columns": columns_from_frame(df)}).status_code == 200
+        report = client.get("/profile?raw=true").json()
+        client.delete("/profile")
+
+    assert report["enabled"] is True
+    stages = {s["stage"] for s in report["stages"]}
+    assert {"prepare_training", "add_binning_features", "model.predict_proba"} <= stages
+    assert report["records"] and "mem_delta_mb" in report["records"][0]
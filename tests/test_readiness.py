@@ -0,0 +1,49 @@
+# tests/test_readiness.py
+
+import time
+
+from fastapi.testclient import TestClient
+
+import app.api as api
+from src.feature_registry import DELINQ_COLS, RAW_FEATURE_COLS
+from src.warmup import synthetic_batch, warmup
+
+
+def test_synthetic_warmup_batch_covers_cleaning_branches():
+    df = synthetic_batch(2000)
+
+    assert list(df.columns) == RAW_FEATURE_COLS
+    assert df["MonthlyIncome"].isna().any()
+    assert df["NumberOfDependents"].isna().any()
+    assert (df["age"] == 0).any()
+    assert df[DELINQ_COLS].isin([96, 98]).any().all()
+
+    timings = warmup(batch_sizes=(1, 8))
+    assert set(timings) == {"model_load", "scorer_build", "batch_1", "batch_8", "total"}
+
+
+def test_ready_flips_after_warmup_and_is_reported_on_metrics():
+    with TestClient(api.app) as client:
+        deadline = time.monotonic() + 60
+        while (response := client.get("/ready")).status_code == 503 and time.monotonic() < deadline:
+            assert response.json()["status"] == "warming_up"
+            time.sleep(0.05)
+        health = client.get("/health")
+        metrics = client.get("/metrics").text
+
+    assert health.status_code == 200
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+    assert {"model_load", "batch_1", "total"} <= set(response.json()["warmup_ms"])
+    assert "credit_risk_ready 1" in metrics
+    assert 'credit_risk_cold_start_seconds{phase="total"}' in metrics
+
+
+def test_ready_is_503_until_warmup_finishes(monkeypatch):
+    monkeypatch.setitem(api.readiness, "ready", False)
+    monkeypatch.setitem(api.readiness, "error", None)
+
+    response = TestClient(api.app).get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "warming_up"
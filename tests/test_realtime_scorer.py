@@ -0,0 +1,123 @@
+# tests/test_realtime_scorer.py
+
+import copy
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import FunctionTransformer, StandardScaler
+
+from src.config import DATA_DIR
+from src.data_preprocessing import PREPROCESSING_STATE_KEY, fit_preprocessing, prepare_training
+from src.inference import predict_from_raw
+from src.predict import get_model_registry
+from src.scorer import CompiledScorer, get_compiled_scorer
+
+
+def _records(df: pd.DataFrame) -> list:
+    """JSON'daki gibi: NaN'lar None olarak gelir."""
+    return [
+        {k: (None if isinstance(v, float) and np.isnan(v) else v) for k, v in rec.items()}
+        for rec in df.to_dict("records")
+    ]
+
+
+def _edge_df() -> pd.DataFrame:
+    df = pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv").head(60).reset_index(drop=True)
+    df.loc[0, "age"] = 0
+    df.loc[1, "MonthlyIncome"] = 0
+    df.loc[2, "MonthlyIncome"] = np.nan
+    df.loc[3, "NumberOfTimes90DaysLate"] = 98
+    df.loc[4, "NumberOfDependents"] = np.nan
+    df.loc[5, "DebtRatio"] = np.nan
+    return df
+
+
+def test_single_record_matches_predict_from_raw():
+    """
+    Hızlı yol, her tek kayıt için predict_from_raw ile birebir aynı
+    olasılık ve etiketi üretmeli.
+    """
+    scorer = get_compiled_scorer()
+    assert scorer is not None
+
+    df = _edge_df()
+    for i, record in enumerate(_records(df)):
+        label, proba = scorer.predict_record(record)
+        y_pred, y_proba = predict_from_raw(df.iloc[[i]], engine="sklearn")
+        assert proba == float(y_proba[0])
+        assert label == int(y_pred[0])
+
+
+def test_single_record_with_fitted_state_matches_pipeline():
+    """
+    Pakette preprocessing state varsa hızlı yol onu kullanmalı ve
+    prepare_training(state) + sklearn pipeline ile aynı sonucu vermeli.
+    """
+    package = dict(get_model_registry().get())
+    df_raw = pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv")
+    package[PREPROCESSING_STATE_KEY] = fit_preprocessing(df_raw)
+    scorer = CompiledScorer.from_package(package)
+
+    df = _edge_df()
+    X = prepare_training(df, state=package[PREPROCESSING_STATE_KEY])
+    expected = package["model"].predict_proba(X)[:, 1]
+
+    probas = [scorer.predict_record(rec)[1] for rec in _records(df)]
+    np.testing.assert_array_equal(np.array(probas, dtype=expected.dtype), expected)
+
+
+def test_compiled_scorer_is_cached_per_package():
+    """
+    Scorer model paketi başına bir kez derlenmeli.
+    """
+    assert get_compiled_scorer() is get_compiled_scorer()
+
+
+def test_partial_record_uses_registry_fallbacks():
+    """
+    Gecikme kolonları eksik kayıt predict_from_raw gibi skorlanmalı;
+    model için zorunlu bir kolon eksikse iki yol da KeyError vermeli.
+    """
+    scorer = get_compiled_scorer()
+    df = _edge_df().drop(columns=["NumberOfTime60-89DaysPastDueNotWorse", "NumberOfTimes90DaysLate"])
+
+    for i, record in enumerate(_records(df.head(10))):
+        _, proba = scorer.predict_record(record)
+        assert proba == float(predict_from_raw(df.iloc[[i]], engine="sklearn")[1][0])
+
+    record = _records(df.head(1))[0]
+    del record["age"]
+    with pytest.raises(KeyError):
+        scorer.predict_record(record)
+    with pytest.raises(KeyError):
+        predict_from_raw(df.head(1).drop(columns=["age"]))
+
+
+@pytest.mark.parametrize(
+    "num_trans, accepted",
+    [
+        ("passthrough", True),
+        (FunctionTransformer(), True),
+        (FunctionTransformer(np.log1p), False),
+        (StandardScaler(), False),
+    ],
+)
+def test_numeric_transformer_must_be_identity(num_trans, accepted):
+    """
+    Sayısal kolonlara gerçek bir dönüşüm uygulayan paketler derlenmemeli.
+    """
+    package = dict(get_model_registry().get())
+    model = copy.deepcopy(package["model"])
+    preprocess = model.named_steps["preprocess"]
+    preprocess.transformers_ = [
+        (name, num_trans if name == "num" else trans, cols)
+        for name, trans, cols in preprocess.transformers_
+    ]
+    package["model"] = model
+
+    if accepted:
+        assert CompiledScorer.from_package(package).numeric_cols
+    else:
+        with pytest.raises(ValueError):
+            CompiledScorer.from_package(package)
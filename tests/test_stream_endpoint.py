@@ -0,0 +1,100 @@
+# tests/test_stream_endpoint.py
+
+import json
+
+import numpy as np
+import pandas as pd
+from fastapi.testclient import TestClient
+
+from app.api import app
+from src import inference
+from src.config import DATA_DIR
+from src.inference import iter_predict_raw, predict_from_raw
+from src.payloads import columns_from_frame
+
+
+def test_ndjson_stream_matches_predict():
+    df = pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv")
+    body = {"columns": columns_from_frame(df)}
+
+    with TestClient(app) as client:
+        expected = client.post("/predict", json=body).json()
+        with client.stream("POST", "/predict/stream?chunk_size=120", json=body) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("application/x-ndjson")
+            lines = [json.loads(line) for line in response.iter_lines() if line]
+
+    *chunks, summary = lines
+    assert [c["offset"] for c in chunks] == list(range(0, len(df), 120))
+    assert summary["done"] is True
+    assert summary["n_records"] == len(df)
+    assert summary["n_chunks"] == len(chunks)
+    assert sum((c["predictions"] for c in chunks), []) == expected["predictions"]
+    assert sum((c["probabilities"] for c in chunks), []) == expected["probabilities"]
+
+
+def test_stream_rejects_bad_requests_before_streaming():
+    with TestClient(app) as client:
+        missing = client.post("/predict/stream", json={"records": [{"age": 40}, {"age": 50}]})
+        bad_chunk = client.post("/predict/stream?chunk_size=0", json={"records": [{"age": 40}]})
+        empty = client.post("/predict/stream", json={"records": []})
+
+    assert missing.status_code == 400
+    assert bad_chunk.status_code == 422
+    assert empty.status_code == 400
+
+
+def test_record_stream_builds_chunk_frames_and_fits_state_once(monkeypatch):
+    """
+    Kayıt listesi parça parça DataFrame'e çevrilmeli (tüm istek tek tabloya
+    dönüşmemeli); state yoksa tüm istek üzerinden bir kez fit edilmeli.
+    """
+    monkeypatch.setattr(inference, "get_preprocessing_state", lambda: None)
+    df = pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv").head(100)
+    records = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+    # Son parçada hiçbir kayıtta olmayan kolon NaN olmalı (tüm tablo gibi)
+    for rec in records[98:]:
+        del rec["MonthlyIncome"]
+
+    sizes = []
+    real_frame_from_records = inference.frame_from_records
+
+    def spy(chunk_records):
+        sizes.append(len(chunk_records))
+        return real_frame_from_records(chunk_records)
+
+    monkeypatch.setattr(inference, "frame_from_records", spy)
+    probabilities = sum(
+        (y_proba.tolist() for _, _, y_proba in iter_predict_raw(records, chunk_size=7)), []
+    )
+
+    assert max(sizes) == 7
+    expected = df.copy()
+    expected.loc[98:, "MonthlyIncome"] = np.nan
+    assert probabilities == predict_from_raw(expected)[1].tolist()
+
+
+def test_stream_reports_mid_stream_errors(monkeypatch):
+    """
+    İlk parçadan sonraki bir hata akışı sessizce kesmemeli: son satır
+    özet yerine bir hata satırı olmalı.
+    """
+    real_predict_from_df = inference.predict_from_df
+
+    def flaky(prepared, engine="auto"):
+        if prepared.index[0] == 10:
+            raise RuntimeError("model hatası")
+        return real_predict_from_df(prepared, engine=engine)
+
+    df = pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv").head(30)
+    body = {"columns": columns_from_frame(df)}
+    monkeypatch.setattr(inference, "predict_from_df", flaky)
+
+    with TestClient(app) as client:
+        with client.stream("POST", "/predict/stream?chunk_size=10", json=body) as response:
+            assert response.status_code == 200
+            lines = [json.loads(line) for line in response.iter_lines() if line]
+
+    first, error = lines
+    assert first["offset"] == 0
+    assert error == {"done": False, "error": "model hatası", "offset": 10, "n_records": 10}
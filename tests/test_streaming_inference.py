@@ -0,0 +1,61 @@
+# tests/test_streaming_inference.py
+
+import pandas as pd
+import pandas.testing as pdt
+
+from src import inference, pipeline
+from src.config import DATA_DIR
+from src.data_preprocessing import fit_preprocessing, prepare_training
+from src.pipeline import inference_pipeline, stream_inference_pipeline
+
+
+def test_streaming_matches_full_inference_on_prepared_data(tmp_path):
+    """
+    Parça parça skorlama, tüm dosyayı bir seferde skorlamakla aynı
+    çıktı dosyasını üretmeli (hazır feature tablosu).
+    """
+    df_raw = pd.read_csv(DATA_DIR / "test_portfolio_mixed.csv")
+    input_path = tmp_path / "prepared.csv"
+    prepare_training(df_raw).to_csv(input_path, index=False)
+
+    full_path = tmp_path / "full.csv"
+    stream_path = tmp_path / "stream.csv"
+    inference_pipeline(input_path, full_path)
+    summary = stream_inference_pipeline(input_path, stream_path, chunksize=97)
+
+    assert summary["n_rows"] == len(df_raw)
+    assert summary["n_chunks"] == -(-len(df_raw) // 97)
+    pdt.assert_frame_equal(pd.read_csv(stream_path), pd.read_csv(full_path))
+
+
+def test_streaming_raw_with_fitted_state_is_chunk_independent(tmp_path, monkeypatch):
+    """
+    Ham veride fit edilmiş state varsa sonuç parça boyutundan bağımsız olmalı.
+    """
+    input_path = DATA_DIR / "test_portfolio_stressed.csv"
+    state = fit_preprocessing(pd.read_csv(input_path))
+    monkeypatch.setattr(inference, "get_preprocessing_state", lambda: state)
+
+    out_small = tmp_path / "small.csv"
+    out_large = tmp_path / "large.csv"
+    stream_inference_pipeline(input_path, out_small, chunksize=50, raw=True)
+    stream_inference_pipeline(input_path, out_large, chunksize=10_000, raw=True)
+
+    pdt.assert_frame_equal(pd.read_csv(out_small), pd.read_csv(out_large))
+
+
+def test_streaming_raw_without_package_state_matches_full_inference(tmp_path, monkeypatch):
+    """
+    Pakette state olmasa da streaming, state'i dosyanın tamamından bir kez
+    fit etmeli: küçük parçalarla sonuç inference_pipeline(raw=True) ile aynı.
+    """
+    monkeypatch.setattr(inference, "get_preprocessing_state", lambda: None)
+    monkeypatch.setattr(pipeline, "get_preprocessing_state", lambda: None)
+    input_path = DATA_DIR / "test_portfolio_mixed.csv"
+
+    full_path = tmp_path / "full.csv"
+    stream_path = tmp_path / "stream.csv"
+    inference_pipeline(input_path, full_path, raw=True)
+    stream_inference_pipeline(input_path, stream_path, chunksize=7, raw=True)
+
+    pdt.assert_frame_equal(pd.read_csv(stream_path), pd.read_csv(full_path))
@@ -0,0 +1,54 @@
+# tests/test_synthetic.py
+
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from src.data_io import read_table
+from src.feature_registry import DELINQ_COLS, RAW_FEATURE_COLS
+from src.inference import predict_from_raw
+from src.pipeline import stream_inference_pipeline
+from src.synthetic import TARGET_COL, generate, iter_synthetic, write_synthetic
+
+
+def test_generator_is_seeded_and_chunk_size_independent():
+    full = generate(150_000, seed=7)
+    chunks = list(iter_synthetic(150_000, chunk_size=40_000, seed=7))
+
+    assert [len(c) for c in chunks] == [40_000, 40_000, 40_000, 30_000]
+    pdt.assert_frame_equal(pd.concat(chunks), full)
+    assert not generate(1_000, seed=8).equals(full.head(1_000))
+
+
+def test_generator_covers_kaggle_edge_cases():
+    df = generate(300_000, seed=1, target=True)
+
+    assert list(df.columns) == [TARGET_COL] + RAW_FEATURE_COLS
+    assert df["MonthlyIncome"].isna().mean() == pytest.approx(0.198, abs=0.01)
+    assert df["NumberOfDependents"].isna().any()
+    assert (df["age"] == 0).any()
+    # Sentinel'ler üç gecikme kolonunda birlikte görülür
+    sentinel = df[DELINQ_COLS].isin([96, 98])
+    assert sentinel.any().all()
+    assert (sentinel.all(axis=1) == sentinel.any(axis=1)).all()
+
+
+def test_risk_mixes_are_ordered_by_model_score():
+    means = [predict_from_raw(generate(5_000, mix=mix))[1].mean() for mix in ["low", "mixed", "stressed"]]
+    assert means == sorted(means)
+
+    with pytest.raises(ValueError):
+        generate(10, mix="unknown")
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_write_synthetic_streams_to_file(tmp_path, suffix):
+    path = tmp_path / f"raw{suffix}"
+    summary = write_synthetic(path, 25_000, chunk_size=10_000, mix="stressed", seed=3)
+
+    assert summary["n_rows"] == 25_000
+    assert summary["n_chunks"] == 3
+    pdt.assert_frame_equal(read_table(path), generate(25_000, mix="stressed", seed=3).reset_index(drop=True))
+
+    scored = stream_inference_pipeline(path, tmp_path / f"scores{suffix}", chunksize=8_000, raw=True)
+    assert scored["n_rows"] == 25_000